@@ -0,0 +1,293 @@
+"""Benchmark harness: ``python -m pytest benchmarks`` (run from PROJECT).
+
+The ``benchmark`` fixture follows pytest-benchmark's calling convention
+(``benchmark(fn, *args)``, ``benchmark.pedantic(...)``, ``benchmark.extra_info``)
+but has no dependency, and it compares every result with ``baseline.json``.
+
+Timings are compared in units of a fixed pure-Python calibration loop measured
+right around each benchmark, which cancels most of the machine-speed drift
+between runs and between hosts. The fastest round is used (the least noisy statistic on a
+shared machine); one slower than ``baseline * (1 + threshold)`` fails the
+session. The baseline's ``thresholds`` map gives noisy benchmarks (process start-up,
+pools) their own allowance; every other one uses the default. ``--bench-save``
+rewrites the baseline from the current run and keeps that map.
+"""
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import pytest
+
+from shinon_os.persistence.base import open_repository
+from shinon_os.sim.batch import ScriptedAction
+from shinon_os.sim.engine import EMERGENCY_POLICY_IDS, SimulationEngine
+from shinon_os.sim.synthetic import generate_pack
+from shinon_os.sim.worldgen import DataBundle, load_data
+from shinon_os.util.logging_setup import NullLogger
+
+BASELINE = Path(__file__).with_name("baseline.json")
+# Calibrated min-round timings rarely drift more than this; noisy benchmarks get an entry in
+# the baseline's "thresholds" instead of a looser default.
+DEFAULT_THRESHOLD = 0.2
+COMPARE_STAT = "min"
+BENCH_SEED = 42
+# Enough money that no scripted action is rejected for cost.
+BENCH_TREASURY = 10**12
+
+
+class BenchmarkFixture:
+    def __init__(self, name: str, min_rounds: int = 5, max_time: float = 0.5) -> None:
+        self.name = name
+        self.min_rounds = min_rounds
+        self.max_time = max_time
+        self.extra_info: dict[str, Any] = {}
+        self.samples: list[float] = []
+
+    def __call__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Time ``fn`` for at least ``min_rounds`` rounds and until ``max_time`` is spent."""
+        result = fn(*args, **kwargs)  # warm-up, not recorded
+        iterations = 1
+        start = time.perf_counter()
+        fn(*args, **kwargs)
+        single = time.perf_counter() - start
+        if single < 1e-4:
+            iterations = max(1, int(1e-4 / max(single, 1e-9)))
+        deadline = time.perf_counter() + self.max_time
+        while len(self.samples) < self.min_rounds or time.perf_counter() < deadline:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                result = fn(*args, **kwargs)
+            self.samples.append((time.perf_counter() - start) / iterations)
+            if len(self.samples) >= 1000:
+                break
+        return result
+
+    def pedantic(
+        self,
+        fn: Callable[..., Any],
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+        setup: Callable[[], tuple[tuple[Any, ...], dict[str, Any]] | None] | None = None,
+        rounds: int = 1,
+        iterations: int = 1,
+        warmup_rounds: int = 0,
+    ) -> Any:
+        """Exactly ``rounds`` timed rounds; ``setup`` runs untimed before each one."""
+        if setup is not None and iterations != 1:
+            raise ValueError("setup requires iterations=1")
+        result = None
+        for index in range(warmup_rounds + rounds):
+            call_args, call_kwargs = args, kwargs or {}
+            if setup is not None:
+                prepared = setup()
+                if prepared is not None:
+                    call_args, call_kwargs = prepared
+            start = time.perf_counter()
+            for _ in range(iterations):
+                result = fn(*call_args, **call_kwargs)
+            if index >= warmup_rounds:
+                self.samples.append((time.perf_counter() - start) / iterations)
+        return result
+
+    @property
+    def stats(self) -> dict[str, float]:
+        if not self.samples:
+            return {}
+        median = statistics.median(self.samples)
+        return {
+            "rounds": len(self.samples),
+            "min": min(self.samples),
+            "max": max(self.samples),
+            "mean": statistics.fmean(self.samples),
+            "median": median,
+            "stddev": statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0,
+            "ops": 1.0 / median if median > 0 else 0.0,
+        }
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("shinon-bench")
+    group.addoption("--bench-baseline", type=Path, default=BASELINE, help="Baseline JSON to compare against")
+    group.addoption("--bench-save", action="store_true", help="Write this run's results as the new baseline")
+    group.addoption("--bench-json", type=Path, default=None, help="Also write this run's results to a file")
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=None,
+        help=(
+            f"Default allowed slowdown of the fastest round as a fraction (baseline file value, else "
+            f"{DEFAULT_THRESHOLD}); per-benchmark thresholds in the baseline still apply"
+        ),
+    )
+
+
+def calibrate(rounds: int = 5) -> float:
+    """Fastest of ``rounds`` runs of a fixed interpreter-bound workload, in seconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        table: dict[int, float] = {}
+        total = 0.0
+        for index in range(60_000):
+            table[index & 1023] = total
+            total += (index % 7) * 0.5 + table.get(index & 511, 0.0) * 1e-9
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config._bench_results = {}
+    config._bench_report = None
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> Iterator[BenchmarkFixture]:
+    bench = BenchmarkFixture(request.node.name)
+    before = calibrate()
+    yield bench
+    if bench.samples:
+        request.config._bench_results[bench.name] = {
+            "stats": bench.stats,
+            "extra_info": bench.extra_info,
+            "calibration": min(before, calibrate()),
+        }
+
+
+@pytest.fixture(scope="session")
+def bench_bundle() -> DataBundle:
+    return load_data(config_overrides={"world.treasury": BENCH_TREASURY})
+
+
+@pytest.fixture(scope="session")
+def bench_pack_bundle(tmp_path_factory: pytest.TempPathFactory) -> DataBundle:
+    """The shipped pack extended to 1000 goods and 60 sectors (see ``sim.synthetic``)."""
+    root = generate_pack(tmp_path_factory.mktemp("pack") / "pack", goods=1000, sectors=60, seed=BENCH_SEED)
+    return load_data(data_dir=root, config_overrides={"world.treasury": BENCH_TREASURY})
+
+
+@pytest.fixture(scope="session")
+def scripted_actions(bench_bundle: DataBundle) -> Callable[[int], list[ScriptedAction]]:
+    """``scripted_actions(n)``: round-robin over every non-emergency policy, each back after its cooldown."""
+    targets = {"sector": "agriculture", "good": "grain"}
+    policy_ids = sorted(pid for pid in bench_bundle.policies if pid not in EMERGENCY_POLICY_IDS)
+
+    def build(turns: int) -> list[ScriptedAction]:
+        return [
+            ScriptedAction(pid, None, targets.get(bench_bundle.policies[pid].target_type))
+            for pid in (policy_ids[index % len(policy_ids)] for index in range(turns))
+        ]
+
+    return build
+
+
+@pytest.fixture
+def new_engine(bench_bundle: DataBundle, tmp_path: Path) -> Iterator[Callable[[str], SimulationEngine]]:
+    """Factory for a fresh seeded game with every policy unlocked, on ``"memory"`` or ``"sqlite"``."""
+    repos: list[Any] = []
+
+    def make(backend: str = "memory") -> SimulationEngine:
+        repo = open_repository(tmp_path / f"bench-{len(repos)}.sqlite3", backend)
+        repos.append(repo)
+        engine = SimulationEngine(bundle=bench_bundle, repo=repo, logger=NullLogger())
+        engine.new_game(seed=BENCH_SEED)
+        repo.replace_unlocked_policies(set(bench_bundle.policies), 0)
+        engine.invalidate()
+        return engine
+
+    yield make
+    for repo in repos:
+        repo.close()
+
+
+def _read_baseline(path: Path) -> dict[str, Any]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[dict[str, Any]]:
+    """One row per benchmark; ``status`` is ok, regressed, improved or new."""
+    rows: list[dict[str, Any]] = []
+    known = baseline.get("benchmarks", {})
+    overrides = baseline.get("thresholds", {})
+    for name, entry in sorted(results.items()):
+        value = entry["stats"][COMPARE_STAT]
+        previous = known.get(name, {})
+        base = previous.get("stats", {}).get(COMPARE_STAT)
+        row = {"name": name, "value": value, "baseline": base, "threshold": float(overrides.get(name, threshold))}
+        if not base:
+            rows.append({**row, "ratio": None, "status": "new"})
+            continue
+        scale = float(previous.get("calibration") or entry["calibration"]) / entry["calibration"]
+        ratio = value * scale / base
+        limit = row["threshold"]
+        status = "regressed" if ratio > 1.0 + limit else "improved" if ratio < 1.0 - limit else "ok"
+        rows.append({**row, "ratio": ratio, "status": status})
+    return rows
+
+
+def _document(results: dict[str, Any], threshold: float, thresholds: dict[str, float] | None = None) -> dict[str, Any]:
+    document = {
+        "threshold": threshold,
+        "python": platform.python_version(),
+        "platform": f"{sys.platform}-{platform.machine()}",
+        "benchmarks": results,
+    }
+    if thresholds:
+        document["thresholds"] = thresholds
+    return document
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    config = session.config
+    results = getattr(config, "_bench_results", {})
+    if not results:
+        return
+    baseline_path: Path = config.getoption("--bench-baseline")
+    baseline = _read_baseline(baseline_path)
+    threshold = config.getoption("--bench-threshold")
+    if threshold is None:
+        threshold = float(baseline.get("threshold", DEFAULT_THRESHOLD))
+    out: Path | None = config.getoption("--bench-json")
+    if out is not None:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(_document(results, threshold), indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    if config.getoption("--bench-save"):
+        if session.testscollected and not session.testsfailed:
+            # Keep entries for benchmarks that were deselected in this run.
+            merged = dict(baseline.get("benchmarks", {}))
+            merged.update(results)
+            baseline_path.write_text(
+                json.dumps(_document(merged, threshold, baseline.get("thresholds")), indent=2, sort_keys=True) + "\n",
+                encoding="utf-8",
+            )
+        config._bench_report = {"saved": str(baseline_path), "rows": compare(results, {}, threshold)}
+        return
+    rows = compare(results, baseline, threshold)
+    config._bench_report = {"threshold": threshold, "rows": rows}
+    if any(row["status"] == "regressed" for row in rows) and exitstatus == 0:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter: Any, exitstatus: int, config: pytest.Config) -> None:
+    report = getattr(config, "_bench_report", None)
+    if not report:
+        return
+    terminalreporter.section("benchmarks")
+    if "saved" in report:
+        terminalreporter.write_line(f"baseline written to {report['saved']}")
+    else:
+        terminalreporter.write_line(f"regression threshold: +{report['threshold']:.0%} on the {COMPARE_STAT} round")
+    for row in report["rows"]:
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        line = f"{row['status']:<9} {row['name']:<52} {row['value'] * 1e3:>10.3f} ms  {ratio}"
+        if "threshold" in report and row["threshold"] != report["threshold"]:
+            line += f"  (allowed +{row['threshold']:.0%})"
+        terminalreporter.write_line(line, red=row["status"] == "regressed", green=row["status"] == "improved")
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pytest
+
+from shinon_os.persistence.memory import InMemoryStateRepository
+from shinon_os.sim.engine import SimulationEngine
+from shinon_os.sim.worldgen import DataBundle
+from shinon_os.util.logging_setup import NullLogger
+
+TURNS = 200
+PACK_TURNS = 50
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_advance_turn_throughput(benchmark, new_engine, scripted_actions, backend: str) -> None:
+    """One transaction per turn through the public advance_turn API."""
+    actions = scripted_actions(TURNS)
+
+    def setup():
+        return (new_engine(backend),), {}
+
+    def play(engine):
+        return [engine.advance_turn(a.policy_id, a.magnitude, a.target) for a in actions]
+
+    results = benchmark.pedantic(play, setup=setup, rounds=7)
+    assert all(result.ok for result in results)
+    benchmark.extra_info["turns"] = TURNS
+    benchmark.extra_info["turns_per_sec"] = TURNS / benchmark.stats["median"]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_advance_turns_batch_throughput(benchmark, new_engine, scripted_actions, backend: str) -> None:
+    """Scripted replay path: the whole script in one transaction."""
+    actions = scripted_actions(TURNS)
+    results = benchmark.pedantic(
+        lambda engine: engine.advance_turns(actions),
+        setup=lambda: ((new_engine(backend),), {}),
+        rounds=7,
+    )
+    assert all(result.ok for result in results)
+    benchmark.extra_info["turns_per_sec"] = TURNS / benchmark.stats["median"]
+
+
+def test_advance_turns_synthetic_pack(benchmark, bench_pack_bundle: DataBundle, scripted_actions) -> None:
+    """Market, events and persistence on a generated pack with 1000 goods and 60 sectors."""
+    actions = scripted_actions(PACK_TURNS)
+
+    def setup():
+        engine = SimulationEngine(bundle=bench_pack_bundle, repo=InMemoryStateRepository(), logger=NullLogger())
+        engine.new_game(seed=42)
+        engine.repo.replace_unlocked_policies(set(bench_pack_bundle.policies), 0)
+        engine.invalidate()
+        return (engine,), {}
+
+    results = benchmark.pedantic(lambda engine: engine.advance_turns(actions), setup=setup, rounds=5)
+    assert all(result.ok for result in results)
+    benchmark.extra_info["turns_per_sec"] = PACK_TURNS / benchmark.stats["median"]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_restore_to_deep_turn(benchmark, new_engine, scripted_actions, backend: str) -> None:
+    """Rewind a 1000-turn game to turn 950: one snapshot plus up to 99 deltas, then truncation."""
+    actions = scripted_actions(1000)
+
+    def setup():
+        engine = new_engine(backend)
+        engine.advance_turns(actions)
+        return (engine,), {}
+
+    state = benchmark.pedantic(lambda engine: engine.restore_to(950), setup=setup, rounds=5)
+    assert state.world.turn == 950
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from shinon_os.app import ShinonApp
+from shinon_os.sim.batch import ScriptedAction
+
+VIEW_COMMANDS = [
+    "dashboard",
+    "market",
+    "policies",
+    "industry",
+    "history",
+    "explain prices",
+    "unlock list",
+    "show goals",
+    "intel",
+]
+
+
+@pytest.fixture(scope="module")
+def played_app(tmp_path_factory: pytest.TempPathFactory):
+    root: Path = tmp_path_factory.mktemp("kernel-bench")
+    app = ShinonApp(db_path=root / "kernel.sqlite3", log_dir=root / "logs", bundle_cache=False)
+    app.start_new_game(seed=42)
+    # Cheap, always-available actions so history and metrics have some depth.
+    app.engine.advance_turns([ScriptedAction("TAX_ADJUST", 0.0, None)] * 20)
+    yield app
+    app.shutdown()
+
+
+@pytest.mark.parametrize("command", VIEW_COMMANDS)
+def test_kernel_view_latency(benchmark, played_app: ShinonApp, command: str) -> None:
+    turn = played_app.current_turn()
+    response = benchmark(played_app.kernel.handle, command)
+    assert response.turn_advanced is False
+    assert played_app.current_turn() == turn
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from shinon_os.sim.economy import simulate_market
+from shinon_os.sim.model import MarketGood, SectorState, WorldState
+
+GOOD_COUNTS = [8, 100, 1000]
+
+
+def _synthetic_market(size: int) -> dict[str, Any]:
+    """A market shaped like the shipped pack: ~3 goods per sector, 2 inputs and 3 outputs each."""
+    goods_meta: dict[str, dict[str, Any]] = {}
+    market: dict[str, MarketGood] = {}
+    ids = [f"g{index:04d}" for index in range(size)]
+    for index, good_id in enumerate(ids):
+        price = 5.0 + (index % 17)
+        goods_meta[good_id] = {"min_price": price * 0.2, "max_price": price * 5.0}
+        market[good_id] = MarketGood(good_id, 100.0 + index % 50, 90.0 + index % 40, price, price)
+    sectors: dict[str, SectorState] = {}
+    for index in range(max(3, size // 3)):
+        sector_id = f"s{index:04d}"
+        sectors[sector_id] = SectorState(
+            sector_id=sector_id,
+            capacity=100.0,
+            efficiency=0.8,
+            upkeep=900.0,
+            inputs={ids[(index * 7 + k) % size]: 0.4 + 0.1 * k for k in range(2)},
+            outputs={ids[(index * 3 + k) % size]: 1.5 + k for k in range(3)},
+        )
+    return {
+        "market": market,
+        "sectors": sectors,
+        "goods_meta": goods_meta,
+        "population_needs": {good_id: 0.001 for good_id in ids[::4]},
+    }
+
+
+@pytest.mark.parametrize("rng_mode", ["compat", "counter"])
+@pytest.mark.parametrize("goods", GOOD_COUNTS)
+def test_simulate_market(benchmark, goods: int, rng_mode: str) -> None:
+    data = _synthetic_market(goods)
+    world = WorldState(1, 50_000, 120_000, 55.0, 60.0, 20.0, 10.0, "")
+    economy = {"k_demand": 0.35, "noise_amplitude": 0.01, "rng_mode": rng_mode}
+    result = benchmark(
+        simulate_market,
+        world=world,
+        market=data["market"],
+        sectors=data["sectors"],
+        goods_meta=data["goods_meta"],
+        economy_cfg=economy,
+        population_needs=data["population_needs"],
+        effects={},
+        seed=42,
+        turn=1,
+    )
+    assert len(result) == goods
+    benchmark.extra_info["goods_per_sec"] = goods / benchmark.stats["median"]
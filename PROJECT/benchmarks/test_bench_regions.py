@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from shinon_os.sim.regions import RegionalWorld, build_regions, ring_routes
+from shinon_os.sim.worldgen import DataBundle
+
+REGIONS = 50
+TURNS = 5
+# Slack for scheduler noise when two timings of the same work are compared.
+NOISE = 1.2
+
+
+def _world(bundle: DataBundle) -> RegionalWorld:
+    regions = build_regions(bundle, REGIONS, seed=42)
+    routes = ring_routes([region.region_id for region in regions], cost_per_unit=0.5, capacity=50.0)
+    return RegionalWorld(bundle, regions, routes, seed=42)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_regional_step(benchmark, bench_bundle: DataBundle, workers: int) -> None:
+    """50 regions on a ring; workers=4 uses the default pool, which only fans out when it pays off."""
+    steps = benchmark.pedantic(
+        lambda world: world.run(TURNS, workers=workers), setup=lambda: ((_world(bench_bundle),), {}), rounds=3
+    )
+    assert steps[-1].turn == TURNS
+    benchmark.extra_info["region_turns_per_sec"] = REGIONS * TURNS / benchmark.stats["median"]
+
+
+def test_regional_step_process_pool(benchmark, bench_bundle: DataBundle) -> None:
+    """Forced process pool: pool start-up, the initializer and one chunk per worker and turn."""
+    steps = benchmark.pedantic(
+        lambda world: world.run(TURNS, workers=4, pool="process"),
+        setup=lambda: ((_world(bench_bundle),), {}),
+        rounds=3,
+    )
+    assert steps[-1].turn == TURNS
+    benchmark.extra_info["region_turns_per_sec"] = REGIONS * TURNS / benchmark.stats["median"]
+
+
+def test_workers_are_not_slower_than_serial(bench_bundle: DataBundle) -> None:
+    workers = min(4, os.cpu_count() or 1)
+    if not _world(bench_bundle)._processes_pay_off(TURNS, workers):
+        # The default pool steps this workload serially; timing it against serial would only time noise.
+        serial, fanned = _world(bench_bundle).run(TURNS), _world(bench_bundle).run(TURNS, workers=4)
+        assert fanned == serial
+        return
+    timings: dict[int, list[float]] = {1: [], 4: []}
+    for _ in range(5):
+        for workers, samples in timings.items():
+            world = _world(bench_bundle)
+            start = time.perf_counter()
+            world.run(TURNS, workers=workers)
+            samples.append(time.perf_counter() - start)
+    assert min(timings[4]) <= min(timings[1]) * NOISE
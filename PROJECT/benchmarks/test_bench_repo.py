@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from shinon_os.persistence.repo import StateRepository
+from shinon_os.sim.worldgen import DataBundle, build_initial_state
+
+HISTORY_SIZES = [0, 1_000, 10_000]
+
+
+def _repo_with_history(bundle: DataBundle, path: Path, turns: int) -> StateRepository:
+    repo = StateRepository(path)
+    state = build_initial_state(bundle)
+    repo.init_new_game(seed=42, state=state)
+    with repo.batch():
+        for turn in range(1, turns + 1):
+            summary = {"inflation": 0.1, "net_cashflow": float(turn % 7 - 3), "events": []}
+            repo.append_history(turn, "TAX_ADJUST", 800, summary)
+            repo.record_metrics(turn, state.world, state.market, 0.1, 0.2, float(turn % 7 - 3), 0)
+    return repo
+
+
+@pytest.mark.parametrize("history", HISTORY_SIZES)
+def test_load_state(benchmark, bench_bundle: DataBundle, tmp_path: Path, history: int) -> None:
+    repo = _repo_with_history(bench_bundle, tmp_path / "load.sqlite3", history)
+    try:
+        state = benchmark(repo.load_state, bench_bundle.sector_io_index)
+        assert len(state.market) == len(bench_bundle.goods)
+    finally:
+        repo.close()
+
+
+@pytest.mark.parametrize("history", HISTORY_SIZES)
+def test_save_state_full_diff(benchmark, bench_bundle: DataBundle, tmp_path: Path, history: int) -> None:
+    """Every world, market and sector row changed since the last save."""
+    repo = _repo_with_history(bench_bundle, tmp_path / "save.sqlite3", history)
+    state = repo.load_state(bench_bundle.sector_io_index)
+
+    def setup():
+        state.world.turn += 1
+        for item in state.market.values():
+            item.price += 0.01
+        for sector in state.sectors.values():
+            sector.efficiency += 0.001
+        return (state,), {}
+
+    def save(current):
+        with repo.batch():
+            repo.save_state(current)
+
+    try:
+        benchmark.pedantic(save, setup=setup, rounds=50)
+        assert repo.load_state(bench_bundle.sector_io_index).world.turn == state.world.turn
+    finally:
+        repo.close()
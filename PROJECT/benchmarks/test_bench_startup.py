@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+CONSTRUCT = (
+    "import sys; from pathlib import Path; from shinon_os.app import ShinonApp; "
+    "ShinonApp(db_path=':memory:', log_dir=Path(sys.argv[1]), bundle_cache=sys.argv[2] == '1').shutdown()"
+)
+
+
+@pytest.mark.parametrize("bundle_cache", [False, True], ids=["parse", "cached"])
+def test_cold_app_startup(benchmark, tmp_path: Path, bundle_cache: bool) -> None:
+    """Fresh interpreter per round: imports, data pack, repository, engine and kernel."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH", "")]))
+    env["SHINON_CACHE_DIR"] = str(tmp_path / "cache")
+    command = [sys.executable, "-c", CONSTRUCT, str(tmp_path / "logs"), "1" if bundle_cache else "0"]
+
+    def start() -> None:
+        subprocess.run(command, env=env, check=True, capture_output=True)
+
+    benchmark.pedantic(start, rounds=5, warmup_rounds=1)
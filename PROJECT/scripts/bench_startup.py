@@ -0,0 +1,102 @@
+"""Cold-start numbers for shinon-os: import cost and ShinonApp construction time.
+
+Every sample runs in a fresh interpreter, so module and bundle caches inside the
+process never help. Prints one JSON object; compare runs before/after a change.
+
+    python scripts/bench_startup.py --runs 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+MODULES = ("shinon_os.app", "shinon_os.app_service", "shinon_os.__main__")
+CONSTRUCT = """
+import sys, time
+from pathlib import Path
+start = time.perf_counter()
+from shinon_os.app import ShinonApp
+app = ShinonApp(db_path=":memory:", log_dir=Path(sys.argv[1]), bundle_cache=sys.argv[2] == "1")
+elapsed = time.perf_counter() - start
+app.shutdown()
+print(elapsed * 1000.0)
+"""
+
+
+def _env(cache_dir: str) -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH", "")]))
+    env["SHINON_CACHE_DIR"] = cache_dir
+    return env
+
+
+def import_time_ms(module: str, env: dict[str, str]) -> tuple[float, list[tuple[str, float]]]:
+    """Cumulative ``-X importtime`` cost of ``module`` and its five heaviest imports."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows: list[tuple[str, float]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        try:
+            rows.append((name.strip(), int(cumulative) / 1000.0))
+        except ValueError:
+            continue
+    total = next((ms for name, ms in rows if name == module), 0.0)
+    heaviest = sorted((row for row in rows if row[0] != module), key=lambda row: row[1], reverse=True)[:5]
+    return total, heaviest
+
+
+def construct_ms(env: dict[str, str], log_dir: str, bundle_cache: bool) -> float:
+    proc = subprocess.run(
+        [sys.executable, "-c", CONSTRUCT, log_dir, "1" if bundle_cache else "0"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+    runs = max(1, args.runs)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = _env(str(Path(tmp) / "cache"))
+        log_dir = str(Path(tmp) / "logs")
+        report: dict[str, object] = {"python": sys.version.split()[0], "runs": runs, "imports": {}}
+        for module in MODULES:
+            samples = [import_time_ms(module, env) for _ in range(runs)]
+            report["imports"][module] = {
+                "median_ms": round(statistics.median(total for total, _ in samples), 2),
+                "heaviest": [[name, round(ms, 2)] for name, ms in samples[-1][1]],
+            }
+        uncached = [construct_ms(env, log_dir, bundle_cache=False) for _ in range(runs)]
+        construct_ms(env, log_dir, bundle_cache=True)  # populate the bundle cache
+        cached = [construct_ms(env, log_dir, bundle_cache=True) for _ in range(runs)]
+        report["construct_ms"] = {
+            "no_bundle_cache": round(statistics.median(uncached), 2),
+            "bundle_cache": round(statistics.median(cached), 2),
+        }
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
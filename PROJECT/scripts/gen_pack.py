@@ -0,0 +1,35 @@
+"""Write a large synthetic data pack for load tests.
+
+The shipped pack is extended with generated goods and sectors; load it with
+``ShinonApp(data_dir=...)`` or ``load_data(data_dir=...)``.
+
+    python scripts/gen_pack.py build/pack-1000 --goods 1000 --sectors 60
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from shinon_os.sim.synthetic import generate_pack  # noqa: E402
+from shinon_os.sim.worldgen import load_data  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dest", type=Path)
+    parser.add_argument("--goods", type=int, default=1000)
+    parser.add_argument("--sectors", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    generate_pack(args.dest, goods=args.goods, sectors=args.sectors, seed=args.seed)
+    bundle = load_data(data_dir=args.dest)
+    print(f"{args.dest}: {len(bundle.goods)} goods, {len(bundle.sectors)} sectors")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
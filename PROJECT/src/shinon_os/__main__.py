@@ -1,18 +1,68 @@
 from __future__ import annotations
 
 import argparse
+import os
+from pathlib import Path
 
-from shinon_os.app import run_app
+from shinon_os.app import run_app, run_simulate
+from shinon_os.sim.sweep import SINK_FORMATS, build_grid, parse_override, parse_seeds, run_sweep
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(prog="shinon_os")
     parser.add_argument("--ui", choices=["textual", "plain"], default=None)
     parser.add_argument("--no-anim", action="store_true", help="Disable boot/idle animations")
     parser.add_argument("--safe-ui", action="store_true", help="Force plain fallback UI")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging for user inputs and system events")
-    args = parser.parse_args()
-    run_app(ui_mode=args.ui, no_anim=args.no_anim, safe_ui=args.safe_ui, debug=args.debug)
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="Record per-phase turn timings and counters; .json writes a Chrome trace, anything else JSONL",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    simulate = subparsers.add_parser("simulate", help="Replay a JSONL action script without UI")
+    simulate.add_argument("--script", type=Path, required=True, help="JSONL file with one action object per line")
+    simulate.add_argument("--db", type=Path, default=None, help="SQLite save file (default: user save)")
+    simulate.add_argument("--log-dir", type=Path, default=None)
+    simulate.add_argument("--seed", type=int, default=None, help="Start a new game with this seed before replaying")
+    simulate.add_argument("--commit-every", type=int, default=1000, help="Turns per transaction (0 = one transaction)")
+
+    sweep = subparsers.add_parser("sweep", help="Run action scripts over many seeds/configs in parallel")
+    sweep.add_argument("--script", type=Path, action="append", required=True, help="JSONL action script (repeatable)")
+    sweep.add_argument("--seeds", default="1-8", help="Seed list/ranges, e.g. 1-64 or 1,5,9")
+    sweep.add_argument(
+        "--override",
+        action="append",
+        default=None,
+        help='Config override set as JSON, e.g. \'{"economy.rng_mode": "counter"}\' (repeatable)',
+    )
+    sweep.add_argument("--out", type=Path, required=True, help="Result file (.jsonl, .csv or .parquet)")
+    sweep.add_argument("--format", choices=SINK_FORMATS, default=None, help="Override the format implied by --out")
+    sweep.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+
+    args = parser.parse_args(argv)
+    if args.command == "sweep":
+        scenarios = build_grid(
+            seeds=parse_seeds(args.seeds),
+            scripts=args.script,
+            overrides=[parse_override(raw) for raw in args.override] if args.override else None,
+        )
+        run_sweep(scenarios, out=args.out, workers=args.workers, fmt=args.format)
+        return
+    if args.command == "simulate":
+        run_simulate(
+            script=args.script,
+            db_path=args.db,
+            log_dir=args.log_dir,
+            seed=args.seed,
+            commit_every=args.commit_every,
+            profile=args.profile,
+        )
+        return
+    run_app(ui_mode=args.ui, no_anim=args.no_anim, safe_ui=args.safe_ui, debug=args.debug, profile=args.profile)
 
 
 if __name__ == "__main__":
@@ -1,27 +1,50 @@
 from __future__ import annotations
 
+import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Callable
 
 from shinon_os.core.kernel import ShinonKernel
 from shinon_os.core.types import BootSequenceModel, KernelResponse
-from shinon_os.i18n import set_lang
-from shinon_os.persistence.repo import StateRepository
+from shinon_os.i18n import preload, set_lang
+from shinon_os.persistence.base import open_repository, resolve_backend
+from shinon_os.sim.batch import iter_script
 from shinon_os.sim.engine import SimulationEngine
 from shinon_os.sim.worldgen import DataBundle, load_data
 from shinon_os.util.logging_setup import JsonlRotatingLogger
-from shinon_os.util.paths import default_db_path, default_log_dir
+from shinon_os.util.paths import default_cache_dir, default_db_path, default_log_dir
+from shinon_os.util.profiling import TurnProfiler
 
 
 class ShinonApp:
-    def __init__(self, db_path: Path | None = None, data_dir: Path | None = None, log_dir: Path | None = None) -> None:
-        self.db_path = db_path or default_db_path()
-        self.bundle: DataBundle = load_data(data_dir=data_dir)
-        self.logger = JsonlRotatingLogger(log_dir or default_log_dir())
-        self.repo = StateRepository(self.db_path)
-        set_lang(self.repo.get_language())
-        self.engine = SimulationEngine(bundle=self.bundle, repo=self.repo, logger=self.logger)
-        self.kernel = ShinonKernel(engine=self.engine, logger=self.logger)
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        data_dir: Path | None = None,
+        log_dir: Path | None = None,
+        backend: str | None = None,
+        log_level: str = "info",
+        bundle_cache: bool = True,
+        profile: Path | None = None,
+        defer_boot: bool = False,
+    ) -> None:
+        """``db_path=":memory:"`` or ``backend="memory"`` runs on the dict store; nothing is saved.
+
+        ``bundle_cache`` reuses the validated data pack from ``default_cache_dir()``
+        (``SHINON_CACHE_DIR`` overrides the location). With ``profile`` every turn's
+        phase timings are recorded and written there on shutdown (``.json`` = Chrome trace).
+        With ``defer_boot`` the data pack load and the DB open/migration wait for
+        :meth:`run_boot_sequence`, so a UI can report them stage by stage.
+        """
+        self.backend = resolve_backend(db_path, backend)
+        self.db_path = Path(db_path) if db_path is not None else default_db_path()
+        self.data_dir = data_dir
+        self.bundle_cache = bundle_cache
+        self.profile_path = profile
+        self.logger = JsonlRotatingLogger(log_dir or default_log_dir(), level=log_level)
         self._boot_model = BootSequenceModel(
             stages=[
                 "Kernel init",
@@ -32,6 +55,41 @@ class ShinonApp:
             durations_ms=[650, 650, 700, 700],
             status="PENDING",
         )
+        if defer_boot:
+            return
+        try:
+            # The data pack is parsed on a worker while the DB is opened and migrated here;
+            # SQLite connections must stay on the thread that created them.
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="shinon-boot") as pool:
+                bundle_future = pool.submit(self._load_bundle)
+                self._mount_db()
+                bundle_future.result()
+            self._start_subsystems()
+        except BaseException:
+            if hasattr(self, "repo"):
+                self.repo.close()
+            self.logger.close()
+            raise
+
+    def _load_bundle(self) -> None:
+        if not hasattr(self, "bundle"):
+            self.bundle: DataBundle = load_data(
+                data_dir=self.data_dir,
+                cache_dir=default_cache_dir() if self.bundle_cache else None,
+            )
+
+    def _mount_db(self) -> None:
+        """Open the save (running pending migrations) and switch to its language."""
+        if not hasattr(self, "repo"):
+            self.repo = open_repository(self.db_path, self.backend)
+            set_lang(self.repo.get_language())
+
+    def _start_subsystems(self) -> None:
+        if not hasattr(self, "engine"):
+            self.engine = SimulationEngine(bundle=self.bundle, repo=self.repo, logger=self.logger)
+            self.kernel = ShinonKernel(engine=self.engine, logger=self.logger)
+            if self.profile_path is not None:
+                self.engine.enable_profiling()
 
     def has_existing_game(self) -> bool:
         return self.repo.has_game()
@@ -60,25 +118,116 @@ class ShinonApp:
             stages=list(self._boot_model.stages),
             durations_ms=list(self._boot_model.durations_ms),
             status=self._boot_model.status,
+            elapsed_ms=list(self._boot_model.elapsed_ms),
         )
 
-    def run_boot_sequence(self, emit: callable, sleep_fn: callable | None = None) -> None:
+    def _boot_tasks(self) -> list[tuple[Callable[[], object], bool, bool]]:
+        """Work behind each boot stage, by position, as ``(work, on_main, needs_earlier)``.
+
+        ``on_main`` marks work that touches the DB; ``needs_earlier`` makes it wait until
+        every earlier stage is done. The DB mount needs nothing from the pack, so it
+        runs while the kernel stage is still loading it.
+        """
+        return [
+            (self._init_kernel, False, False),
+            (self._mount_db, True, False),
+            (self._check_subsystems, True, True),
+            (self._go_online, True, True),
+        ]
+
+    def _init_kernel(self) -> None:
+        self._load_bundle()
+        preload()
+        for name in ("goods_index", "sector_io_index", "sector_id_set", "price_bounds"):
+            getattr(self.bundle, name)
+
+    def _check_subsystems(self) -> None:
+        self._start_subsystems()
+        if self.repo.has_game():
+            self.engine.load_state()
+
+    def _go_online(self) -> None:
+        self.engine.flush()
+
+    def run_boot_sequence(
+        self,
+        emit: callable,
+        sleep_fn: callable | None = None,
+        run_on_main: Callable[..., float] | None = None,
+    ) -> None:
+        """Run the boot stages and report each one, in order, as its work finishes.
+
+        DB stages run on this thread while the others share a small pool; a DB stage
+        that does not need the earlier stages starts right away, so the pack load and
+        the DB open/migration overlap and the sequence takes as long as the work itself.
+        ``durations_ms`` is only a pacing budget: pass ``sleep_fn`` to pad each stage up
+        to it for a cinematic boot. A caller that boots from a worker thread passes
+        ``run_on_main(fn, *args)`` to run the DB stages on the thread that will keep
+        using the connection.
+        """
         stages = self._boot_model.stages
         durations = self._boot_model.durations_ms
         if len(stages) != len(durations):
             msg = f"Boot sequence config mismatch: stages={len(stages)} durations={len(durations)}"
             self.logger.error({"where": "boot", "msg": msg})
             raise ValueError(msg)
-        sleeper = sleep_fn or time.sleep
+        tasks = self._boot_tasks()[: len(stages)]
         self._boot_model.status = "RUNNING"
-        for stage, duration_ms in zip(stages, durations):
-            emit(f"[BOOT] {stage} ...")
-            sleeper(duration_ms / 1000.0)
+        self._boot_model.elapsed_ms = []
+        finished: dict[int, float] = {}
+
+        def report(until: int, wait: bool) -> None:
+            # Emit stages up to ``until`` in order; without ``wait`` stop at the first one still running.
+            for index in range(len(self._boot_model.elapsed_ms), until):
+                if index not in finished:
+                    if index >= len(tasks):
+                        finished[index] = 0.0
+                    elif wait or pending[index].done():
+                        finished[index] = pending[index].result()
+                    else:
+                        return
+                elapsed_ms, budget_ms = finished[index], durations[index]
+                self._boot_model.elapsed_ms.append(elapsed_ms)
+                emit(f"[BOOT] {stages[index]} ... {elapsed_ms:.0f} ms")
+                if sleep_fn is not None and budget_ms > elapsed_ms:
+                    sleep_fn((budget_ms - elapsed_ms) / 1000.0)
+
+        try:
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="shinon-boot") as pool:
+                pending = {
+                    index: pool.submit(_timed, work)
+                    for index, (work, on_main, _) in enumerate(tasks)
+                    if not on_main
+                }
+                for index, (work, on_main, needs_earlier) in enumerate(tasks):
+                    if not on_main:
+                        continue
+                    report(index, wait=needs_earlier)
+                    finished[index] = run_on_main(_timed, work) if run_on_main else _timed(work)
+                report(len(stages), wait=True)
+        except Exception as exc:
+            self._boot_model.status = "FAILED"
+            self.logger.error({"where": "boot", "stage": len(self._boot_model.elapsed_ms), "error": str(exc)})
+            raise
         self._boot_model.status = "DONE"
         emit("[BOOT] SHINON kernel ready.")
 
     def shutdown(self) -> None:
-        self.repo.close()
+        # A deferred boot may have stopped before the engine or the DB came up.
+        if hasattr(self, "engine"):
+            self.engine.flush()
+            profiler = self.engine.disable_profiling()
+            if profiler is not None and self.profile_path is not None:
+                profiler.export(self.profile_path)
+        if hasattr(self, "repo"):
+            self.repo.close()
+        self.logger.close()
+
+
+def _timed(work: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    work()
+    return (time.perf_counter() - start) * 1000.0
 
 
 def _parse_seed(raw_seed: str) -> int:
@@ -91,13 +240,19 @@ def _parse_seed(raw_seed: str) -> int:
         return 42
 
 
-def run_app(ui_mode: str | None = None, no_anim: bool = False, safe_ui: bool = False, debug: bool = False) -> None:
+def run_app(
+    ui_mode: str | None = None,
+    no_anim: bool = False,
+    safe_ui: bool = False,
+    debug: bool = False,
+    profile: Path | None = None,
+) -> None:
     from shinon_os.app_service import AppOptions, AppService
     from shinon_os.ui.factory import create_ui
 
     if debug:
         print("[SHINON DEBUG MODE] Starting with debug protocol...")
-    service = AppService(AppOptions(ui_mode=ui_mode, no_anim=no_anim, safe_ui=safe_ui, debug=debug))
+    service = AppService(AppOptions(ui_mode=ui_mode, no_anim=no_anim, safe_ui=safe_ui, debug=debug, profile=profile))
     try:
         session = create_ui(service)
         session.run(service)
@@ -105,6 +260,46 @@ def run_app(ui_mode: str | None = None, no_anim: bool = False, safe_ui: bool = F
         service.shutdown()
 
 
+def run_simulate(
+    script: Path,
+    db_path: Path | None = None,
+    log_dir: Path | None = None,
+    seed: int | None = None,
+    commit_every: int = 1000,
+    emit: callable = print,
+    profile: Path | None = None,
+) -> dict[str, object]:
+    """Replay a JSONL action script headlessly, committing once per chunk of ``commit_every`` turns."""
+    app = ShinonApp(db_path=db_path, log_dir=log_dir, profile=profile)
+    try:
+        if seed is not None:
+            app.start_new_game(seed=seed)
+        else:
+            app.load_game()
+        chunk_size = commit_every if commit_every > 0 else None
+        actions = iter_script(script)
+        applied = 0
+        rejected = 0
+        while True:
+            chunk = list(islice(actions, chunk_size)) if chunk_size else list(actions)
+            if not chunk:
+                break
+            for result in app.engine.advance_turns(chunk):
+                if result.ok:
+                    applied += 1
+                else:
+                    rejected += 1
+            if not chunk_size:
+                break
+        report = {"applied": applied, "rejected": rejected, "snapshot": app.snapshot()}
+        if isinstance(app.engine.profiler, TurnProfiler):
+            report["profile"] = app.engine.profiler.summary()
+        emit(json.dumps(report, ensure_ascii=True, sort_keys=True))
+        return report
+    finally:
+        app.shutdown()
+
+
 def select_profile(app: ShinonApp, ask_input: callable, emit: callable) -> None:
     emit(f"Save location: {app.db_path}")
     if app.has_existing_game():
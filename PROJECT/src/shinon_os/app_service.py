@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import importlib.util
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Callable
 
 from shinon_os.app import ShinonApp
 from shinon_os.core import intents
-from shinon_os.i18n import set_lang, t
+from shinon_os.i18n import get_lang, t
 from shinon_os.view_models import (
     CapabilityRegistry,
     DashboardVM,
@@ -30,45 +32,53 @@ class AppOptions:
     no_anim: bool = False
     safe_ui: bool = False
     debug: bool = False
+    profile: Path | None = None
 
 
 def _textual_available() -> bool:
+    # Only probe for the package; the Textual UI module is imported when a session is created.
     try:
-        from shinon_os.ui.textual_app import textual_available
-
-        return textual_available()
-    except Exception:
+        return importlib.util.find_spec("textual") is not None
+    except (ImportError, ValueError):
         return False
 
 
 class AppService:
     def __init__(self, options: AppOptions, app: ShinonApp | None = None) -> None:
         self.options = options
-        self.app = app or ShinonApp()
+        # The data pack and the DB are loaded by bootstrap(), one boot stage at a time.
+        self.app = app or ShinonApp(profile=options.profile, defer_boot=True)
         self.debug_mode = options.debug
-        set_lang(self.app.repo.get_language())
         self.capabilities = CapabilityRegistry(
             textual_available=_textual_available(),
             animations_enabled=not options.no_anim,
             safe_mode=options.safe_ui,
             palette="oled",
         )
+        # View models for the current (state version, language); views never advance turns,
+        # so repeated renders between turns reuse them.
+        self._vm_key: tuple[int, str] | None = None
+        self._vm_cache: dict[str, object] = {}
         if self.debug_mode:
+            self.app.logger.set_level("debug")
             self.app.logger.debug({"mode": "DEBUG", "msg": "Debug mode enabled", "options": str(options)})
 
     def shutdown(self) -> None:
         self.app.shutdown()
 
-    def bootstrap(self) -> OSResponse:
+    def bootstrap(
+        self,
+        emit: Callable[[str], None] | None = None,
+        run_on_main: Callable[..., float] | None = None,
+    ) -> OSResponse:
+        """Run the boot stages; ``emit`` gets each stage line (default: the debug log).
+
+        ``run_on_main`` is forwarded to :meth:`ShinonApp.run_boot_sequence` for UIs
+        that boot from a worker thread.
+        """
         try:
-            if self.capabilities.animations_enabled:
-                self.app.run_boot_sequence(emit=lambda msg: self.app.logger.debug({"where": "boot", "msg": msg}))
-            else:
-                model = self.app.boot_sequence_model()
-                for stage in model.stages:
-                    self.app.logger.debug({"where": "boot", "msg": f"[BOOT] {stage} ...", "skipped": True})
-                # ensure DONE status
-                self.app.run_boot_sequence(emit=lambda _: None, sleep_fn=lambda _: None)
+            # Boot time is bounded by the stage work; animations only affect how UIs present it.
+            self.app.run_boot_sequence(emit=emit or self._log_boot, run_on_main=run_on_main)
         except Exception as exc:  # pragma: no cover - defensive
             self.app.logger.error({"where": "bootstrap", "error": str(exc)})
             return self._os_error("Subsystem not available")
@@ -84,6 +94,9 @@ class AppService:
             should_quit=False,
         )
 
+    def _log_boot(self, msg: str) -> None:
+        self.app.logger.debug({"where": "boot", "msg": msg})
+
     def get_menu(self) -> MenuModel:
         return MenuModel(
             commands=[
@@ -98,6 +111,7 @@ class AppService:
                 "unlock list",
                 "show goals",
                 "intel",
+                "profile [on|off|reset|export <file>]",
                 "quit",
             ],
             hotkeys=["1..6 views", "?: help", "Ctrl+Q: quit", ":cmd palette"],
@@ -129,6 +143,27 @@ class AppService:
             },
         )
 
+    def _cached_vm(self, view: str, build: Callable[[], object]) -> object:
+        key = (self.app.engine.state_version, get_lang())
+        if key != self._vm_key:
+            self._vm_cache.clear()
+            self._vm_key = key
+        vm = self._vm_cache.get(view)
+        if vm is None:
+            vm = build()
+            self._vm_cache[view] = vm
+        return vm
+
+    def _state_view_model(self, view: str) -> object:
+        builders: dict[str, Callable[[], object]] = {
+            "dashboard": self._dashboard_vm,
+            "market": self._market_vm,
+            "policies": self._policies_vm,
+            "industry": self._industry_vm,
+            "history": self._history_vm,
+        }
+        return self._cached_vm(view, builders[view])
+
     def _dashboard_vm(self) -> DashboardVM:
         state = self.app.engine.load_state()
         shortages = [good_id for good_id, row in state.market.items() if row.supply < row.demand * 0.88]
@@ -221,15 +256,9 @@ class AppService:
         view_id_normalized = view_id.strip().lower()
         vm = None
         if view_id_normalized in {"dashboard", "dash"}:
-            vm = self._dashboard_vm()
-        elif view_id_normalized == "market":
-            vm = self._market_vm()
-        elif view_id_normalized == "policies":
-            vm = self._policies_vm()
-        elif view_id_normalized == "industry":
-            vm = self._industry_vm()
-        elif view_id_normalized == "history":
-            vm = self._history_vm()
+            vm = self._state_view_model("dashboard")
+        elif view_id_normalized in {"market", "policies", "industry", "history"}:
+            vm = self._state_view_model(view_id_normalized)
         else:
             vm = self._explain_vm(view_id_normalized)
         return OSResponse(
@@ -265,7 +294,9 @@ class AppService:
             response = self.app.process_command(raw)
             if self.debug_mode:
                 print(f"[DEBUG RESPONSE] turn_advanced={response.turn_advanced} view={response.current_view} output_len={len(response.output)}")
-            self.app.logger.debug({"where": "app_service.handle", "raw": raw, "turn_advanced": response.turn_advanced, "debug": self.debug_mode})
+            self.app.logger.debug(
+                lambda: {"where": "app_service.handle", "raw": raw, "turn_advanced": response.turn_advanced, "debug": self.debug_mode}
+            )
             view_model = self._select_view_model(response.current_view, raw)
             friendly_message = response.output
             raw_lower = raw.strip().lower()
@@ -298,15 +329,15 @@ class AppService:
         kind = intent_kind_or_view or ""
         low = kind.lower()
         if low in {intents.VIEW_DASH.lower(), "dashboard", "view_dash"}:
-            return self._dashboard_vm()
+            return self._state_view_model("dashboard")
         if low in {intents.VIEW_MARKET.lower(), "market", "view_market"}:
-            return self._market_vm()
+            return self._state_view_model("market")
         if low in {intents.VIEW_POLICIES.lower(), "policies", "view_policies"}:
-            return self._policies_vm()
+            return self._state_view_model("policies")
         if low in {intents.VIEW_INDUSTRY.lower(), "industry", "view_industry"}:
-            return self._industry_vm()
+            return self._state_view_model("industry")
         if low in {intents.VIEW_HISTORY.lower(), "history", "view_history"}:
-            return self._history_vm()
+            return self._state_view_model("history")
         if low == intents.EXPLAIN.lower():
             topic = raw.split(" ", 1)[1] if " " in raw else "general"
             return self._explain_vm(topic)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from typing import Collection
 
 from shinon_os.core import intents
 from shinon_os.core.types import Intent
@@ -13,8 +14,10 @@ def _extract_number(text: str) -> float | None:
     return float(match.group(1).replace(",", "."))
 
 
-def _extract_target(text: str, candidates: set[str]) -> str | None:
-    for candidate in sorted(candidates):
+def _extract_target(text: str, candidates: Collection[str]) -> str | None:
+    # Substring pre-check first: packs can carry hundreds of ids, most of which
+    # never appear in a short command, so only a few reach the regex.
+    for candidate in sorted(candidate for candidate in candidates if candidate in text):
         if re.search(rf"\b{re.escape(candidate)}\b", text):
             return candidate
     return None
@@ -44,12 +47,18 @@ def _policy_hint(text: str) -> tuple[str | None, float]:
     return None, 0.0
 
 
-def parse_input(raw_text: str, current_view: str, policy_target_types: dict[str, str] | None = None) -> Intent:
+def parse_input(
+    raw_text: str,
+    current_view: str,
+    policy_target_types: dict[str, str] | None = None,
+    *,
+    sector_ids: Collection[str],
+    good_ids: Collection[str],
+) -> Intent:
+    """``sector_ids`` / ``good_ids`` are the target candidates and must come from the loaded bundle."""
     text = raw_text.strip()
     low = text.lower()
     target_types = policy_target_types or {}
-    sector_candidates = {"agriculture", "industry", "services"}
-    good_candidates = {"grain", "bread", "wood", "tools", "ore", "metal", "medicine", "fuel"}
 
     if not text:
         return Intent(kind=intents.HELP, raw=raw_text, confidence=1.0)
@@ -66,6 +75,11 @@ def parse_input(raw_text: str, current_view: str, policy_target_types: dict[str,
         return Intent(kind=intents.SHOW_GOALS, raw=raw_text, confidence=1.0)
     if low in {"intel", "show intel"}:
         return Intent(kind=intents.INTEL, raw=raw_text, confidence=1.0)
+    if low == "profile" or low.startswith("profile "):
+        tokens = text.split(maxsplit=2)
+        action = tokens[1].lower() if len(tokens) > 1 else "show"
+        path = tokens[2].strip() if len(tokens) > 2 else ""
+        return Intent(kind=intents.PROFILE, raw=raw_text, args={"action": action, "path": path}, confidence=1.0)
     if low in {"dashboard", "dash", "d"}:
         return Intent(kind=intents.VIEW_DASH, raw=raw_text, confidence=1.0)
     if low in {"market", "m"}:
@@ -128,11 +142,11 @@ def parse_input(raw_text: str, current_view: str, policy_target_types: dict[str,
         missing: list[str] = []
         target_type = target_types.get(policy_id, "none")
         if target_type == "sector":
-            target = _extract_target(low, sector_candidates)
+            target = _extract_target(low, sector_ids)
             if target is None:
                 missing.append("target")
         elif target_type == "good":
-            target = _extract_target(low, good_candidates)
+            target = _extract_target(low, good_ids)
             if target is None:
                 missing.append("target")
         auto_execute = confidence >= 0.8 and not missing
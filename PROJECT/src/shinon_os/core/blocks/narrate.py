@@ -15,9 +15,11 @@ def dominant_stance(stance: StanceState) -> str:
     return max(score_map, key=score_map.get)
 
 
-def render_action_report(seed: int, result: SimResult, plan: Plan, stance: StanceState) -> str:
+def render_action_report(
+    seed: int, result: SimResult, plan: Plan, stance: StanceState, rng_mode: str = "compat"
+) -> str:
     stance_mode = dominant_stance(stance)
-    phrase = pick_phrase(seed, result.world_after.turn, stance_mode)
+    phrase = pick_phrase(seed, result.world_after.turn, stance_mode, rng_mode)
     movers = ", ".join(f"{good}:{delta:+.2f}%" for good, delta in result.top_price_movers) or t("kernel.none")
     events_line = ", ".join(event["id"] for event in result.events) if result.events else t("kernel.none")
 
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from shinon_os.sim.model import GameState, WorldState
+from shinon_os.sim.model import GameState, WorldSnapshot
 
 
-def build_observations(state: GameState, last_world_snapshot: WorldState | None) -> dict[str, object]:
+def build_observations(state: GameState, last_world_snapshot: WorldSnapshot | None) -> dict[str, object]:
     shortages = [
         good_id
         for good_id, item in state.market.items()
@@ -13,5 +13,6 @@ LANG = "LANG"
 UNLOCK_LIST = "UNLOCK_LIST"
 SHOW_GOALS = "SHOW_GOALS"
 INTEL = "INTEL"
+PROFILE = "PROFILE"
 
 VIEW_INTENTS = {VIEW_DASH, VIEW_MARKET, VIEW_POLICIES, VIEW_INDUSTRY, VIEW_HISTORY, EXPLAIN}
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from copy import deepcopy
+from pathlib import Path
 
 from shinon_os.core import intents
 from shinon_os.core.blocks.interpret import parse_input
@@ -13,8 +13,9 @@ from shinon_os.core.memory import KernelMemory
 from shinon_os.core.types import ChatTurnModel, KernelResponse, StanceState
 from shinon_os.i18n import set_lang, t
 from shinon_os.sim.engine import SimulationEngine
-from shinon_os.sim.model import GameState, WorldState
+from shinon_os.sim.model import GameState, WorldSnapshot
 from shinon_os.util.logging_setup import JsonlRotatingLogger
+from shinon_os.util.profiling import TurnProfiler
 
 
 class ShinonKernel:
@@ -24,7 +25,7 @@ class ShinonKernel:
         self.stance = StanceState()
         self.memory = KernelMemory(limit=12)
         self.current_view = "dashboard"
-        self.last_world_snapshot: WorldState | None = None
+        self.last_world_snapshot: WorldSnapshot | None = None
 
     def _render_dashboard(self, state: GameState) -> str:
         world = state.world
@@ -176,6 +177,43 @@ class ShinonKernel:
             return f"{t('cmd.intel.header')}\n{t('cmd.intel.none')}"
         return f"{t('cmd.intel.header')}\n- {hint['text']}"
 
+    def _render_profile(self, profiler: TurnProfiler) -> str:
+        summary = profiler.summary()
+        if not summary["turns"]:
+            return f"{t('cmd.profile.header')}\n{t('cmd.profile.empty')}"
+        rows = [
+            [name, str(row["calls"]), f"{row['mean_ms']:.3f}", f"{row['max_ms']:.3f}", f"{row['total_ms']:.1f}"]
+            for name, row in summary["phases"].items()
+        ]
+        table = render_table(["phase", "calls", "mean ms", "max ms", "total ms"], rows)
+        counters = ", ".join(f"{name}={value}" for name, value in summary["counters"].items())
+        return f"{t('cmd.profile.header')} ({summary['turns']} {t('cmd.profile.turns')})\n{table}\n{counters}"
+
+    def _profile_command(self, action: str, path: str) -> str:
+        if action == "on":
+            self.engine.enable_profiling()
+            return t("cmd.profile.enabled")
+        if action == "off":
+            self.engine.disable_profiling()
+            return t("cmd.profile.disabled")
+        profiler = self.engine.profiler
+        if action not in {"show", "reset", "export"}:
+            return t("cmd.profile.usage")
+        if not isinstance(profiler, TurnProfiler):
+            return t("cmd.profile.inactive")
+        if action == "reset":
+            profiler.reset()
+            return t("cmd.profile.reset")
+        if action == "export":
+            if not path:
+                return t("cmd.profile.usage")
+            try:
+                fmt = profiler.export(Path(path))
+            except (OSError, ValueError) as exc:
+                return t("cmd.profile.export_failed", error=str(exc))
+            return t("cmd.profile.exported", path=path, fmt=fmt)
+        return self._render_profile(profiler)
+
     def _render_view(self, intent_kind: str, state: GameState, topic: str = "general") -> tuple[str, str]:
         if intent_kind == intents.VIEW_DASH:
             self.current_view = "dashboard"
@@ -236,7 +274,14 @@ class ShinonKernel:
     def handle(self, raw_command: str) -> KernelResponse:
         state = self.engine.load_state()
         observations = build_observations(state, self.last_world_snapshot)
-        intent = parse_input(raw_command, self.current_view, policy_target_types=self._policy_target_types())
+        bundle = self.engine.bundle
+        intent = parse_input(
+            raw_command,
+            self.current_view,
+            policy_target_types=self._policy_target_types(),
+            sector_ids=bundle.sector_id_set,
+            good_ids=bundle.good_id_set,
+        )
 
         if intent.kind == intents.QUIT:
             return KernelResponse(
@@ -286,6 +331,10 @@ class ShinonKernel:
             content = self._render_intel(state)
             return self._chat_response(intent_kind=intent.kind, content=content, turn_advanced=False, raw_message=raw_command)
 
+        if intent.kind == intents.PROFILE:
+            content = self._profile_command(str(intent.args.get("action", "show")), str(intent.args.get("path", "")))
+            return self._chat_response(intent_kind=intent.kind, content=content, turn_advanced=False, raw_message=raw_command)
+
         if intent.kind == intents.ENACT_POLICY:
             if "invalid" in intent.args:
                 return self._chat_response(
@@ -329,7 +378,8 @@ class ShinonKernel:
             self.stance = update_stance(new_observations, self.stance)
             plan = create_plan(intent, self.stance, new_observations, self.engine.policy_status(new_state))
             seed = self.engine.repo.get_seed() or 0
-            output = render_action_report(seed, result, plan, self.stance)
+            rng_mode = str(self.engine.bundle.config["economy"].get("rng_mode", "compat"))
+            output = render_action_report(seed, result, plan, self.stance, rng_mode)
 
             auto_hint = self.engine.intel_hint(new_state, auto=True)
             if auto_hint:
@@ -345,7 +395,7 @@ class ShinonKernel:
                 }
             )
             self.current_view = "dashboard"
-            self.last_world_snapshot = deepcopy(new_state.world)
+            self.last_world_snapshot = new_state.world.snapshot()
             return self._chat_response(
                 intent_kind=intent.kind,
                 content=output,
@@ -368,8 +418,8 @@ class ShinonKernel:
             + f"\n{t('kernel.next.label')}: "
             + ", ".join(plan.options)
         )
-        self.last_world_snapshot = deepcopy(state.world)
-        self.logger.debug({"where": "kernel.view", "view": view_name, "turn": state.world.turn})
+        self.last_world_snapshot = state.world.snapshot()
+        self.logger.debug(lambda: {"where": "kernel.view", "view": view_name, "turn": state.world.turn})
         return self._chat_response(
             intent_kind=intent.kind,
             content=output,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from shinon_os.i18n import t
-from shinon_os.util.rng import seeded_rng
+from shinon_os.util.rng import stream_rng
 
 PHRASE_KEYS: dict[str, list[str]] = {
     "CONTROL": [
@@ -22,7 +22,7 @@ PHRASE_KEYS: dict[str, list[str]] = {
 }
 
 
-def pick_phrase(seed: int, turn: int, stance_mode: str) -> str:
+def pick_phrase(seed: int, turn: int, stance_mode: str, rng_mode: str = "compat") -> str:
     options = PHRASE_KEYS.get(stance_mode, PHRASE_KEYS["CONTROL"])
-    rng = seeded_rng(seed, "phrase", turn, stance_mode)
+    rng = stream_rng(rng_mode, seed, "phrase", turn, stance_mode)
     return t(rng.choice(options))
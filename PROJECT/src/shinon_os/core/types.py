@@ -59,3 +59,4 @@ class BootSequenceModel:
     stages: list[str]
     durations_ms: list[int]
     status: str
+    elapsed_ms: list[float] = field(default_factory=list)
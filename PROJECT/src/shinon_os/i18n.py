@@ -30,6 +30,11 @@ def _load_locale(lang: str) -> dict[str, str]:
     return _cache[lang]
 
 
+def preload(langs: tuple[str, ...] = tuple(sorted(_SUPPORTED))) -> None:
+    for lang in langs:
+        _load_locale(lang)
+
+
 def get_lang() -> str:
     return _active_lang
 
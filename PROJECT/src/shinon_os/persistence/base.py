@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import Callable, Protocol
+
+from shinon_os.persistence.memory import InMemoryStateRepository
+from shinon_os.persistence.repo import StateRepository
+from shinon_os.sim.model import GameState, MarketGood, WorldState
+
+REPOSITORY_BACKENDS = ("sqlite", "memory")
+MEMORY_DB = ":memory:"
+
+
+class Repository(Protocol):
+    """What SimulationEngine and the UI layers need from a state store."""
+
+    def close(self) -> None: ...
+
+    @property
+    def total_changes(self) -> int: ...
+
+    def set_trace(self, callback: Callable[[str], None] | None) -> None: ...
+
+    def batch(self) -> AbstractContextManager[None]: ...
+
+    def in_batch(self) -> bool: ...
+
+    def commit(self) -> None: ...
+
+    def has_game(self) -> bool: ...
+
+    def get_seed(self) -> int | None: ...
+
+    def get_language(self) -> str: ...
+
+    def set_language(self, code: str) -> None: ...
+
+    def get_str_meta(self, key: str, default: str = "") -> str: ...
+
+    def set_str_meta(self, key: str, value: str) -> None: ...
+
+    def meta_values(self, keys: tuple[str, ...]) -> dict[str, str]: ...
+
+    def get_int_meta(self, key: str, default: int = 0) -> int: ...
+
+    def set_int_meta(self, key: str, value: int) -> None: ...
+
+    def get_bool_meta(self, key: str, default: bool = False) -> bool: ...
+
+    def set_bool_meta(self, key: str, value: bool) -> None: ...
+
+    def list_unlocked_policies(self) -> set[str]: ...
+
+    def unlocked_policy_rows(self) -> list[dict[str, object]]: ...
+
+    def replace_unlocked_policies(self, policy_ids: set[str], turn: int, source: str = "reset") -> None: ...
+
+    def unlock_policy(self, policy_id: str, turn: int, source: str = "rule") -> None: ...
+
+    def trailing_cashflow(self, window: int, include_current: float = 0.0) -> float: ...
+
+    def cashflow_between(self, turn_a: int, turn_b: int) -> list[tuple[int, float]]: ...
+
+    def init_new_game(self, seed: int, state: GameState) -> None: ...
+
+    def load_state(self, sector_io_defs: dict[str, dict[str, dict[str, float]]]) -> GameState: ...
+
+    def save_state(self, state: GameState, rows: dict[str, object] | None = None) -> dict[str, object] | None: ...
+
+    def append_history(self, turn: int, action: str, cost: int, summary: dict[str, object]) -> None: ...
+
+    def record_metrics(
+        self,
+        turn: int,
+        world: WorldState,
+        market: dict[str, MarketGood],
+        inflation: float,
+        volatility: float,
+        net_cashflow: float,
+        shortage_count: int,
+    ) -> None: ...
+
+    def metrics_between(
+        self, turn_a: int, turn_b: int, fields: list[str] | None = None
+    ) -> dict[str, list[object]]: ...
+
+    def append_events(self, turn: int, events: list[dict[str, object]]) -> None: ...
+
+    def history(self, limit: int = 20) -> list[dict[str, object]]: ...
+
+    def events_since(self, from_turn: int) -> list[dict[str, object]]: ...
+
+    def record_checkpoint(self, turn: int, snapshot: bool, payload: bytes) -> None: ...
+
+    def checkpoint_chain(self, turn: int) -> list[tuple[int, bool, bytes]]: ...
+
+    def restore_checkpoint(
+        self,
+        turn: int,
+        state: GameState,
+        unlocked: dict[str, tuple[int, str]],
+        meta: dict[str, str],
+    ) -> None: ...
+
+    def fork(self, db_path: Path | None = None) -> Repository: ...
+
+
+def resolve_backend(db_path: Path | str | None, backend: str | None = None) -> str:
+    if backend is None:
+        return "memory" if db_path is not None and str(db_path) == MEMORY_DB else "sqlite"
+    if backend not in REPOSITORY_BACKENDS:
+        raise ValueError(f"Unknown repository backend: {backend} (use {', '.join(REPOSITORY_BACKENDS)})")
+    return backend
+
+
+def open_repository(db_path: Path | str | None, backend: str | None = None) -> Repository:
+    """``backend=None`` picks the dict store for ``":memory:"`` and SQLite for everything else."""
+    if resolve_backend(db_path, backend) == "memory":
+        return InMemoryStateRepository()
+    if db_path is None:
+        raise ValueError("SQLite backend needs a db_path")
+    return StateRepository(Path(db_path))
@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import heapq
+import json
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from shinon_os.persistence.metrics_store import GOOD_FIELDS, TURN_FIELDS, split_metric_field
+from shinon_os.persistence.repo import CASHFLOW_WINDOW, START_LOADOUT, state_rows
+from shinon_os.persistence.schema import SCHEMA_VERSION
+from shinon_os.sim.model import GameState, MarketGood, PolicyRuntime, SectorState, WorldState
+from shinon_os.util.timeutil import utc_now_iso
+
+_MISSING = object()
+_WHOLE_TABLE = object()
+_TABLES = (
+    "meta",
+    "world_state",
+    "market",
+    "sectors",
+    "active_policies",
+    "unlocked_policies",
+    "history",
+    "events_log",
+    "turn_metrics",
+    "good_metrics",
+    "state_checkpoints",
+)
+_DEFAULT_META = {
+    "language": "de",
+    "collapse_active": "0",
+    "collapse_recovery_streak": "0",
+    "next_unlock_turn": "0",
+    "last_auto_intel_turn": "-9999",
+    "schema_version": str(SCHEMA_VERSION),
+}
+
+
+class InMemoryStateRepository:
+    """Dict-backed stand-in for StateRepository when nothing needs to survive the process.
+
+    Rows are kept as the same plain tuples/JSON strings the SQLite tables hold, so
+    loaded states never alias stored data. Writes inside ``batch()`` are journaled
+    and undone on rollback, matching the transactional behaviour the engine relies on.
+    """
+
+    db_path = None
+
+    def __init__(self) -> None:
+        self._tables: dict[str, dict[Any, Any]] = {name: {} for name in _TABLES}
+        self._tables["meta"].update(_DEFAULT_META)
+        self._journal: list[tuple[str, Any, Any]] = []
+        self._batch_depth = 0
+        self._cashflow: deque[tuple[int, float]] | None = None
+        # Rows inserted, replaced or deleted, like sqlite3's Connection.total_changes.
+        self.total_changes = 0
+
+    def close(self) -> None:
+        pass
+
+    def set_trace(self, callback: Callable[[str], None] | None) -> None:
+        # No SQL is ever executed here.
+        pass
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._rollback()
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._journal.clear()
+
+    def in_batch(self) -> bool:
+        return self._batch_depth > 0
+
+    def commit(self) -> None:
+        self._journal.clear()
+
+    def _rollback(self) -> None:
+        for table, key, previous in reversed(self._journal):
+            if key is _WHOLE_TABLE:
+                self._tables[table] = previous
+            elif previous is _MISSING:
+                self._tables[table].pop(key, None)
+            else:
+                self._tables[table][key] = previous
+        self._journal.clear()
+        self._cashflow = None
+
+    def _put(self, table: str, key: Any, value: Any) -> None:
+        rows = self._tables[table]
+        if self._batch_depth:
+            self._journal.append((table, key, rows.get(key, _MISSING)))
+        rows[key] = value
+        self.total_changes += 1
+
+    def _delete(self, table: str, key: Any) -> None:
+        rows = self._tables[table]
+        if key not in rows:
+            return
+        if self._batch_depth:
+            self._journal.append((table, key, rows[key]))
+        del rows[key]
+        self.total_changes += 1
+
+    def _clear(self, table: str) -> None:
+        if self._batch_depth:
+            self._journal.append((table, _WHOLE_TABLE, self._tables[table]))
+        self.total_changes += len(self._tables[table])
+        self._tables[table] = {}
+
+    def has_game(self) -> bool:
+        return 1 in self._tables["world_state"]
+
+    def get_seed(self) -> int | None:
+        raw = self._tables["meta"].get("seed")
+        if raw is None:
+            return None
+        return int(raw)
+
+    def get_language(self) -> str:
+        return str(self._tables["meta"].get("language", "de") or "de")
+
+    def set_language(self, code: str) -> None:
+        normalized = (code or "").strip().lower()
+        self._put("meta", "language", "de" if normalized not in {"de", "en"} else normalized)
+
+    def get_str_meta(self, key: str, default: str = "") -> str:
+        raw = self._tables["meta"].get(key, default)
+        return str(raw if raw is not None else default)
+
+    def set_str_meta(self, key: str, value: str) -> None:
+        self._put("meta", key, str(value))
+
+    def meta_values(self, keys: tuple[str, ...]) -> dict[str, str]:
+        meta = self._tables["meta"]
+        return {key: meta.get(key) or "" for key in keys}
+
+    def get_int_meta(self, key: str, default: int = 0) -> int:
+        raw = self._tables["meta"].get(key)
+        if raw is None:
+            return default
+        try:
+            return int(raw)
+        except ValueError:
+            return default
+
+    def set_int_meta(self, key: str, value: int) -> None:
+        self._put("meta", key, str(int(value)))
+
+    def get_bool_meta(self, key: str, default: bool = False) -> bool:
+        return self.get_int_meta(key, 1 if default else 0) != 0
+
+    def set_bool_meta(self, key: str, value: bool) -> None:
+        self.set_int_meta(key, 1 if value else 0)
+
+    def list_unlocked_policies(self) -> set[str]:
+        return set(self._tables["unlocked_policies"])
+
+    def unlocked_policy_rows(self) -> list[dict[str, object]]:
+        rows = sorted(self._tables["unlocked_policies"].items(), key=lambda item: (item[1][0], item[0]))
+        return [
+            {"policy_id": policy_id, "unlocked_turn": unlocked_turn, "source": source}
+            for policy_id, (unlocked_turn, source) in rows
+        ]
+
+    def replace_unlocked_policies(self, policy_ids: set[str], turn: int, source: str = "reset") -> None:
+        self._clear("unlocked_policies")
+        for policy_id in sorted(policy_ids):
+            self._put("unlocked_policies", policy_id, (int(turn), source))
+
+    def unlock_policy(self, policy_id: str, turn: int, source: str = "rule") -> None:
+        self._put("unlocked_policies", policy_id, (int(turn), source))
+
+    def _recent_cashflow(self) -> deque[tuple[int, float]]:
+        if self._cashflow is None:
+            history = self._tables["history"]
+            turns = heapq.nlargest(CASHFLOW_WINDOW, history)
+            self._cashflow = deque(((turn, history[turn][4]) for turn in reversed(turns)), maxlen=CASHFLOW_WINDOW)
+        return self._cashflow
+
+    def trailing_cashflow(self, window: int, include_current: float = 0.0) -> float:
+        if window <= 0:
+            return 0.0
+        total = float(include_current)
+        previous = window - 1
+        if previous > CASHFLOW_WINDOW:
+            history = self._tables["history"]
+            for turn in heapq.nlargest(previous, history):
+                total += history[turn][4]
+            return total
+        recent = self._recent_cashflow()
+        for index in range(len(recent) - 1, max(-1, len(recent) - 1 - previous), -1):
+            total += recent[index][1]
+        return total
+
+    def cashflow_between(self, turn_a: int, turn_b: int) -> list[tuple[int, float]]:
+        history = self._tables["history"]
+        return [(turn, history[turn][4]) for turn in sorted(t for t in history if turn_a <= t <= turn_b)]
+
+    def init_new_game(self, seed: int, state: GameState) -> None:
+        rows = state_rows(state)
+        for table in _TABLES:
+            if table != "meta":
+                self._clear(table)
+        self._put("meta", "seed", str(seed))
+        self._put("meta", "created_at", utc_now_iso())
+        for key, value in _DEFAULT_META.items():
+            if key != "schema_version":
+                self._put("meta", key, value)
+        self._put("meta", "last_intel_hint_id", "")
+
+        self._put("world_state", 1, rows["world"])
+        for good_id, row in rows["market"].items():
+            self._put("market", good_id, row)
+        for sector_id, row in rows["sectors"].items():
+            self._put("sectors", sector_id, row)
+        for policy_id in START_LOADOUT:
+            self._put("unlocked_policies", policy_id, (0, "new_game"))
+        self._cashflow = deque(maxlen=CASHFLOW_WINDOW)
+
+    def load_state(self, sector_io_defs: dict[str, dict[str, dict[str, float]]]) -> GameState:
+        world_row = self._tables["world_state"].get(1)
+        if world_row is None:
+            raise RuntimeError("No saved world_state found.")
+        world = WorldState(*world_row)
+
+        market = {good_id: MarketGood(*row) for good_id, row in sorted(self._tables["market"].items())}
+        sectors: dict[str, SectorState] = {}
+        for sector_id, row in sorted(self._tables["sectors"].items()):
+            io_def = sector_io_defs.get(sector_id, {"inputs": {}, "outputs": {}})
+            sectors[sector_id] = SectorState(
+                *row,
+                inputs=dict(io_def.get("inputs", {})),
+                outputs=dict(io_def.get("outputs", {})),
+            )
+        active_policies = {
+            policy_id: PolicyRuntime(policy_id, remaining, cooldown, magnitude, json.loads(state_json))
+            for policy_id, (_, remaining, cooldown, magnitude, state_json) in sorted(
+                self._tables["active_policies"].items()
+            )
+        }
+        return GameState(
+            world=world,
+            market=market,
+            sectors=sectors,
+            unlocked_policies=set(self._tables["unlocked_policies"]),
+            active_policies=active_policies,
+        )
+
+    def save_state(self, state: GameState, rows: dict[str, object] | None = None) -> dict[str, object]:
+        rows = rows if rows is not None else state_rows(state)
+        delta: dict[str, object] = {}
+        if self._tables["world_state"].get(1) != rows["world"]:
+            self._put("world_state", 1, rows["world"])
+            delta["world"] = rows["world"]
+        for table, key in (("market", "market"), ("sectors", "sectors"), ("active_policies", "policies")):
+            stored = self._tables[table]
+            changed = {row_id: row for row_id, row in rows[key].items() if stored.get(row_id) != row}
+            for row_id, row in changed.items():
+                self._put(table, row_id, row)
+            removed = [row_id for row_id in stored if row_id not in rows[key]]
+            for row_id in removed:
+                self._delete(table, row_id)
+            if changed:
+                delta[key] = changed
+            if removed:
+                delta[f"{key}_removed"] = removed
+        return delta
+
+    def append_history(self, turn: int, action: str, cost: int, summary: dict[str, object]) -> None:
+        net_cashflow = float(summary.get("net_cashflow", 0.0))
+        row = (utc_now_iso(), action, cost, json.dumps(summary, ensure_ascii=True), net_cashflow)
+        self._put("history", int(turn), row)
+        if self._cashflow is not None:
+            if self._cashflow and self._cashflow[-1][0] >= turn:
+                self._cashflow = None
+            else:
+                self._cashflow.append((int(turn), net_cashflow))
+
+    def record_metrics(
+        self,
+        turn: int,
+        world: WorldState,
+        market: dict[str, MarketGood],
+        inflation: float,
+        volatility: float,
+        net_cashflow: float,
+        shortage_count: int,
+    ) -> None:
+        self._put(
+            "turn_metrics",
+            int(turn),
+            (
+                world.treasury,
+                world.population,
+                world.prosperity,
+                world.stability,
+                world.unrest,
+                world.tech_level,
+                float(inflation),
+                float(volatility),
+                float(net_cashflow),
+                int(shortage_count),
+            ),
+        )
+        for good in market.values():
+            self._put("good_metrics", (good.good_id, int(turn)), (good.price, good.supply, good.demand))
+
+    def metrics_between(self, turn_a: int, turn_b: int, fields: list[str] | None = None) -> dict[str, list[object]]:
+        names = list(TURN_FIELDS if fields is None else fields)
+        parsed = [split_metric_field(name) for name in names]
+        metrics = self._tables["turn_metrics"]
+        goods = self._tables["good_metrics"]
+        turns = sorted(turn for turn in metrics if turn_a <= turn <= turn_b)
+        result: dict[str, list[object]] = {"turn": turns}
+        for name, (good_id, column) in zip(names, parsed):
+            if good_id is None:
+                index = TURN_FIELDS.index(column)
+                result[name] = [metrics[turn][index] for turn in turns]
+            else:
+                index = GOOD_FIELDS.index(column)
+                result[name] = [
+                    goods[(good_id, turn)][index] if (good_id, turn) in goods else None for turn in turns
+                ]
+        return result
+
+    def append_events(self, turn: int, events: list[dict[str, object]]) -> None:
+        for event in events:
+            self._put("events_log", (int(turn), str(event["id"])), json.dumps(event, ensure_ascii=True))
+
+    def history(self, limit: int = 20) -> list[dict[str, object]]:
+        history = self._tables["history"]
+        result: list[dict[str, object]] = []
+        for turn in heapq.nlargest(limit, history):
+            ts, action, cost, summary_json, _ = history[turn]
+            result.append(
+                {
+                    "turn": turn,
+                    "ts": ts,
+                    "action": action,
+                    "cost": int(cost),
+                    "summary": json.loads(summary_json),
+                }
+            )
+        return result
+
+    def events_since(self, from_turn: int) -> list[dict[str, object]]:
+        rows = sorted(
+            ((key, value) for key, value in self._tables["events_log"].items() if key[0] >= from_turn),
+            key=lambda item: item[0][0],
+            reverse=True,
+        )
+        out: list[dict[str, object]] = []
+        for (turn, _), summary_json in rows:
+            event = json.loads(summary_json)
+            event["turn"] = turn
+            out.append(event)
+        return out
+
+    def record_checkpoint(self, turn: int, snapshot: bool, payload: bytes) -> None:
+        self._put("state_checkpoints", int(turn), (bool(snapshot), bytes(payload)))
+
+    def checkpoint_chain(self, turn: int) -> list[tuple[int, bool, bytes]]:
+        checkpoints = self._tables["state_checkpoints"]
+        start = max((key for key, (snapshot, _) in checkpoints.items() if snapshot and key <= turn), default=None)
+        if start is None:
+            return []
+        return [(key, *checkpoints[key]) for key in range(start, int(turn) + 1) if key in checkpoints]
+
+    def restore_checkpoint(
+        self,
+        turn: int,
+        state: GameState,
+        unlocked: dict[str, tuple[int, str]],
+        meta: dict[str, str],
+    ) -> None:
+        with self.batch():
+            for table in ("history", "turn_metrics", "state_checkpoints"):
+                for key in [key for key in self._tables[table] if key > turn]:
+                    self._delete(table, key)
+            for table, turn_index in (("events_log", 0), ("good_metrics", 1)):
+                for key in [key for key in self._tables[table] if key[turn_index] > turn]:
+                    self._delete(table, key)
+            self.save_state(state)
+            self._clear("unlocked_policies")
+            for policy_id, (unlocked_turn, source) in unlocked.items():
+                self._put("unlocked_policies", policy_id, (int(unlocked_turn), source))
+            for key, value in meta.items():
+                self._put("meta", key, value)
+        self._cashflow = None
+
+    def fork(self, db_path: Path | None = None) -> InMemoryStateRepository:
+        if db_path is not None:
+            raise ValueError("An in-memory game can only be forked in memory.")
+        clone = InMemoryStateRepository()
+        # Rows are immutable tuples, strings and bytes, so shallow table copies are independent.
+        clone._tables = {name: dict(rows) for name, rows in self._tables.items()}
+        return clone
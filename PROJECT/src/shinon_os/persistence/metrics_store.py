@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import Iterable, Mapping
+
+from shinon_os.sim.model import MarketGood, WorldState
+
+TURN_FIELDS = (
+    "treasury",
+    "population",
+    "prosperity",
+    "stability",
+    "unrest",
+    "tech_level",
+    "inflation",
+    "volatility",
+    "net_cashflow",
+    "shortage_count",
+)
+GOOD_FIELDS = ("price", "supply", "demand")
+
+_INSERT_TURN_SQL = f"""
+    INSERT INTO turn_metrics(turn, {", ".join(TURN_FIELDS)})
+    VALUES(?, {", ".join("?" for _ in TURN_FIELDS)})
+    ON CONFLICT(turn) DO UPDATE SET
+        {", ".join(f"{name} = excluded.{name}" for name in TURN_FIELDS)}
+"""
+_INSERT_GOOD_SQL = """
+    INSERT INTO good_metrics(good_id, turn, price, supply, demand)
+    VALUES(?, ?, ?, ?, ?)
+    ON CONFLICT(good_id, turn) DO UPDATE SET
+        price = excluded.price,
+        supply = excluded.supply,
+        demand = excluded.demand
+"""
+
+
+def split_metric_field(name: str) -> tuple[str | None, str]:
+    """``"inflation"`` -> (None, "inflation"); ``"grain.price"`` -> ("grain", "price")."""
+    good_id, sep, column = name.rpartition(".")
+    if sep:
+        if column not in GOOD_FIELDS or not good_id:
+            raise ValueError(f"Unknown good metric field: {name}")
+        return good_id, column
+    if name not in TURN_FIELDS:
+        raise ValueError(f"Unknown turn metric field: {name}")
+    return None, name
+
+
+class MetricsStore:
+    """Typed per-turn metrics in ``turn_metrics``/``good_metrics``.
+
+    Writes run on the caller's transaction; StateRepository wraps them in its
+    write scope so they join the turn batch.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def clear(self) -> None:
+        self.conn.execute("DELETE FROM turn_metrics")
+        self.conn.execute("DELETE FROM good_metrics")
+
+    def record(
+        self,
+        turn: int,
+        world: WorldState,
+        market: Mapping[str, MarketGood],
+        inflation: float,
+        volatility: float,
+        net_cashflow: float,
+        shortage_count: int,
+    ) -> None:
+        self.conn.execute(
+            _INSERT_TURN_SQL,
+            (
+                int(turn),
+                world.treasury,
+                world.population,
+                world.prosperity,
+                world.stability,
+                world.unrest,
+                world.tech_level,
+                float(inflation),
+                float(volatility),
+                float(net_cashflow),
+                int(shortage_count),
+            ),
+        )
+        self.conn.executemany(
+            _INSERT_GOOD_SQL,
+            [(good.good_id, int(turn), good.price, good.supply, good.demand) for good in market.values()],
+        )
+
+    def metrics_between(
+        self,
+        turn_a: int,
+        turn_b: int,
+        fields: Iterable[str] | None = None,
+    ) -> dict[str, list[object]]:
+        """Column-oriented metrics for ``turn_a <= turn <= turn_b``.
+
+        ``fields`` names turn columns (``"inflation"``) or per-good columns
+        (``"grain.price"``); every list is aligned with ``result["turn"]``.
+        Goods without a row for a turn yield ``None``.
+        """
+        names = list(TURN_FIELDS if fields is None else fields)
+        parsed = [split_metric_field(name) for name in names]
+        turn_columns = [column for good_id, column in parsed if good_id is None]
+        select = ", ".join(["turn", *dict.fromkeys(turn_columns)])
+        rows = self.conn.execute(
+            f"SELECT {select} FROM turn_metrics WHERE turn BETWEEN ? AND ? ORDER BY turn",
+            (int(turn_a), int(turn_b)),
+        ).fetchall()
+        turns = [int(row["turn"]) for row in rows]
+        result: dict[str, list[object]] = {"turn": turns}
+
+        good_columns: dict[str, dict[int, sqlite3.Row]] = {}
+        for name, (good_id, column) in zip(names, parsed):
+            if good_id is None:
+                result[name] = [row[column] for row in rows]
+                continue
+            by_turn = good_columns.get(good_id)
+            if by_turn is None:
+                good_rows = self.conn.execute(
+                    "SELECT turn, price, supply, demand FROM good_metrics "
+                    "WHERE good_id = ? AND turn BETWEEN ? AND ?",
+                    (good_id, int(turn_a), int(turn_b)),
+                ).fetchall()
+                by_turn = {int(row["turn"]): row for row in good_rows}
+                good_columns[good_id] = by_turn
+            result[name] = [by_turn[turn][column] if turn in by_turn else None for turn in turns]
+        return result
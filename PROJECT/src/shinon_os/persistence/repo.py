@@ -1,53 +1,260 @@
 from __future__ import annotations
 
 import json
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable, Iterator
 
 from shinon_os.persistence.db import connect
-from shinon_os.persistence.schema import ensure_schema, get_meta, set_meta
+from shinon_os.persistence.metrics_store import MetricsStore
+from shinon_os.persistence.schema import ensure_schema, load_meta, set_meta
 from shinon_os.sim.model import GameState, MarketGood, PolicyRuntime, SectorState, WorldState
 from shinon_os.util.timeutil import utc_now_iso
 
 START_LOADOUT = ("TAX_ADJUST", "SUBSIDY_SECTOR", "IMPORT_PROGRAM")
+# Turns of net cashflow kept in memory for trailing-window sums.
+CASHFLOW_WINDOW = 16
+
+# Statement texts are module constants so sqlite3's statement cache reuses the
+# prepared statements across turns.
+_UPDATE_WORLD_SQL = """
+    UPDATE world_state
+    SET turn = ?, treasury = ?, population = ?, prosperity = ?, stability = ?, unrest = ?, tech_level = ?, last_action_ts = ?
+    WHERE id = 1
+"""
+_UPSERT_MARKET_SQL = """
+    INSERT INTO market(good_id, supply, demand, price, last_price)
+    VALUES(?, ?, ?, ?, ?)
+    ON CONFLICT(good_id) DO UPDATE SET
+        supply = excluded.supply,
+        demand = excluded.demand,
+        price = excluded.price,
+        last_price = excluded.last_price
+"""
+_UPSERT_SECTOR_SQL = """
+    INSERT INTO sectors(sector_id, capacity, efficiency, upkeep)
+    VALUES(?, ?, ?, ?)
+    ON CONFLICT(sector_id) DO UPDATE SET
+        capacity = excluded.capacity,
+        efficiency = excluded.efficiency,
+        upkeep = excluded.upkeep
+"""
+_UPSERT_POLICY_SQL = """
+    INSERT INTO active_policies(policy_id, remaining_ticks, cooldown_ticks, magnitude, state_json)
+    VALUES(?, ?, ?, ?, ?)
+    ON CONFLICT(policy_id) DO UPDATE SET
+        remaining_ticks = excluded.remaining_ticks,
+        cooldown_ticks = excluded.cooldown_ticks,
+        magnitude = excluded.magnitude,
+        state_json = excluded.state_json
+"""
+_DELETE_POLICY_SQL = "DELETE FROM active_policies WHERE policy_id = ?"
+_INSERT_UNLOCK_SQL = "INSERT INTO unlocked_policies(policy_id, unlocked_turn, source) VALUES(?, ?, ?)"
+_UPSERT_EVENT_SQL = """
+    INSERT INTO events_log(turn, event_id, summary_json)
+    VALUES(?, ?, ?)
+    ON CONFLICT(turn, event_id) DO UPDATE SET
+        summary_json = excluded.summary_json
+"""
+_UPSERT_CHECKPOINT_SQL = """
+    INSERT INTO state_checkpoints(turn, snapshot, payload)
+    VALUES(?, ?, ?)
+    ON CONFLICT(turn) DO UPDATE SET
+        snapshot = excluded.snapshot,
+        payload = excluded.payload
+"""
+# Tables with one or more rows per played turn; rewinding drops everything after the target turn.
+_TURN_TABLES = ("history", "events_log", "turn_metrics", "good_metrics", "state_checkpoints")
+
+
+ROW_TABLES = ("market", "sectors", "policies")
+# A policy's state dict takes a handful of values over its lifetime; its JSON is
+# the costly part of state_rows(), so texts are kept by (items, value types).
+_POLICY_STATE_JSON: dict[tuple[object, ...], str] = {}
+_POLICY_STATE_JSON_MAX = 4096
+
+
+def _world_row(world: WorldState) -> tuple[object, ...]:
+    return (
+        world.turn,
+        world.treasury,
+        world.population,
+        world.prosperity,
+        world.stability,
+        world.unrest,
+        world.tech_level,
+        world.last_action_ts,
+    )
+
+
+def _policy_state_json(state: dict[str, object]) -> str:
+    # Value types are part of the key: True == 1 == 1.0 but they serialize differently.
+    key = (*state.items(), *map(type, state.values()))
+    try:
+        return _POLICY_STATE_JSON[key]
+    except KeyError:
+        pass
+    except TypeError:  # an unhashable value, e.g. a list
+        return json.dumps(state, ensure_ascii=True)
+    if len(_POLICY_STATE_JSON) >= _POLICY_STATE_JSON_MAX:
+        _POLICY_STATE_JSON.clear()
+    text = _POLICY_STATE_JSON[key] = json.dumps(state, ensure_ascii=True)
+    return text
+
+
+def state_rows(state: GameState) -> dict[str, object]:
+    """Row tuples exactly as written, keyed by table; used to diff successive saves."""
+    return {
+        "world": _world_row(state.world),
+        "market": {
+            good.good_id: (good.good_id, good.supply, good.demand, good.price, good.last_price)
+            for good in state.market.values()
+        },
+        "sectors": {
+            sector.sector_id: (sector.sector_id, sector.capacity, sector.efficiency, sector.upkeep)
+            for sector in state.sectors.values()
+        },
+        "policies": {
+            runtime.policy_id: (
+                runtime.policy_id,
+                runtime.remaining_ticks,
+                runtime.cooldown_ticks,
+                runtime.magnitude,
+                _policy_state_json(runtime.state),
+            )
+            for runtime in state.active_policies.values()
+        },
+    }
+
+
+def diff_state_rows(
+    previous: dict[str, object] | None,
+    rows: dict[str, object],
+    tables: tuple[str, ...] = ROW_TABLES,
+) -> dict[str, object]:
+    """What changed from ``previous`` to ``rows`` (both shaped like :func:`state_rows`).
+
+    Holds ``world`` if that row changed, ``{row_id: row}`` of new or changed rows per
+    table and ``<table>_removed`` ids; without ``previous`` every row. ``save_state``
+    writes exactly this, and checkpoints store it.
+    """
+    if previous is None:
+        return {"world": rows["world"], **{table: rows[table] for table in tables}}
+    delta: dict[str, object] = {}
+    if previous["world"] != rows["world"]:
+        delta["world"] = rows["world"]
+    for table in tables:
+        before, after = previous[table], rows[table]
+        changed = {row_id: row for row_id, row in after.items() if before.get(row_id) != row}
+        if changed:
+            delta[table] = changed
+        removed = [row_id for row_id in before if row_id not in after]
+        if removed:
+            delta[f"{table}_removed"] = removed
+    return delta
 
 
 class StateRepository:
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
         self.conn = connect(db_path)
-        ensure_schema(self.conn)
+        self._batch_depth = 0
+        # Last rows known to be in the DB, keyed like state_rows(); None forces a full write.
+        self._persisted: dict[str, object] | None = None
+        with self.conn:
+            ensure_schema(self.conn)
+        # Meta is tiny and read many times per turn; keep it in memory and write through.
+        self._meta = load_meta(self.conn)
+        self.metrics = MetricsStore(self.conn)
+        # Most recent (turn, net_cashflow) pairs, oldest first; None until first use.
+        self._cashflow: deque[tuple[int, float]] | None = None
 
     def close(self) -> None:
         self.conn.close()
 
+    @property
+    def total_changes(self) -> int:
+        return self.conn.total_changes
+
+    def set_trace(self, callback: Callable[[str], None] | None) -> None:
+        """Call ``callback`` with every SQL statement executed; ``None`` removes it."""
+        self.conn.set_trace_callback(callback)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group all writes into one transaction; nested batches join the outermost one."""
+        self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.rollback()
+                self._persisted = None
+                self._meta = load_meta(self.conn)
+                self._cashflow = None
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.conn.commit()
+
+    def in_batch(self) -> bool:
+        return self._batch_depth > 0
+
+    def commit(self) -> None:
+        """Commit pending writes early, e.g. every K turns of a long batch."""
+        self.conn.commit()
+
+    @contextmanager
+    def _write(self) -> Iterator[None]:
+        if self._batch_depth:
+            yield
+            return
+        with self.conn:
+            yield
+
     def has_game(self) -> bool:
         row = self.conn.execute("SELECT 1 FROM world_state WHERE id = 1").fetchone()
         return row is not None
 
+    def _get_meta(self, key: str, default: str | None = None) -> str | None:
+        return self._meta.get(key, default)
+
+    def _set_meta(self, key: str, value: str) -> None:
+        if self._meta.get(key) == value:
+            return
+        with self._write():
+            set_meta(self.conn, key, value)
+        self._meta[key] = value
+
     def get_seed(self) -> int | None:
-        raw = get_meta(self.conn, "seed", None)
+        raw = self._get_meta("seed", None)
         if raw is None:
             return None
         return int(raw)
 
     def get_language(self) -> str:
-        return str(get_meta(self.conn, "language", "de") or "de")
+        return str(self._get_meta("language", "de") or "de")
 
     def set_language(self, code: str) -> None:
         normalized = (code or "").strip().lower()
-        with self.conn:
-            set_meta(self.conn, "language", "de" if normalized not in {"de", "en"} else normalized)
+        self._set_meta("language", "de" if normalized not in {"de", "en"} else normalized)
 
     def get_str_meta(self, key: str, default: str = "") -> str:
-        raw = get_meta(self.conn, key, default)
+        raw = self._get_meta(key, default)
         return str(raw if raw is not None else default)
 
     def set_str_meta(self, key: str, value: str) -> None:
-        with self.conn:
-            set_meta(self.conn, key, str(value))
+        self._set_meta(key, str(value))
+
+    def meta_values(self, keys: tuple[str, ...]) -> dict[str, str]:
+        """``{key: value}`` from the meta cache; missing keys read as ``""``."""
+        meta = self._meta
+        return {key: meta.get(key) or "" for key in keys}
 
     def get_int_meta(self, key: str, default: int = 0) -> int:
-        raw = get_meta(self.conn, key, None)
+        raw = self._get_meta(key, None)
         if raw is None:
             return default
         try:
@@ -56,8 +263,7 @@ class StateRepository:
             return default
 
     def set_int_meta(self, key: str, value: int) -> None:
-        with self.conn:
-            set_meta(self.conn, key, str(int(value)))
+        self._set_meta(key, str(int(value)))
 
     def get_bool_meta(self, key: str, default: bool = False) -> bool:
         return self.get_int_meta(key, 1 if default else 0) != 0
@@ -85,16 +291,15 @@ class StateRepository:
         return result
 
     def replace_unlocked_policies(self, policy_ids: set[str], turn: int, source: str = "reset") -> None:
-        with self.conn:
+        with self._write():
             self.conn.execute("DELETE FROM unlocked_policies")
-            for policy_id in sorted(policy_ids):
-                self.conn.execute(
-                    "INSERT INTO unlocked_policies(policy_id, unlocked_turn, source) VALUES(?, ?, ?)",
-                    (policy_id, int(turn), source),
-                )
+            self.conn.executemany(
+                _INSERT_UNLOCK_SQL,
+                [(policy_id, int(turn), source) for policy_id in sorted(policy_ids)],
+            )
 
     def unlock_policy(self, policy_id: str, turn: int, source: str = "rule") -> None:
-        with self.conn:
+        with self._write():
             self.conn.execute(
                 """
                 INSERT INTO unlocked_policies(policy_id, unlocked_turn, source)
@@ -106,18 +311,48 @@ class StateRepository:
                 (policy_id, int(turn), source),
             )
 
+    def _recent_cashflow(self) -> deque[tuple[int, float]]:
+        if self._cashflow is None:
+            rows = self.conn.execute(
+                "SELECT turn, net_cashflow FROM history ORDER BY turn DESC LIMIT ?",
+                (CASHFLOW_WINDOW,),
+            ).fetchall()
+            self._cashflow = deque(
+                ((int(row["turn"]), float(row["net_cashflow"])) for row in reversed(rows)),
+                maxlen=CASHFLOW_WINDOW,
+            )
+        return self._cashflow
+
     def trailing_cashflow(self, window: int, include_current: float = 0.0) -> float:
         if window <= 0:
             return 0.0
-        rows = self.history(limit=max(0, window - 1))
         total = float(include_current)
-        for row in rows:
-            summary = row.get("summary", {})
-            total += float(summary.get("net_cashflow", 0.0))
+        previous = window - 1
+        if previous > CASHFLOW_WINDOW:
+            rows = self.conn.execute(
+                "SELECT net_cashflow FROM history ORDER BY turn DESC LIMIT ?",
+                (previous,),
+            ).fetchall()
+            for row in rows:
+                total += float(row["net_cashflow"])
+            return total
+        # Newest first, matching the order the rows used to be summed in.
+        recent = self._recent_cashflow()
+        for index in range(len(recent) - 1, max(-1, len(recent) - 1 - previous), -1):
+            total += recent[index][1]
         return total
 
+    def cashflow_between(self, turn_a: int, turn_b: int) -> list[tuple[int, float]]:
+        """(turn, net_cashflow) pairs for ``turn_a <= turn <= turn_b``, oldest first."""
+        rows = self.conn.execute(
+            "SELECT turn, net_cashflow FROM history WHERE turn BETWEEN ? AND ? ORDER BY turn",
+            (int(turn_a), int(turn_b)),
+        ).fetchall()
+        return [(int(row["turn"]), float(row["net_cashflow"])) for row in rows]
+
     def init_new_game(self, seed: int, state: GameState) -> None:
-        with self.conn:
+        rows = state_rows(state)
+        with self._write():
             self.conn.execute("DELETE FROM world_state")
             self.conn.execute("DELETE FROM market")
             self.conn.execute("DELETE FROM sectors")
@@ -125,15 +360,17 @@ class StateRepository:
             self.conn.execute("DELETE FROM history")
             self.conn.execute("DELETE FROM events_log")
             self.conn.execute("DELETE FROM unlocked_policies")
-
-            set_meta(self.conn, "seed", str(seed))
-            set_meta(self.conn, "created_at", utc_now_iso())
-            set_meta(self.conn, "language", "de")
-            set_meta(self.conn, "collapse_active", "0")
-            set_meta(self.conn, "collapse_recovery_streak", "0")
-            set_meta(self.conn, "next_unlock_turn", "0")
-            set_meta(self.conn, "last_auto_intel_turn", "-9999")
-            set_meta(self.conn, "last_intel_hint_id", "")
+            self.conn.execute("DELETE FROM state_checkpoints")
+            self.metrics.clear()
+
+            self._set_meta("seed", str(seed))
+            self._set_meta("created_at", utc_now_iso())
+            self._set_meta("language", "de")
+            self._set_meta("collapse_active", "0")
+            self._set_meta("collapse_recovery_streak", "0")
+            self._set_meta("next_unlock_turn", "0")
+            self._set_meta("last_auto_intel_turn", "-9999")
+            self._set_meta("last_intel_hint_id", "")
 
             self.conn.execute(
                 """
@@ -141,41 +378,23 @@ class StateRepository:
                     id, turn, treasury, population, prosperity, stability, unrest, tech_level, last_action_ts
                 ) VALUES(1, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    state.world.turn,
-                    state.world.treasury,
-                    state.world.population,
-                    state.world.prosperity,
-                    state.world.stability,
-                    state.world.unrest,
-                    state.world.tech_level,
-                    state.world.last_action_ts,
-                ),
+                rows["world"],
             )
-
-            for good in state.market.values():
-                self.conn.execute(
-                    """
-                    INSERT INTO market(good_id, supply, demand, price, last_price)
-                    VALUES(?, ?, ?, ?, ?)
-                    """,
-                    (good.good_id, good.supply, good.demand, good.price, good.last_price),
-                )
-
-            for sector in state.sectors.values():
-                self.conn.execute(
-                    """
-                    INSERT INTO sectors(sector_id, capacity, efficiency, upkeep)
-                    VALUES(?, ?, ?, ?)
-                    """,
-                    (sector.sector_id, sector.capacity, sector.efficiency, sector.upkeep),
-                )
-
-            for policy_id in START_LOADOUT:
-                self.conn.execute(
-                    "INSERT INTO unlocked_policies(policy_id, unlocked_turn, source) VALUES(?, ?, ?)",
-                    (policy_id, 0, "new_game"),
-                )
+            self.conn.executemany(
+                "INSERT INTO market(good_id, supply, demand, price, last_price) VALUES(?, ?, ?, ?, ?)",
+                list(rows["market"].values()),
+            )
+            self.conn.executemany(
+                "INSERT INTO sectors(sector_id, capacity, efficiency, upkeep) VALUES(?, ?, ?, ?)",
+                list(rows["sectors"].values()),
+            )
+            self.conn.executemany(
+                _INSERT_UNLOCK_SQL,
+                [(policy_id, 0, "new_game") for policy_id in START_LOADOUT],
+            )
+        rows["policies"] = {}
+        self._persisted = rows
+        self._cashflow = deque(maxlen=CASHFLOW_WINDOW)
 
     def load_state(self, sector_io_defs: dict[str, dict[str, dict[str, float]]]) -> GameState:
         world_row = self.conn.execute("SELECT * FROM world_state WHERE id = 1").fetchone()
@@ -233,106 +452,91 @@ class StateRepository:
         ).fetchall()
         unlocked_policies = {str(row["policy_id"]) for row in unlocked_rows}
 
-        return GameState(
+        state = GameState(
             world=world,
             market=market,
             sectors=sectors,
             unlocked_policies=unlocked_policies,
             active_policies=active_policies,
         )
-
-    def save_state(self, state: GameState) -> None:
-        with self.conn:
-            self.conn.execute(
-                """
-                UPDATE world_state
-                SET turn = ?, treasury = ?, population = ?, prosperity = ?, stability = ?, unrest = ?, tech_level = ?, last_action_ts = ?
-                WHERE id = 1
-                """,
-                (
-                    state.world.turn,
-                    state.world.treasury,
-                    state.world.population,
-                    state.world.prosperity,
-                    state.world.stability,
-                    state.world.unrest,
-                    state.world.tech_level,
-                    state.world.last_action_ts,
-                ),
-            )
-
-            for good in state.market.values():
-                self.conn.execute(
-                    """
-                    INSERT INTO market(good_id, supply, demand, price, last_price)
-                    VALUES(?, ?, ?, ?, ?)
-                    ON CONFLICT(good_id) DO UPDATE SET
-                        supply = excluded.supply,
-                        demand = excluded.demand,
-                        price = excluded.price,
-                        last_price = excluded.last_price
-                    """,
-                    (good.good_id, good.supply, good.demand, good.price, good.last_price),
-                )
-
-            for sector in state.sectors.values():
-                self.conn.execute(
-                    """
-                    INSERT INTO sectors(sector_id, capacity, efficiency, upkeep)
-                    VALUES(?, ?, ?, ?)
-                    ON CONFLICT(sector_id) DO UPDATE SET
-                        capacity = excluded.capacity,
-                        efficiency = excluded.efficiency,
-                        upkeep = excluded.upkeep
-                    """,
-                    (sector.sector_id, sector.capacity, sector.efficiency, sector.upkeep),
-                )
-
-            self.conn.execute("DELETE FROM active_policies")
-            for runtime in state.active_policies.values():
-                self.conn.execute(
-                    """
-                    INSERT INTO active_policies(policy_id, remaining_ticks, cooldown_ticks, magnitude, state_json)
-                    VALUES(?, ?, ?, ?, ?)
-                    """,
-                    (
-                        runtime.policy_id,
-                        runtime.remaining_ticks,
-                        runtime.cooldown_ticks,
-                        runtime.magnitude,
-                        json.dumps(runtime.state, ensure_ascii=True),
-                    ),
-                )
+        if not self.in_batch():
+            # Inside a batch the rows read may still be rolled back, so only
+            # trust them as the persisted baseline outside of one.
+            self._persisted = state_rows(state)
+        return state
+
+    def save_state(self, state: GameState, rows: dict[str, object] | None = None) -> dict[str, object] | None:
+        """Persist ``state``, writing only rows that differ from the last persisted snapshot.
+
+        ``rows`` may pass ``state_rows(state)`` when the caller already built it. Returns
+        the changes written (see :func:`diff_state_rows`), or None after a full write.
+        """
+        rows = rows if rows is not None else state_rows(state)
+        previous = self._persisted
+        delta = diff_state_rows(previous, rows)
+        with self._write():
+            if "world" in delta:
+                self.conn.execute(_UPDATE_WORLD_SQL, delta["world"])
+            if "market" in delta:
+                self.conn.executemany(_UPSERT_MARKET_SQL, delta["market"].values())
+            if "sectors" in delta:
+                self.conn.executemany(_UPSERT_SECTOR_SQL, delta["sectors"].values())
+            if previous is None:
+                self.conn.execute("DELETE FROM active_policies")
+            if "policies_removed" in delta:
+                self.conn.executemany(_DELETE_POLICY_SQL, [(policy_id,) for policy_id in delta["policies_removed"]])
+            if "policies" in delta:
+                self.conn.executemany(_UPSERT_POLICY_SQL, delta["policies"].values())
+        self._persisted = rows
+        return delta if previous is not None else None
 
     def append_history(self, turn: int, action: str, cost: int, summary: dict[str, object]) -> None:
-        with self.conn:
+        net_cashflow = float(summary.get("net_cashflow", 0.0))
+        with self._write():
             self.conn.execute(
                 """
-                INSERT INTO history(turn, ts, action, cost, summary_json)
-                VALUES(?, ?, ?, ?, ?)
+                INSERT INTO history(turn, ts, action, cost, summary_json, net_cashflow)
+                VALUES(?, ?, ?, ?, ?, ?)
                 ON CONFLICT(turn) DO UPDATE SET
                     ts = excluded.ts,
                     action = excluded.action,
                     cost = excluded.cost,
-                    summary_json = excluded.summary_json
+                    summary_json = excluded.summary_json,
+                    net_cashflow = excluded.net_cashflow
                 """,
-                (turn, utc_now_iso(), action, cost, json.dumps(summary, ensure_ascii=True)),
+                (turn, utc_now_iso(), action, cost, json.dumps(summary, ensure_ascii=True), net_cashflow),
             )
+        if self._cashflow is not None:
+            if self._cashflow and self._cashflow[-1][0] >= turn:
+                # Out-of-order rewrite; reload the window on next use.
+                self._cashflow = None
+            else:
+                self._cashflow.append((int(turn), net_cashflow))
+
+    def record_metrics(
+        self,
+        turn: int,
+        world: WorldState,
+        market: dict[str, MarketGood],
+        inflation: float,
+        volatility: float,
+        net_cashflow: float,
+        shortage_count: int,
+    ) -> None:
+        with self._write():
+            self.metrics.record(turn, world, market, inflation, volatility, net_cashflow, shortage_count)
+
+    def metrics_between(self, turn_a: int, turn_b: int, fields: list[str] | None = None) -> dict[str, list[object]]:
+        return self.metrics.metrics_between(turn_a, turn_b, fields)
 
     def append_events(self, turn: int, events: list[dict[str, object]]) -> None:
         if not events:
             return
-        with self.conn:
-            for event in events:
-                self.conn.execute(
-                    """
-                    INSERT INTO events_log(turn, event_id, summary_json)
-                    VALUES(?, ?, ?)
-                    ON CONFLICT(turn, event_id) DO UPDATE SET
-                        summary_json = excluded.summary_json
-                    """,
-                    (turn, str(event["id"]), json.dumps(event, ensure_ascii=True)),
-                )
+        with self._write():
+            self.conn.executemany(
+                _UPSERT_EVENT_SQL,
+                [(turn, str(event["id"]), json.dumps(event, ensure_ascii=True)) for event in events],
+            )
 
     def history(self, limit: int = 20) -> list[dict[str, object]]:
         rows = self.conn.execute(
@@ -363,3 +567,50 @@ class StateRepository:
             event["turn"] = int(row["turn"])
             out.append(event)
         return out
+
+    def record_checkpoint(self, turn: int, snapshot: bool, payload: bytes) -> None:
+        with self._write():
+            self.conn.execute(_UPSERT_CHECKPOINT_SQL, (int(turn), 1 if snapshot else 0, payload))
+
+    def checkpoint_chain(self, turn: int) -> list[tuple[int, bool, bytes]]:
+        """The nearest snapshot at or before ``turn`` and every checkpoint after it, oldest first."""
+        row = self.conn.execute(
+            "SELECT MAX(turn) AS turn FROM state_checkpoints WHERE snapshot = 1 AND turn <= ?",
+            (int(turn),),
+        ).fetchone()
+        if row is None or row["turn"] is None:
+            return []
+        rows = self.conn.execute(
+            "SELECT turn, snapshot, payload FROM state_checkpoints WHERE turn BETWEEN ? AND ? ORDER BY turn",
+            (int(row["turn"]), int(turn)),
+        ).fetchall()
+        return [(int(row["turn"]), bool(row["snapshot"]), bytes(row["payload"])) for row in rows]
+
+    def restore_checkpoint(
+        self,
+        turn: int,
+        state: GameState,
+        unlocked: dict[str, tuple[int, str]],
+        meta: dict[str, str],
+    ) -> None:
+        """Make ``state`` current and forget every turn after ``turn``."""
+        with self.batch():
+            for table in _TURN_TABLES:
+                self.conn.execute(f"DELETE FROM {table} WHERE turn > ?", (int(turn),))
+            self._persisted = None
+            self.save_state(state)
+            self.conn.execute("DELETE FROM unlocked_policies")
+            self.conn.executemany(
+                _INSERT_UNLOCK_SQL,
+                [(policy_id, int(unlocked_turn), source) for policy_id, (unlocked_turn, source) in unlocked.items()],
+            )
+            for key, value in meta.items():
+                self._set_meta(key, value)
+        self._cashflow = None
+
+    def fork(self, db_path: Path | None = None) -> StateRepository:
+        """Copy of this database at ``db_path``, or in an in-memory SQLite database."""
+        clone = StateRepository(db_path if db_path is not None else Path(":memory:"))
+        self.conn.backup(clone.conn)
+        clone._meta = load_meta(clone.conn)
+        return clone
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import json
 import sqlite3
 
-SCHEMA_VERSION = 3
+SCHEMA_VERSION = 6
 
 
 def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
@@ -19,14 +20,24 @@ def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
 
 
 def get_meta(conn: sqlite3.Connection, key: str, default: str | None = None) -> str | None:
-    if not _table_exists(conn, "meta"):
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    except sqlite3.OperationalError:
+        # Pre-schema databases have no meta table yet.
         return default
-    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
     if row is None:
         return default
     return str(row["value"])
 
 
+def load_meta(conn: sqlite3.Connection) -> dict[str, str]:
+    try:
+        rows = conn.execute("SELECT key, value FROM meta").fetchall()
+    except sqlite3.OperationalError:
+        return {}
+    return {str(row["key"]): str(row["value"]) for row in rows}
+
+
 def set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
     conn.execute(
         "INSERT INTO meta(key, value) VALUES(?, ?) "
@@ -35,6 +46,51 @@ def set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
     )
 
 
+def _create_metrics_tables(conn: sqlite3.Connection) -> None:
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS turn_metrics(
+            turn INTEGER PRIMARY KEY,
+            treasury INTEGER NOT NULL,
+            population INTEGER NOT NULL,
+            prosperity REAL NOT NULL,
+            stability REAL NOT NULL,
+            unrest REAL NOT NULL,
+            tech_level REAL NOT NULL,
+            inflation REAL NOT NULL,
+            volatility REAL NOT NULL,
+            net_cashflow REAL NOT NULL,
+            shortage_count INTEGER NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS good_metrics(
+            good_id TEXT NOT NULL,
+            turn INTEGER NOT NULL,
+            price REAL NOT NULL,
+            supply REAL NOT NULL,
+            demand REAL NOT NULL,
+            PRIMARY KEY(good_id, turn)
+        ) WITHOUT ROWID;
+
+        CREATE INDEX IF NOT EXISTS idx_good_metrics_turn ON good_metrics(turn);
+        """
+    )
+
+
+def _create_checkpoint_table(conn: sqlite3.Connection) -> None:
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS state_checkpoints(
+            turn INTEGER PRIMARY KEY,
+            snapshot INTEGER NOT NULL,
+            payload BLOB NOT NULL
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_state_checkpoints_snapshot ON state_checkpoints(snapshot, turn);
+        """
+    )
+
+
 def create_schema(conn: sqlite3.Connection) -> None:
     conn.executescript(
         """
@@ -83,7 +139,8 @@ def create_schema(conn: sqlite3.Connection) -> None:
             ts TEXT NOT NULL,
             action TEXT NOT NULL,
             cost INTEGER NOT NULL,
-            summary_json TEXT NOT NULL
+            summary_json TEXT NOT NULL,
+            net_cashflow REAL NOT NULL DEFAULT 0
         );
 
         CREATE TABLE IF NOT EXISTS events_log(
@@ -100,6 +157,8 @@ def create_schema(conn: sqlite3.Connection) -> None:
         );
         """
     )
+    _create_metrics_tables(conn)
+    _create_checkpoint_table(conn)
     set_meta(conn, "language", "de")
     set_meta(conn, "collapse_active", "0")
     set_meta(conn, "collapse_recovery_streak", "0")
@@ -171,6 +230,32 @@ def migrate_to_v3(conn: sqlite3.Connection) -> None:
         set_meta(conn, "last_auto_intel_turn", "-9999")
 
 
+def migrate_to_v4(conn: sqlite3.Connection) -> None:
+    if _column_exists(conn, "history", "net_cashflow"):
+        return
+    conn.execute("ALTER TABLE history ADD COLUMN net_cashflow REAL NOT NULL DEFAULT 0;")
+    rows = conn.execute("SELECT turn, summary_json FROM history").fetchall()
+    updates: list[tuple[float, int]] = []
+    for row in rows:
+        try:
+            summary = json.loads(str(row["summary_json"]))
+            value = float(summary.get("net_cashflow", 0.0))
+        except (ValueError, TypeError, AttributeError):
+            value = 0.0
+        updates.append((value, int(row["turn"])))
+    conn.executemany("UPDATE history SET net_cashflow = ? WHERE turn = ?", updates)
+
+
+def migrate_to_v5(conn: sqlite3.Connection) -> None:
+    # Metrics start with the first turn played after the upgrade; older turns keep only history JSON.
+    _create_metrics_tables(conn)
+
+
+def migrate_to_v6(conn: sqlite3.Connection) -> None:
+    # Older games have no checkpoints; the first turn played after the upgrade writes a snapshot.
+    _create_checkpoint_table(conn)
+
+
 def ensure_schema(conn: sqlite3.Connection) -> None:
     if not _table_exists(conn, "meta"):
         create_schema(conn)
@@ -187,6 +272,18 @@ def ensure_schema(conn: sqlite3.Connection) -> None:
         migrate_to_v3(conn)
         version = 3
 
+    if version < 4:
+        migrate_to_v4(conn)
+        version = 4
+
+    if version < 5:
+        migrate_to_v5(conn)
+        version = 5
+
+    if version < 6:
+        migrate_to_v6(conn)
+        version = 6
+
     if version < SCHEMA_VERSION:
         create_schema(conn)
         version = SCHEMA_VERSION
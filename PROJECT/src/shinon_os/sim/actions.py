@@ -44,11 +44,11 @@ def validate_target(policy: PolicyDefinition, target: str | None, bundle: DataBu
     if target is None:
         return "INVALID PARAM missing target"
     if policy.target_type == "sector":
-        if target not in bundle.sector_ids():
+        if target not in bundle.sector_id_set:
             return "INVALID PARAM unknown sector target"
         return None
     if policy.target_type == "good":
-        if target not in bundle.goods_by_id():
+        if target not in bundle.goods_index:
             return "INVALID PARAM unknown good target"
         return None
     return None
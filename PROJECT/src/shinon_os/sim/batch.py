@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+
+@dataclass(frozen=True)
+class ScriptedAction:
+    policy_id: str
+    magnitude: float | None = None
+    target: str | None = None
+
+
+def parse_action(row: dict[str, Any]) -> ScriptedAction:
+    policy_id = str(row.get("policy_id", "")).strip().upper()
+    if not policy_id:
+        raise ValueError("Scripted action missing field: policy_id")
+    raw_magnitude = row.get("magnitude")
+    raw_target = row.get("target")
+    return ScriptedAction(
+        policy_id=policy_id,
+        magnitude=None if raw_magnitude is None else float(raw_magnitude),
+        target=None if raw_target in (None, "") else str(raw_target).strip().lower(),
+    )
+
+
+def iter_script(path: Path) -> Iterator[ScriptedAction]:
+    """Stream actions from a JSONL script; blank lines and `#` comments are skipped."""
+    with path.open("r", encoding="utf-8") as fh:
+        for line_no, line in enumerate(fh, start=1):
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            try:
+                row = json.loads(stripped)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}:{line_no}: invalid JSON ({exc.msg})") from exc
+            if not isinstance(row, dict):
+                raise ValueError(f"{path}:{line_no}: expected a JSON object")
+            try:
+                yield parse_action(row)
+            except ValueError as exc:
+                raise ValueError(f"{path}:{line_no}: {exc}") from exc
+
+
+def load_script(path: Path) -> list[ScriptedAction]:
+    return list(iter_script(path))
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from shinon_os.sim.model import MarketGood, SectorState, WorldState
-from shinon_os.util.rng import bounded_noise
+from shinon_os.util.rng import noise_vector
 
 
 def clamp(value: float, low: float, high: float) -> float:
@@ -27,6 +27,7 @@ def simulate_market(
 ) -> dict[str, MarketGood]:
     k_demand = float(economy_cfg.get("k_demand", 0.35))
     noise_amplitude = float(economy_cfg.get("noise_amplitude", 0.01))
+    rng_mode = str(economy_cfg.get("rng_mode", "compat"))
     eps = 1e-6
 
     updated: dict[str, MarketGood] = {}
@@ -67,12 +68,12 @@ def simulate_market(
         if good_id in updated:
             updated[good_id].demand *= max(0.1, 1.0 + float(multiplier_add))
 
-    for good_id, item in updated.items():
+    noises = noise_vector(seed, turn, updated, amplitude=noise_amplitude, mode=rng_mode)
+    for (good_id, item), noise in zip(updated.items(), noises):
         prev_price = market[good_id].price
         ratio = item.demand / max(item.supply, eps)
         target = clamp(ratio, 0.5, 2.0)
         trend = lerp(1.0, target, k_demand)
-        noise = bounded_noise(seed, turn, good_id, amplitude=noise_amplitude)
         price = prev_price * trend * (1.0 + noise)
         event_price_add = float(effects.get("good_price_mult", {}).get(good_id, 0.0))
         price *= max(0.1, 1.0 + event_price_add)
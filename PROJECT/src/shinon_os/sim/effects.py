@@ -0,0 +1,166 @@
+"""Policy effects compiled to flat ``(channel, slot, coefficient)`` terms.
+
+Every keyed effect (world field, sector, good) and every scalar owns one slot in a
+flat buffer laid out by :class:`EffectLayout`. ``compile_policy_effects`` turns a
+policy's raw ``effects`` dict into terms once at load time; per turn,
+:class:`PolicyEffectAccumulator` only multiplies and adds into the buffer. Terms
+keep the raw dict order and every slot starts at ``0.0``, so each sum sees the
+same additions in the same order as the old dict walk and is bit-identical.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping, Sequence
+
+from shinon_os.sim.model import PolicyRuntime
+
+# Output keys of the aggregated effects dict (the shape simulate_market reads).
+WORLD_ADD = "world_add"
+SECTOR_OUTPUT = "sector_output_mult"
+SECTOR_EFFICIENCY = "sector_efficiency_add"
+GOOD_SUPPLY = "good_supply_add"
+GOOD_DEMAND = "good_demand_mult"
+TREASURY_INCOME = "treasury_income"
+TREASURY_UPKEEP = "treasury_upkeep"
+GLOBAL_OUTPUT = "global_output_mult"
+SHORTAGE_UNREST = "shortage_unrest_factor_add"
+IMPORT_COST = "import_cost"
+# Pseudo channel: sets the unit price charged for the following good_supply_add terms.
+IMPORT_UNIT_COST = "import_cost_per_unit"
+
+WORLD_EFFECT_FIELDS = ("turn", "treasury", "population", "prosperity", "stability", "unrest", "tech_level")
+KEYED_CHANNELS = (WORLD_ADD, SECTOR_OUTPUT, SECTOR_EFFICIENCY, GOOD_SUPPLY, GOOD_DEMAND)
+SCALAR_CHANNELS = (TREASURY_INCOME, TREASURY_UPKEEP, GLOBAL_OUTPUT, SHORTAGE_UNREST, IMPORT_COST)
+# Raw policy key -> scalar channel, in the order the engine always applied them.
+_SCALAR_SOURCES = (
+    ("treasury_income_per_turn", TREASURY_INCOME),
+    ("treasury_upkeep_per_turn", TREASURY_UPKEEP),
+    ("global_output_mult", GLOBAL_OUTPUT),
+    ("shortage_unrest_factor_add", SHORTAGE_UNREST),
+)
+
+# Slot placeholder for a ``"target"`` key; resolved per runtime from its target id.
+TARGET_SLOT = -1
+
+EffectTerm = tuple[str, int, float]
+
+
+class EffectLayout:
+    """Flat slot numbering for one bundle: world fields, sectors x2, goods x2, scalars."""
+
+    def __init__(self, good_ids: Sequence[str], sector_ids: Sequence[str]) -> None:
+        spaces: list[tuple[str, Sequence[str]]] = [
+            (WORLD_ADD, WORLD_EFFECT_FIELDS),
+            (SECTOR_OUTPUT, sector_ids),
+            (SECTOR_EFFICIENCY, sector_ids),
+            (GOOD_SUPPLY, good_ids),
+            (GOOD_DEMAND, good_ids),
+        ]
+        spaces.extend((channel, (channel,)) for channel in SCALAR_CHANNELS)
+        self.channel_of: list[str] = []
+        self.key_of: list[str] = []
+        self.slots: dict[str, dict[str, int]] = {}
+        for channel, keys in spaces:
+            index = self.slots.setdefault(channel, {})
+            for key in keys:
+                index[key] = len(self.key_of)
+                self.channel_of.append(channel)
+                self.key_of.append(key)
+        self.size = len(self.key_of)
+
+    def slot(self, channel: str, key: str) -> int:
+        return self.slots[channel][key]
+
+
+def compile_policy_effects(policy_id: str, effects: Mapping[str, Any], layout: EffectLayout) -> tuple[EffectTerm, ...]:
+    """Terms in the order the engine applies them; keyed sections keep their dict order."""
+    terms: list[EffectTerm] = []
+
+    def keyed(channel: str) -> None:
+        for key, value in effects.get(channel, {}).items():
+            if key == "target":
+                terms.append((channel, TARGET_SLOT, float(value)))
+                continue
+            slot = layout.slots[channel].get(key)
+            if slot is None:
+                raise ValueError(f"Policy {policy_id} {channel} references unknown id: {key}")
+            terms.append((channel, slot, float(value)))
+
+    keyed(WORLD_ADD)
+    for source, channel in _SCALAR_SOURCES:
+        if source in effects:
+            terms.append((channel, layout.slot(channel, channel), float(effects[source])))
+    keyed(SECTOR_OUTPUT)
+    keyed(SECTOR_EFFICIENCY)
+    if GOOD_SUPPLY in effects:
+        terms.append((IMPORT_UNIT_COST, layout.slot(IMPORT_COST, IMPORT_COST), float(effects.get(IMPORT_UNIT_COST, 0.0))))
+    keyed(GOOD_SUPPLY)
+    keyed(GOOD_DEMAND)
+    return tuple(terms)
+
+
+class PolicyEffectAccumulator:
+    """Sparse multiply-add of compiled terms into one preallocated buffer."""
+
+    def __init__(self, layout: EffectLayout) -> None:
+        self.layout = layout
+        self._values = [0.0] * layout.size
+        self._touched = bytearray(layout.size)
+        self._import_slot = layout.slot(IMPORT_COST, IMPORT_COST)
+        self._scalar_slots = [(channel, layout.slot(channel, channel)) for channel in SCALAR_CHANNELS]
+        self._first_scalar = self._scalar_slots[0][1]
+
+    def collect(self, runtimes: Iterable[PolicyRuntime], policies: Mapping[str, Any]) -> dict[str, Any]:
+        """``policies`` maps policy ids to definitions carrying ``effect_terms``."""
+        values = self._values
+        touched = self._touched
+        order: list[int] = []
+        slots = self.layout.slots
+        import_slot = self._import_slot
+        for runtime in runtimes:
+            if runtime.remaining_ticks <= 0:
+                continue
+            magnitude = runtime.magnitude
+            target = runtime.state.get("target")
+            unit_cost = 0.0
+            for channel, slot, coefficient in policies[runtime.policy_id].effect_terms:
+                if channel == IMPORT_UNIT_COST:
+                    unit_cost = coefficient
+                    continue
+                if slot == TARGET_SLOT:
+                    if not target:
+                        continue
+                    slot = slots[channel].get(target, TARGET_SLOT)
+                    if slot == TARGET_SLOT:
+                        continue
+                if channel == TREASURY_UPKEEP:
+                    value = abs(magnitude) * coefficient
+                else:
+                    value = coefficient * magnitude
+                if not touched[slot]:
+                    touched[slot] = 1
+                    order.append(slot)
+                values[slot] += value
+                if channel == GOOD_SUPPLY and unit_cost > 0:
+                    if not touched[import_slot]:
+                        touched[import_slot] = 1
+                        order.append(import_slot)
+                    values[import_slot] += max(0.0, value) * unit_cost
+        return self._drain(order)
+
+    def _drain(self, order: list[int]) -> dict[str, Any]:
+        """Build the effects dict from touched slots (first-touch order) and zero them."""
+        values = self._values
+        touched = self._touched
+        channel_of = self.layout.channel_of
+        key_of = self.layout.key_of
+        effects: dict[str, Any] = {channel: {} for channel in KEYED_CHANNELS}
+        for channel, slot in self._scalar_slots:
+            effects[channel] = values[slot]
+        effects["good_price_mult"] = {}
+        first_scalar = self._first_scalar
+        for slot in order:
+            if slot < first_scalar:
+                effects[channel_of[slot]][key_of[slot]] = values[slot]
+            values[slot] = 0.0
+            touched[slot] = 0
+        return effects
@@ -1,27 +1,65 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Any
+from pathlib import Path
+from typing import Any, Iterable
 
 from shinon_os.i18n import t
-from shinon_os.persistence.repo import START_LOADOUT, StateRepository
+from shinon_os.persistence.base import Repository
+from shinon_os.persistence.checkpoints import (
+    SIM_META_KEYS,
+    CheckpointRows,
+    diff_rows,
+    encode_checkpoint,
+    replay_checkpoints,
+    state_from_rows,
+)
+from shinon_os.persistence.repo import START_LOADOUT, state_rows
 from shinon_os.sim.actions import validate_action
+from shinon_os.sim.batch import ScriptedAction
 from shinon_os.sim.economy import clamp, simulate_market
-from shinon_os.sim.events import apply_event, choose_event
+from shinon_os.sim.effects import PolicyEffectAccumulator
+from shinon_os.sim.events import EventIndex, apply_event, choose_event
+from shinon_os.sim.market_vector import VectorMarketEngine
 from shinon_os.sim.metrics import compute_derived_metrics
 from shinon_os.sim.model import GameState, PolicyRuntime, SimResult, WorldState
 from shinon_os.sim.worldgen import DataBundle, build_initial_state
 from shinon_os.util.logging_setup import JsonlRotatingLogger
+from shinon_os.util.profiling import NULL_PROFILER, NullProfiler, TurnProfiler
 from shinon_os.util.timeutil import utc_now_iso
 
 EMERGENCY_POLICY_IDS = {"SOS_CREDIT", "RATIONING_PLUS"}
+# Turns between full snapshots; every other turn stores only the rows that changed.
+DEFAULT_SNAPSHOT_EVERY = 100
 
 
 class SimulationEngine:
-    def __init__(self, bundle: DataBundle, repo: StateRepository, logger: JsonlRotatingLogger) -> None:
+    def __init__(
+        self,
+        bundle: DataBundle,
+        repo: Repository,
+        logger: JsonlRotatingLogger,
+        autoflush: bool = True,
+        snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+    ) -> None:
+        if snapshot_every < 0:
+            raise ValueError("snapshot_every must be >= 0 (0 disables checkpoints)")
         self.bundle = bundle
         self.repo = repo
         self.logger = logger
+        self.autoflush = autoflush
+        self.snapshot_every = snapshot_every
+        self._state: GameState | None = None
+        # Rows of the last checkpoint written; None makes the next one a full snapshot.
+        self._checkpoint: CheckpointRows | None = None
+        # True while the repository's state rows are exactly those of _checkpoint.
+        self._checkpoint_saved = False
+        self._dirty = False
+        self._version = 0
+        market_engine = str(bundle.config["economy"].get("market_engine", "reference"))
+        self._vector_market = VectorMarketEngine(bundle) if market_engine == "vector" else None
+        self._event_index = EventIndex(bundle.events)
+        self._effect_accumulator = PolicyEffectAccumulator(bundle.effect_layout)
+        self.profiler: TurnProfiler | NullProfiler = NULL_PROFILER
 
     def ensure_game(self, seed: int = 42) -> None:
         if not self.repo.has_game():
@@ -31,9 +69,62 @@ class SimulationEngine:
         state = build_initial_state(self.bundle)
         state.unlocked_policies = set(START_LOADOUT)
         self.repo.init_new_game(seed=seed, state=state)
+        # Drop the cache so the next read picks up the canonical DB row order;
+        # iteration order feeds float sums, so it must not depend on how the
+        # state was created.
+        self.invalidate()
+        if self.snapshot_every > 0:
+            # Turn 0 anchors every later delta; read it without warming the cache.
+            state = self.repo.load_state(self.bundle.sector_io_index)
+            self._record_checkpoint(state_rows(state), state.unlocked_policies)
+            self._checkpoint_saved = True
 
     def load_state(self) -> GameState:
-        return self.repo.load_state(self.bundle.sector_io_defs())
+        """Return the authoritative in-memory state, loading it only when the cache is cold.
+
+        The returned object is shared: callers that mutate it are mutating the
+        engine state and should call :meth:`mark_dirty` (or save it themselves).
+        """
+        if self._state is None:
+            self._state = self.repo.load_state(self.bundle.sector_io_index)
+            self._dirty = False
+        return self._state
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    @property
+    def state_version(self) -> int:
+        """Bumped whenever the game state may have changed; cheap key for derived caches."""
+        return self._version
+
+    def mark_dirty(self) -> None:
+        if self._state is not None:
+            self._dirty = True
+            self._version += 1
+
+    def flush(self) -> None:
+        """Write the cached state back to the repository if it changed since the last flush."""
+        self._save()
+
+    def _save(self, rows: dict[str, object] | None = None) -> dict[str, object] | None:
+        """``flush`` with prebuilt ``state_rows()``; returns the row delta ``save_state`` wrote."""
+        if self._state is None or not self._dirty:
+            return None
+        # Anything saved outside a turn is not in the last checkpoint.
+        self._checkpoint_saved = False
+        written = self.repo.save_state(self._state, rows)
+        self._dirty = False
+        return written
+
+    def invalidate(self) -> None:
+        """Forget the cached state without writing it; the next read goes to the repository."""
+        self._state = None
+        self._dirty = False
+        self._version += 1
+        self._checkpoint = None
+        self._checkpoint_saved = False
 
     def collapse_active(self) -> bool:
         return self.repo.get_bool_meta("collapse_active", False)
@@ -180,70 +271,26 @@ class SimulationEngine:
         return {"id": hint_id, "text": t(hint_def.text_key)}
 
     def _collect_policy_effects(self, state: GameState) -> dict[str, Any]:
-        effects: dict[str, Any] = {
-            "world_add": {},
-            "treasury_income": 0.0,
-            "treasury_upkeep": 0.0,
-            "global_output_mult": 0.0,
-            "sector_output_mult": {},
-            "sector_efficiency_add": {},
-            "good_supply_add": {},
-            "good_demand_mult": {},
-            "good_price_mult": {},
-            "import_cost": 0.0,
-            "shortage_unrest_factor_add": 0.0,
-        }
-
-        def add_map(target: dict[str, float], key: str, value: float) -> None:
-            target[key] = float(target.get(key, 0.0) + value)
+        effects = self._effect_accumulator.collect(state.active_policies.values(), self.bundle.policies)
 
+        # Capacity builds mutate sectors once after their delay, so they stay outside the terms.
         for runtime in state.active_policies.values():
             if runtime.remaining_ticks <= 0:
                 continue
-            definition = self.bundle.policies[runtime.policy_id]
+            definition_effects = self.bundle.policies[runtime.policy_id].effects
+            if "sector_capacity_add" not in definition_effects:
+                continue
             magnitude = runtime.magnitude
             target = runtime.state.get("target")
-            definition_effects = definition.effects
-
-            for key, value in definition_effects.get("world_add", {}).items():
-                add_map(effects["world_add"], key, float(value) * magnitude)
-
-            effects["treasury_income"] += float(definition_effects.get("treasury_income_per_turn", 0.0)) * magnitude
-            effects["treasury_upkeep"] += abs(magnitude) * float(definition_effects.get("treasury_upkeep_per_turn", 0.0))
-            effects["global_output_mult"] += float(definition_effects.get("global_output_mult", 0.0)) * magnitude
-            effects["shortage_unrest_factor_add"] += float(definition_effects.get("shortage_unrest_factor_add", 0.0)) * magnitude
-
-            for key, value in definition_effects.get("sector_output_mult", {}).items():
-                resolved = target if key == "target" else key
-                if resolved:
-                    add_map(effects["sector_output_mult"], resolved, float(value) * magnitude)
-            for key, value in definition_effects.get("sector_efficiency_add", {}).items():
-                resolved = target if key == "target" else key
-                if resolved:
-                    add_map(effects["sector_efficiency_add"], resolved, float(value) * magnitude)
-            for key, value in definition_effects.get("good_supply_add", {}).items():
-                resolved = target if key == "target" else key
-                if resolved:
-                    amount = float(value) * magnitude
-                    add_map(effects["good_supply_add"], resolved, amount)
-                    unit_cost = float(definition_effects.get("import_cost_per_unit", 0.0))
-                    if unit_cost > 0:
-                        effects["import_cost"] += max(0.0, amount) * unit_cost
-            for key, value in definition_effects.get("good_demand_mult", {}).items():
-                resolved = target if key == "target" else key
-                if resolved:
-                    add_map(effects["good_demand_mult"], resolved, float(value) * magnitude)
-
             delay = int(runtime.state.get("delay_left", 0))
-            if "sector_capacity_add" in definition_effects:
-                if delay > 0:
-                    runtime.state["delay_left"] = delay - 1
-                elif not bool(runtime.state.get("capacity_applied", False)):
-                    for key, value in definition_effects.get("sector_capacity_add", {}).items():
-                        resolved = target if key == "target" else key
-                        if resolved and resolved in state.sectors:
-                            state.sectors[resolved].capacity += float(value) * magnitude
-                    runtime.state["capacity_applied"] = True
+            if delay > 0:
+                runtime.state["delay_left"] = delay - 1
+            elif not bool(runtime.state.get("capacity_applied", False)):
+                for key, value in definition_effects.get("sector_capacity_add", {}).items():
+                    resolved = target if key == "target" else key
+                    if resolved and resolved in state.sectors:
+                        state.sectors[resolved].capacity += float(value) * magnitude
+                runtime.state["capacity_applied"] = True
 
         return effects
 
@@ -265,7 +312,7 @@ class SimulationEngine:
             del state.active_policies[policy_id]
 
     def _invalid_result(self, world: WorldState, message: str) -> SimResult:
-        snapshot = deepcopy(world)
+        snapshot = world.snapshot()
         return SimResult(
             ok=False,
             message=message,
@@ -329,178 +376,359 @@ class SimulationEngine:
         self.repo.set_int_meta("collapse_recovery_streak", recovery_streak)
         return collapse_active
 
+    def enable_profiling(self, limit: int = 10_000) -> TurnProfiler:
+        """Start timing turn phases; returns the active profiler (kept if already on)."""
+        if not isinstance(self.profiler, TurnProfiler):
+            self.profiler = TurnProfiler(limit=limit)
+            self.profiler.attach(self.repo)
+        return self.profiler
+
+    def disable_profiling(self) -> TurnProfiler | None:
+        """Stop profiling; returns the profiler that was active so its data can still be exported."""
+        profiler = self.profiler
+        self.profiler = NULL_PROFILER
+        if isinstance(profiler, TurnProfiler):
+            profiler.detach()
+            return profiler
+        return None
+
     def advance_turn(self, policy_id: str, magnitude: float | None, target: str | None) -> SimResult:
+        profiler = self.profiler
+        profiler.begin_turn()
         try:
+            with self.repo.batch():
+                result = self._advance_turn(policy_id, magnitude, target)
+        except Exception as exc:
+            self.logger.error({"where": "SimulationEngine.advance_turn", "error": repr(exc)})
+            # The cached state may be half-mutated; drop it.
+            self.invalidate()
+            if not self.autoflush or self.repo.in_batch():
+                # Unflushed turns or an enclosing batch: the repository no longer
+                # matches what the caller played, so reloading would silently
+                # rewind. Let the caller's batch roll back instead.
+                raise
+            # Every earlier turn was flushed and this turn's writes were rolled
+            # back, so the repository holds exactly the pre-turn state.
             state = self.load_state()
-            seed = self.repo.get_seed()
-            if seed is None:
-                return self._invalid_result(state.world, "INVALID PARAM missing seed in DB")
-
-            policy = self.bundle.policies.get(policy_id)
-            if policy is None:
-                return self._invalid_result(state.world, "INVALID PARAM unknown policy")
-            if not self._policy_unlocked(state, policy_id):
-                return self._invalid_result(state.world, "INVALID PARAM policy is locked")
-
-            action, error = validate_action(state=state, bundle=self.bundle, policy=policy, raw_magnitude=magnitude, target=target)
-            if error:
-                return self._invalid_result(state.world, error)
-            assert action is not None
-
-            world_before = deepcopy(state.world)
-            market_before = deepcopy(state.market)
-
-            state.world.treasury -= action.immediate_cost
-            state.active_policies[action.policy_id] = PolicyRuntime(
-                policy_id=action.policy_id,
-                remaining_ticks=policy.duration_ticks,
-                cooldown_ticks=0,
-                magnitude=action.magnitude,
-                state={
-                    "target": action.target,
-                    "delay_left": int(policy.effects.get("capacity_delay", 0)),
-                    "capacity_applied": False,
-                },
-            )
+            return self._invalid_result(state.world, f"INVALID PARAM internal error: {exc}")
+        profiler.split("commit")
+        profiler.end_turn(result.world_after.turn, result.ok)
+        return result
+
+    def advance_turns(self, actions: Iterable[ScriptedAction], commit_every: int = 0) -> list[SimResult]:
+        """Apply scripted actions in memory and commit once for the whole batch.
+
+        With ``commit_every > 0`` the state is flushed and committed every K
+        applied actions as well, which bounds the work lost on a crash.
+        """
+        results: list[SimResult] = []
+        autoflush = self.autoflush
+        self.autoflush = False
+        try:
+            with self.repo.batch():
+                profiler = self.profiler
+                for index, action in enumerate(actions, start=1):
+                    profiler.begin_turn()
+                    result = self._advance_turn(action.policy_id, action.magnitude, action.target)
+                    results.append(result)
+                    if commit_every > 0 and index % commit_every == 0:
+                        self.flush()
+                        self.repo.commit()
+                        profiler.split("commit")
+                    profiler.end_turn(result.world_after.turn, result.ok)
+                self.flush()
+        except BaseException:
+            # The batch was rolled back, so the cache is ahead of the DB.
+            self.invalidate()
+            raise
+        finally:
+            self.autoflush = autoflush
+        return results
+
+    def _advance_turn(self, policy_id: str, magnitude: float | None, target: str | None) -> SimResult:
+        # Each split() closes the phase that just ran; a no-op unless profiling is on.
+        # Errors propagate so the enclosing batch rolls back; advance_turn decides
+        # whether they can be turned into an invalid result.
+        split = self.profiler.split
+        state = self.load_state()
+        seed = self.repo.get_seed()
+        if seed is None:
+            return self._invalid_result(state.world, "INVALID PARAM missing seed in DB")
+
+        policy = self.bundle.policies.get(policy_id)
+        if policy is None:
+            return self._invalid_result(state.world, "INVALID PARAM unknown policy")
+        if not self._policy_unlocked(state, policy_id):
+            return self._invalid_result(state.world, "INVALID PARAM policy is locked")
+
+        action, error = validate_action(state=state, bundle=self.bundle, policy=policy, raw_magnitude=magnitude, target=target)
+        if error:
+            return self._invalid_result(state.world, error)
+        assert action is not None
+        split("validate")
+
+        world_before = state.world.snapshot()
+        # Both market engines return fresh MarketGood objects and never touch their
+        # input, so the pre-turn dict doubles as the "before" snapshot.
+        market_before = state.market
+
+        state.world.treasury -= action.immediate_cost
+        state.active_policies[action.policy_id] = PolicyRuntime(
+            policy_id=action.policy_id,
+            remaining_ticks=policy.duration_ticks,
+            cooldown_ticks=0,
+            magnitude=action.magnitude,
+            state={
+                "target": action.target,
+                "delay_left": int(policy.effects.get("capacity_delay", 0)),
+                "capacity_applied": False,
+            },
+        )
 
-            state.world.turn += 1
-            state.world.last_action_ts = utc_now_iso()
-            effects = self._collect_policy_effects(state)
+        state.world.turn += 1
+        state.world.last_action_ts = utc_now_iso()
+        effects = self._collect_policy_effects(state)
 
-            upkeep = sum(sector.upkeep for sector in state.sectors.values())
-            state.world.treasury -= int(round(upkeep))
+        upkeep = sum(sector.upkeep for sector in state.sectors.values())
+        state.world.treasury -= int(round(upkeep))
 
-            base_income = int(round(state.world.population * (0.012 + state.world.prosperity / 9000.0)))
-            state.world.treasury += base_income + int(round(effects["treasury_income"]))
-            state.world.treasury -= int(round(effects["treasury_upkeep"] + effects["import_cost"]))
+        base_income = int(round(state.world.population * (0.012 + state.world.prosperity / 9000.0)))
+        state.world.treasury += base_income + int(round(effects["treasury_income"]))
+        state.world.treasury -= int(round(effects["treasury_upkeep"] + effects["import_cost"]))
+        split("policy_effects")
 
-            state.market = simulate_market(
+        if self._vector_market is not None:
+            state.market = self._vector_market.simulate(
                 world=state.world,
                 market=state.market,
                 sectors=state.sectors,
-                goods_meta=self.bundle.goods_by_id(),
-                economy_cfg=self.bundle.config["economy"],
-                population_needs=self.bundle.config["population_needs"],
                 effects=effects,
                 seed=seed,
                 turn=state.world.turn,
             )
-
-            derived = compute_derived_metrics(
-                before=market_before,
-                after=state.market,
-                shortage_threshold=float(self.bundle.config["economy"]["shortage_threshold"]),
-            )
-
-            shortage_count = len(derived["shortages"])
-            shortage_pressure = shortage_count * (1.5 + float(effects["shortage_unrest_factor_add"]))
-            state.world.unrest += shortage_pressure + max(0.0, derived["inflation"]) * 0.15
-            state.world.prosperity += -shortage_count * 0.8 - max(0.0, derived["inflation"]) * 0.22 + state.world.tech_level * 0.01
-            state.world.stability += -state.world.unrest * 0.02
-            state.world.tech_level += 0.2
-
-            for key, value in effects["world_add"].items():
-                if key == "treasury":
-                    state.world.treasury += int(round(value))
-                else:
-                    current = float(getattr(state.world, key))
-                    setattr(state.world, key, current + float(value))
-
-            event_rows: list[dict[str, Any]] = []
-            event = choose_event(
-                events=self.bundle.events,
+        else:
+            state.market = simulate_market(
                 world=state.world,
                 market=state.market,
+                sectors=state.sectors,
+                goods_meta=self.bundle.goods_index,
+                economy_cfg=self.bundle.config["economy"],
+                population_needs=self.bundle.config["population_needs"],
+                effects=effects,
                 seed=seed,
                 turn=state.world.turn,
-                event_chance=float(self.bundle.config["economy"]["event_chance"]),
             )
-            if event is not None:
-                event_rows.append(apply_event(event, state.world, state.market, state.sectors))
+        split("market")
 
-            for good_id, item in state.market.items():
-                meta = self.bundle.goods_by_id()[good_id]
-                item.price = clamp(item.price, float(meta["min_price"]), float(meta["max_price"]))
+        derived = compute_derived_metrics(
+            before=market_before,
+            after=state.market,
+            shortage_threshold=float(self.bundle.config["economy"]["shortage_threshold"]),
+        )
 
-            derived = compute_derived_metrics(
-                before=market_before,
-                after=state.market,
-                shortage_threshold=float(self.bundle.config["economy"]["shortage_threshold"]),
-            )
+        shortage_count = len(derived["shortages"])
+        shortage_pressure = shortage_count * (1.5 + float(effects["shortage_unrest_factor_add"]))
+        state.world.unrest += shortage_pressure + max(0.0, derived["inflation"]) * 0.15
+        state.world.prosperity += -shortage_count * 0.8 - max(0.0, derived["inflation"]) * 0.22 + state.world.tech_level * 0.01
+        state.world.stability += -state.world.unrest * 0.02
+        state.world.tech_level += 0.2
+        split("metrics")
+
+        for key, value in effects["world_add"].items():
+            if key == "treasury":
+                state.world.treasury += int(round(value))
+            else:
+                current = float(getattr(state.world, key))
+                setattr(state.world, key, current + float(value))
+        split("policy_effects")
+
+        event_rows: list[dict[str, Any]] = []
+        event = choose_event(
+            events=self.bundle.events,
+            world=state.world,
+            market=state.market,
+            seed=seed,
+            turn=state.world.turn,
+            event_chance=float(self.bundle.config["economy"]["event_chance"]),
+            rng_mode=str(self.bundle.config["economy"].get("rng_mode", "compat")),
+            index=self._event_index,
+        )
+        if event is not None:
+            event_rows.append(apply_event(event, state.world, state.market, state.sectors))
+
+        price_bounds = self.bundle.price_bounds
+        for good_id, item in state.market.items():
+            min_price, max_price = price_bounds[good_id]
+            item.price = clamp(item.price, min_price, max_price)
+        split("events")
+
+        derived = compute_derived_metrics(
+            before=market_before,
+            after=state.market,
+            shortage_threshold=float(self.bundle.config["economy"]["shortage_threshold"]),
+        )
 
-            pop_delta = int((state.world.prosperity - state.world.unrest - 30.0) / 200.0)
-            state.world.population = max(10000, state.world.population + pop_delta)
-            state.world.treasury = int(round(state.world.treasury))
-            state.world.prosperity = clamp(state.world.prosperity, 0.0, 100.0)
-            state.world.stability = clamp(state.world.stability, 0.0, 100.0)
-            state.world.unrest = clamp(state.world.unrest, 0.0, 100.0)
-            state.world.tech_level = clamp(state.world.tech_level, 0.0, 100.0)
-
-            net_cashflow = float(state.world.treasury - world_before.treasury)
-            trailing_3_cashflow = self.repo.trailing_cashflow(window=3, include_current=net_cashflow)
-            collapse_active = self._update_collapse_state(state.world, trailing_3_cashflow)
-
-            unlocked_now = self._maybe_unlock_policy(state)
-
-            self._tick_policy_runtimes(state)
-            self.repo.save_state(state)
-
-            total_cost = action.immediate_cost + int(round(upkeep + effects["treasury_upkeep"] + effects["import_cost"]))
-            summary = {
-                "shortages": list(derived["shortages"]),
-                "inflation": round(float(derived["inflation"]), 3),
-                "volatility": round(float(derived["volatility"]), 3),
-                "top_price_movers": [(gid, round(delta, 3)) for gid, delta in derived["top_movers"]],
-                "events": [e["id"] for e in event_rows],
-                "treasury": state.world.treasury,
-                "net_cashflow": round(net_cashflow, 3),
-                "trailing_3_cashflow": round(trailing_3_cashflow, 3),
+        pop_delta = int((state.world.prosperity - state.world.unrest - 30.0) / 200.0)
+        state.world.population = max(10000, state.world.population + pop_delta)
+        state.world.treasury = int(round(state.world.treasury))
+        state.world.prosperity = clamp(state.world.prosperity, 0.0, 100.0)
+        state.world.stability = clamp(state.world.stability, 0.0, 100.0)
+        state.world.unrest = clamp(state.world.unrest, 0.0, 100.0)
+        state.world.tech_level = clamp(state.world.tech_level, 0.0, 100.0)
+        split("metrics")
+
+        net_cashflow = float(state.world.treasury - world_before.treasury)
+        trailing_3_cashflow = self.repo.trailing_cashflow(window=3, include_current=net_cashflow)
+        collapse_active = self._update_collapse_state(state.world, trailing_3_cashflow)
+
+        unlocked_now = self._maybe_unlock_policy(state)
+
+        self._tick_policy_runtimes(state)
+        split("collapse_unlock")
+        self._dirty = True
+        self._version += 1
+        # Built once for both the save and the checkpoint delta.
+        rows = state_rows(state) if self.snapshot_every > 0 else None
+        # The repository holds the last checkpoint's rows, so what the save writes is the delta.
+        base_saved = self._checkpoint_saved
+        written = self._save(rows) if self.autoflush else None
+
+        total_cost = action.immediate_cost + int(round(upkeep + effects["treasury_upkeep"] + effects["import_cost"]))
+        summary = {
+            "shortages": list(derived["shortages"]),
+            "inflation": round(float(derived["inflation"]), 3),
+            "volatility": round(float(derived["volatility"]), 3),
+            "top_price_movers": [(gid, round(delta, 3)) for gid, delta in derived["top_movers"]],
+            "events": [e["id"] for e in event_rows],
+            "treasury": state.world.treasury,
+            "net_cashflow": round(net_cashflow, 3),
+            "trailing_3_cashflow": round(trailing_3_cashflow, 3),
+            "collapse_active": collapse_active,
+            "unlocked": unlocked_now,
+        }
+        self.repo.append_history(state.world.turn, action.policy_id, total_cost, summary)
+        self.repo.record_metrics(
+            state.world.turn,
+            state.world,
+            state.market,
+            inflation=float(derived["inflation"]),
+            volatility=float(derived["volatility"]),
+            net_cashflow=net_cashflow,
+            shortage_count=len(derived["shortages"]),
+        )
+        self.repo.append_events(state.world.turn, event_rows)
+        if rows is not None:
+            self._record_checkpoint(rows, state.unlocked_policies, written if base_saved else None)
+            self._checkpoint_saved = self.autoflush
+        split("persist")
+
+        self.logger.sim(
+            lambda: {
+                "turn": state.world.turn,
+                "action": action.policy_id,
+                "magnitude": action.magnitude,
+                "target": action.target,
+                "shortages": derived["shortages"],
+                "inflation": derived["inflation"],
+                "volatility": derived["volatility"],
+                "events": event_rows,
                 "collapse_active": collapse_active,
-                "unlocked": unlocked_now,
+                "unlocked_now": unlocked_now,
+            }
+        )
+        self.logger.debug(
+            lambda: {
+                "turn": state.world.turn,
+                "policy_effects": effects,
+                "treasury": state.world.treasury,
             }
-            self.repo.append_history(state.world.turn, action.policy_id, total_cost, summary)
-            self.repo.append_events(state.world.turn, event_rows)
+        )
+        split("log")
 
-            self.logger.sim(
-                {
-                    "turn": state.world.turn,
-                    "action": action.policy_id,
-                    "magnitude": action.magnitude,
-                    "target": action.target,
-                    "shortages": derived["shortages"],
-                    "inflation": derived["inflation"],
-                    "volatility": derived["volatility"],
-                    "events": event_rows,
-                    "collapse_active": collapse_active,
-                    "unlocked_now": unlocked_now,
-                }
-            )
-            self.logger.debug(
-                {
-                    "turn": state.world.turn,
-                    "policy_effects": effects,
-                    "treasury": state.world.treasury,
-                }
-            )
+        return SimResult(
+            ok=True,
+            message=f"ACTION OK {action.policy_id}",
+            turn_advanced=True,
+            action_label=action.policy_id,
+            world_before=world_before,
+            world_after=state.world.snapshot(),
+            top_price_movers=[(gid, float(delta)) for gid, delta in derived["top_movers"]],
+            shortages=list(derived["shortages"]),
+            inflation=float(derived["inflation"]),
+            volatility=float(derived["volatility"]),
+            events=event_rows,
+            errors=[],
+        )
 
-            return SimResult(
-                ok=True,
-                message=f"ACTION OK {action.policy_id}",
-                turn_advanced=True,
-                action_label=action.policy_id,
-                world_before=world_before,
-                world_after=deepcopy(state.world),
-                top_price_movers=[(gid, float(delta)) for gid, delta in derived["top_movers"]],
-                shortages=list(derived["shortages"]),
-                inflation=float(derived["inflation"]),
-                volatility=float(derived["volatility"]),
-                events=event_rows,
-                errors=[],
-            )
-        except Exception as exc:  # pragma: no cover - defensive hardening
-            self.logger.error({"where": "SimulationEngine.advance_turn", "error": repr(exc)})
-            state = self.load_state()
-            return self._invalid_result(state.world, f"INVALID PARAM internal error: {exc}")
+    def _record_checkpoint(
+        self, rows: dict[str, object], unlocked_ids: set[str], written: dict[str, object] | None = None
+    ) -> None:
+        """Store ``rows`` (``state_rows()`` of the turn just played) as a snapshot or a delta.
+
+        ``written`` is the delta ``save_state`` returned when it moved the repository
+        from the previous checkpoint to ``rows``; it spares diffing the tables again.
+        """
+        previous = self._checkpoint
+        turn = rows["world"][0]
+        if previous is not None and previous["unlocked"].keys() == unlocked_ids:
+            unlocked = previous["unlocked"]
+        else:
+            unlocked = {
+                str(row["policy_id"]): (int(row["unlocked_turn"]), str(row["source"]))
+                for row in self.repo.unlocked_policy_rows()
+            }
+        current = {**rows, "unlocked": unlocked, "meta": self.repo.meta_values(SIM_META_KEYS)}
+        snapshot = previous is None or previous["world"][0] != turn - 1 or turn % self.snapshot_every == 0
+        delta = diff_rows(None if snapshot else previous, current, written)
+        self.repo.record_checkpoint(turn, snapshot, encode_checkpoint(delta, compress=snapshot))
+        self._checkpoint = current
+
+    def _check_turn(self, turn: int) -> None:
+        current = self.load_state().world.turn
+        if not 0 <= turn <= current:
+            raise ValueError(f"turn must be between 0 and {current}, got {turn}")
+
+    def restore_to(self, turn: int) -> GameState:
+        """Rewind this game to the end of ``turn``; everything recorded after it is dropped.
+
+        The state is rebuilt from the nearest snapshot plus the deltas after it, so the
+        cost depends on ``snapshot_every``, not on how far back ``turn`` is.
+        """
+        self._check_turn(turn)
+        self.flush()
+        chain = self.repo.checkpoint_chain(turn)
+        if not chain:
+            raise RuntimeError(f"No snapshot recorded at or before turn {turn}.")
+        if [row[0] for row in chain] != list(range(chain[0][0], turn + 1)):
+            raise RuntimeError(f"Checkpoints between turns {chain[0][0]} and {turn} are incomplete.")
+        rows = replay_checkpoints(payload for _, _, payload in chain)
+        state = state_from_rows(rows, self.bundle.sector_io_index)
+        self.repo.restore_checkpoint(turn, state, rows["unlocked"], rows["meta"])
+        # Keep the recorded dict order: it feeds float sums, so replaying from here
+        # matches the original run bit for bit.
+        self._state = state
+        self._dirty = False
+        self._version += 1
+        self._checkpoint = rows
+        self._checkpoint_saved = True
+        return state
+
+    def branch_from(self, turn: int, db_path: Path | None = None) -> SimulationEngine:
+        """A copy of this game rewound to ``turn``, for what-if play; this game is left as is.
+
+        The copy is written to ``db_path`` for SQLite games, or kept in memory when it is ``None``.
+        """
+        self._check_turn(turn)
+        self.flush()
+        branch = SimulationEngine(
+            self.bundle,
+            self.repo.fork(db_path),
+            self.logger,
+            autoflush=self.autoflush,
+            snapshot_every=self.snapshot_every,
+        )
+        branch.restore_to(turn)
+        return branch
 
     def snapshot(self) -> dict[str, Any]:
         state = self.load_state()
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from typing import Any
 
 from shinon_os.i18n import t
 from shinon_os.sim.model import MarketGood, SectorState, WorldState
-from shinon_os.sim.worldgen import EventDefinition
-from shinon_os.util.rng import seeded_rng
+from shinon_os.sim.worldgen import EventDefinition, compile_conditions
+from shinon_os.util.rng import note_draws, stream_rng
 
 
 def _conditions_match(event: EventDefinition, world: WorldState, market: dict[str, MarketGood]) -> bool:
@@ -30,6 +32,130 @@ def _conditions_match(event: EventDefinition, world: WorldState, market: dict[st
     return True
 
 
+class _ThresholdTable:
+    """Sorted min/max thresholds for one world field or good price."""
+
+    def __init__(self) -> None:
+        self.min_terms: list[tuple[float, int]] = []
+        self.max_terms: list[tuple[float, int]] = []
+        self.min_keys: list[float] = []
+        self.max_keys: list[float] = []
+
+    def add(self, bound: str, threshold: float, event_idx: int) -> None:
+        (self.min_terms if bound == "min" else self.max_terms).append((threshold, event_idx))
+
+    def seal(self) -> None:
+        self.min_terms.sort()
+        self.max_terms.sort()
+        self.min_keys = [row[0] for row in self.min_terms]
+        self.max_keys = [row[0] for row in self.max_terms]
+
+    def failing(self, value: float | None) -> list[int]:
+        """Event indices whose term on this field fails for ``value`` (``None`` fails all)."""
+        if value is None:
+            return [idx for _, idx in self.min_terms] + [idx for _, idx in self.max_terms]
+        # min fails when value < threshold, max fails when value > threshold.
+        lo = bisect_right(self.min_keys, value)
+        hi = bisect_left(self.max_keys, value)
+        return [idx for _, idx in self.min_terms[lo:]] + [idx for _, idx in self.max_terms[:hi]]
+
+    def flipped(self, old: float, new: float) -> tuple[list[int], list[int]]:
+        """Return (now_failing, now_passing) event indices when the value moves old -> new."""
+        now_failing: list[int] = []
+        now_passing: list[int] = []
+        old_min, new_min = bisect_right(self.min_keys, old), bisect_right(self.min_keys, new)
+        old_max, new_max = bisect_left(self.max_keys, old), bisect_left(self.max_keys, new)
+        if new_min < old_min:
+            now_failing.extend(idx for _, idx in self.min_terms[new_min:old_min])
+        else:
+            now_passing.extend(idx for _, idx in self.min_terms[old_min:new_min])
+        if new_max > old_max:
+            now_failing.extend(idx for _, idx in self.max_terms[old_max:new_max])
+        else:
+            now_passing.extend(idx for _, idx in self.max_terms[new_max:old_max])
+        return now_failing, now_passing
+
+
+class EventIndex:
+    """Incremental candidate index over compiled event conditions.
+
+    Conditions are grouped into threshold tables per world field / good. Each
+    call diffs the watched values against the previous call and only touches
+    events whose thresholds were crossed; weighted selection then uses prefix
+    sums and bisect instead of a linear cumulative scan.
+    """
+
+    def __init__(self, events: list[EventDefinition]) -> None:
+        self.events = list(events)
+        self._weights = [max(0.0, float(event.base_weight)) for event in self.events]
+        self._tables: dict[tuple[str, str], _ThresholdTable] = {}
+        for idx, event in enumerate(self.events):
+            terms = event.compiled_conditions or compile_conditions(event.event_id, event.conditions)
+            for scope, key, bound, threshold in terms:
+                self._tables.setdefault((scope, key), _ThresholdTable()).add(bound, threshold, idx)
+        for table in self._tables.values():
+            table.seal()
+        self._values: dict[tuple[str, str], float | None] = {}
+        self._fail_counts = [0] * len(self.events)
+        self._eligible: set[int] = set()
+        self._synced = False
+        self._cached: tuple[list[EventDefinition], list[float], float] | None = None
+
+    @staticmethod
+    def _read(field: tuple[str, str], world: WorldState, market: dict[str, MarketGood]) -> float | None:
+        scope, key = field
+        if scope == "world":
+            return float(getattr(world, key))
+        item = market.get(key)
+        return None if item is None else item.price
+
+    def _sync(self, world: WorldState, market: dict[str, MarketGood]) -> None:
+        if not self._synced:
+            counts = [0] * len(self.events)
+            for field, table in self._tables.items():
+                value = self._read(field, world, market)
+                self._values[field] = value
+                for idx in table.failing(value):
+                    counts[idx] += 1
+            self._fail_counts = counts
+            self._eligible = {idx for idx, count in enumerate(counts) if count == 0}
+            self._synced = True
+            self._cached = None
+            return
+
+        counts = self._fail_counts
+        for field, table in self._tables.items():
+            new = self._read(field, world, market)
+            old = self._values[field]
+            if new == old:
+                continue
+            self._values[field] = new
+            if old is None or new is None:
+                now_failing = table.failing(new)
+                now_passing = table.failing(old)
+            else:
+                now_failing, now_passing = table.flipped(old, new)
+            for idx in now_passing:
+                counts[idx] -= 1
+                if counts[idx] == 0:
+                    self._eligible.add(idx)
+                    self._cached = None
+            for idx in now_failing:
+                if counts[idx] == 0:
+                    self._eligible.discard(idx)
+                    self._cached = None
+                counts[idx] += 1
+
+    def candidates(self, world: WorldState, market: dict[str, MarketGood]) -> tuple[list[EventDefinition], list[float], float]:
+        """Matching events in definition order, their cumulative weights and the weight total."""
+        self._sync(world, market)
+        if self._cached is None:
+            order = sorted(self._eligible)
+            weights = [self._weights[idx] for idx in order]
+            self._cached = ([self.events[idx] for idx in order], list(accumulate(weights)), sum(weights))
+        return self._cached
+
+
 def choose_event(
     events: list[EventDefinition],
     world: WorldState,
@@ -37,11 +163,23 @@ def choose_event(
     seed: int,
     turn: int,
     event_chance: float,
+    rng_mode: str = "compat",
+    index: EventIndex | None = None,
 ) -> EventDefinition | None:
-    rng = seeded_rng(seed, "event", turn)
+    rng = stream_rng(rng_mode, seed, "event", turn)
+    note_draws(1)
     if rng.random() > event_chance:
         return None
 
+    if index is not None:
+        matched, cumulative, total = index.candidates(world, market)
+        if total <= 0:
+            return None
+        note_draws(1)
+        pick = rng.uniform(0.0, total)
+        position = bisect_left(cumulative, pick)
+        return matched[position] if position < len(matched) else matched[-1]
+
     candidates: list[tuple[EventDefinition, float]] = []
     for event in events:
         if _conditions_match(event, world, market):
@@ -50,6 +188,7 @@ def choose_event(
     if total <= 0:
         return None
 
+    note_draws(1)
     pick = rng.uniform(0.0, total)
     cursor = 0.0
     for event, weight in candidates:
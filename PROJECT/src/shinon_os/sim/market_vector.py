@@ -0,0 +1,202 @@
+"""Array-backed market step, numerically identical to :func:`simulate_market`.
+
+Supply, demand and price live in contiguous float64 buffers indexed by good,
+and the sector input/output coefficients are precomputed as dense
+sector x good rows from :meth:`DataBundle.sector_io_defs`. Every arithmetic
+step mirrors the reference engine operation for operation, so results are
+bit-identical; NumPy is used when installed, ``array('d')`` otherwise. NumPy is
+imported on first use so the reference engine never pays for it at startup.
+"""
+from __future__ import annotations
+
+from array import array
+from functools import lru_cache
+from typing import Any, Sequence
+
+from shinon_os.sim.model import MarketGood, SectorState, WorldState
+from shinon_os.sim.worldgen import DataBundle
+from shinon_os.util.rng import noise_vector
+
+_EPS = 1e-6
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return numpy
+
+
+def numpy_available() -> bool:
+    return _numpy() is not None
+
+
+class _Layout:
+    """Per-good vectors and sector rows laid out in one market ordering."""
+
+    def __init__(self, engine: VectorMarketEngine, good_ids: tuple[str, ...]) -> None:
+        self.good_ids = good_ids
+        self.index = {good_id: idx for idx, good_id in enumerate(good_ids)}
+        size = len(good_ids)
+        self.min_price = engine._vector([float(engine.goods_meta[g]["min_price"]) for g in good_ids])
+        self.max_price = engine._vector([float(engine.goods_meta[g]["max_price"]) for g in good_ids])
+        self.needs = engine._vector([float(engine.population_needs.get(g, 0.0)) for g in good_ids])
+        self.inputs: dict[str, Any] = {}
+        self.outputs: dict[str, Any] = {}
+        for sector_id, io_def in engine.sector_io.items():
+            self.inputs[sector_id] = self.row(engine, io_def.get("inputs", {}), size)
+            self.outputs[sector_id] = self.row(engine, io_def.get("outputs", {}), size)
+
+    def row(self, engine: VectorMarketEngine, amounts: dict[str, Any], size: int) -> Any:
+        values = [0.0] * size
+        for good_id, amount in amounts.items():
+            idx = self.index.get(good_id)
+            if idx is not None:
+                values[idx] = float(amount)
+        return engine._vector(values)
+
+
+class VectorMarketEngine:
+    def __init__(self, bundle: DataBundle, use_numpy: bool | None = None) -> None:
+        self._np = None if use_numpy is False else _numpy()
+        if use_numpy and self._np is None:
+            raise RuntimeError("NumPy requested for the vector market engine but it is not installed.")
+        self.use_numpy = self._np is not None
+        self.goods_meta = bundle.goods_index
+        self.sector_io = bundle.sector_io_index
+        self.economy_cfg = bundle.config["economy"]
+        self.population_needs = bundle.config["population_needs"]
+        self._layouts: dict[tuple[str, ...], _Layout] = {}
+
+    def _vector(self, values: Sequence[float]) -> Any:
+        if self.use_numpy:
+            return self._np.array(values, dtype=self._np.float64)
+        return array("d", values)
+
+    def _layout(self, good_ids: tuple[str, ...]) -> _Layout:
+        layout = self._layouts.get(good_ids)
+        if layout is None:
+            layout = _Layout(self, good_ids)
+            self._layouts[good_ids] = layout
+        return layout
+
+    def _sector_rows(self, layout: _Layout, sector: SectorState) -> tuple[Any, Any]:
+        if sector.sector_id in layout.inputs:
+            return layout.inputs[sector.sector_id], layout.outputs[sector.sector_id]
+        size = len(layout.good_ids)
+        return layout.row(self, sector.inputs, size), layout.row(self, sector.outputs, size)
+
+    def simulate(
+        self,
+        world: WorldState,
+        market: dict[str, MarketGood],
+        sectors: dict[str, SectorState],
+        effects: dict[str, Any],
+        seed: int,
+        turn: int,
+    ) -> dict[str, MarketGood]:
+        layout = self._layout(tuple(market))
+        k_demand = float(self.economy_cfg.get("k_demand", 0.35))
+        noise_amplitude = float(self.economy_cfg.get("noise_amplitude", 0.01))
+        prev_price = self._vector([item.price for item in market.values()])
+        supply = self._vector([max(item.supply * 0.45, 0.1) for item in market.values()])
+        demand = self._vector([max(item.demand * 0.45, 0.1) for item in market.values()])
+
+        global_output_mult = float(effects.get("global_output_mult", 0.0))
+        efficiency_add = effects.get("sector_efficiency_add", {})
+        output_mult = effects.get("sector_output_mult", {})
+        step = self._step_numpy if self.use_numpy else self._step_array
+        throughput_rows: list[tuple[float, float, Any, Any]] = []
+        for sector_id, sector in sectors.items():
+            efficiency = max(0.05, min(1.5, sector.efficiency + float(efficiency_add.get(sector_id, 0.0))))
+            throughput = sector.capacity * efficiency
+            throughput *= max(0.2, 1.0 + global_output_mult)
+            output_factor = max(0.2, 1.0 + float(output_mult.get(sector_id, 0.0)))
+            inputs, outputs = self._sector_rows(layout, sector)
+            throughput_rows.append((throughput, output_factor, inputs, outputs))
+
+        living_factor = 0.8 + world.prosperity / 200.0
+        population = float(world.population)
+        rng_mode = str(self.economy_cfg.get("rng_mode", "compat"))
+        noise = noise_vector(seed, turn, layout.good_ids, amplitude=noise_amplitude, mode=rng_mode)
+        price_mult = [1.0] * len(layout.good_ids)
+        for good_id, value in effects.get("good_price_mult", {}).items():
+            idx = layout.index.get(good_id)
+            if idx is not None:
+                price_mult[idx] = max(0.1, 1.0 + float(value))
+
+        price = step(
+            layout=layout,
+            supply=supply,
+            demand=demand,
+            prev_price=prev_price,
+            throughput_rows=throughput_rows,
+            population=population,
+            living_factor=living_factor,
+            supply_add=effects.get("good_supply_add", {}),
+            demand_mult=effects.get("good_demand_mult", {}),
+            noise=self._vector(noise),
+            price_mult=self._vector(price_mult),
+            k_demand=k_demand,
+        )
+
+        updated: dict[str, MarketGood] = {}
+        for idx, good_id in enumerate(layout.good_ids):
+            updated[good_id] = MarketGood(
+                good_id=good_id,
+                supply=float(supply[idx]),
+                demand=float(demand[idx]),
+                price=float(price[idx]),
+                last_price=float(prev_price[idx]),
+            )
+        return updated
+
+    @staticmethod
+    def _apply_sparse(layout: _Layout, supply: Any, demand: Any, supply_add: dict[str, Any], demand_mult: dict[str, Any]) -> None:
+        for good_id, amount in supply_add.items():
+            idx = layout.index.get(good_id)
+            if idx is not None:
+                supply[idx] += float(amount)
+        for good_id, multiplier_add in demand_mult.items():
+            idx = layout.index.get(good_id)
+            if idx is not None:
+                demand[idx] *= max(0.1, 1.0 + float(multiplier_add))
+
+    def _step_numpy(self, layout: _Layout, supply: Any, demand: Any, prev_price: Any, throughput_rows, population: float,
+                    living_factor: float, supply_add, demand_mult, noise: Any, price_mult: Any, k_demand: float) -> Any:
+        for throughput, output_factor, inputs, outputs in throughput_rows:
+            demand += throughput * inputs
+            supply += throughput * outputs * output_factor
+        demand += population * layout.needs * living_factor
+        self._apply_sparse(layout, supply, demand, supply_add, demand_mult)
+        np = self._np
+        ratio = demand / np.maximum(supply, _EPS)
+        target = np.maximum(0.5, np.minimum(2.0, ratio))
+        trend = 1.0 + (target - 1.0) * k_demand
+        price = prev_price * trend * (1.0 + noise)
+        price *= price_mult
+        return np.maximum(layout.min_price, np.minimum(layout.max_price, price))
+
+    def _step_array(self, layout: _Layout, supply: Any, demand: Any, prev_price: Any, throughput_rows, population: float,
+                    living_factor: float, supply_add, demand_mult, noise: Any, price_mult: Any, k_demand: float) -> Any:
+        size = len(layout.good_ids)
+        for throughput, output_factor, inputs, outputs in throughput_rows:
+            for idx in range(size):
+                demand[idx] += throughput * inputs[idx]
+                supply[idx] += throughput * outputs[idx] * output_factor
+        needs = layout.needs
+        for idx in range(size):
+            demand[idx] += population * needs[idx] * living_factor
+        self._apply_sparse(layout, supply, demand, supply_add, demand_mult)
+        price = array("d", bytes(8 * size))
+        min_price = layout.min_price
+        max_price = layout.max_price
+        for idx in range(size):
+            target = max(0.5, min(2.0, demand[idx] / max(supply[idx], _EPS)))
+            trend = 1.0 + (target - 1.0) * k_demand
+            value = prev_price[idx] * trend * (1.0 + noise[idx])
+            value *= price_mult[idx]
+            price[idx] = max(min_price[idx], min(max_price[idx], value))
+        return price
@@ -1,10 +1,24 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterator, Mapping, NamedTuple
 
 
-@dataclass
+class WorldSnapshot(NamedTuple):
+    """Immutable copy of WorldState's fields, taken with one tuple build instead of a deepcopy."""
+
+    turn: int
+    treasury: int
+    population: int
+    prosperity: float
+    stability: float
+    unrest: float
+    tech_level: float
+    last_action_ts: str
+
+
+@dataclass(slots=True)
 class WorldState:
     turn: int
     treasury: int
@@ -15,8 +29,20 @@ class WorldState:
     tech_level: float
     last_action_ts: str
 
+    def snapshot(self) -> WorldSnapshot:
+        return WorldSnapshot(
+            self.turn,
+            self.treasury,
+            self.population,
+            self.prosperity,
+            self.stability,
+            self.unrest,
+            self.tech_level,
+            self.last_action_ts,
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class MarketGood:
     good_id: str
     supply: float
@@ -25,7 +51,105 @@ class MarketGood:
     last_price: float
 
 
-@dataclass
+class MarketRow:
+    """Attribute view of one good inside a MarketTable; reads and writes go to the table's arrays."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: MarketTable, index: int) -> None:
+        self._table = table
+        self._index = index
+
+    @property
+    def good_id(self) -> str:
+        return self._table.good_ids[self._index]
+
+    @property
+    def supply(self) -> float:
+        return self._table.supply[self._index]
+
+    @supply.setter
+    def supply(self, value: float) -> None:
+        self._table.supply[self._index] = value
+
+    @property
+    def demand(self) -> float:
+        return self._table.demand[self._index]
+
+    @demand.setter
+    def demand(self, value: float) -> None:
+        self._table.demand[self._index] = value
+
+    @property
+    def price(self) -> float:
+        return self._table.price[self._index]
+
+    @price.setter
+    def price(self, value: float) -> None:
+        self._table.price[self._index] = value
+
+    @property
+    def last_price(self) -> float:
+        return self._table.last_price[self._index]
+
+    @last_price.setter
+    def last_price(self, value: float) -> None:
+        self._table.last_price[self._index] = value
+
+    def to_good(self) -> MarketGood:
+        return MarketGood(self.good_id, self.supply, self.demand, self.price, self.last_price)
+
+
+class MarketTable(Mapping[str, MarketRow]):
+    """Struct-of-arrays market: one ``array('d')`` per column instead of one object per good.
+
+    Behaves like ``dict[str, MarketGood]`` for reading and in-place updates, so it
+    can be handed to code that only iterates and mutates fields (e.g. as the
+    input of ``simulate_market``). Meant for holding many parallel states compactly.
+    """
+
+    __slots__ = ("good_ids", "_index", "supply", "demand", "price", "last_price")
+
+    def __init__(
+        self,
+        good_ids: list[str],
+        supply: array,
+        demand: array,
+        price: array,
+        last_price: array,
+    ) -> None:
+        self.good_ids = tuple(good_ids)
+        self._index = {good_id: index for index, good_id in enumerate(self.good_ids)}
+        self.supply = supply
+        self.demand = demand
+        self.price = price
+        self.last_price = last_price
+
+    @classmethod
+    def from_market(cls, market: Mapping[str, MarketGood]) -> MarketTable:
+        goods = list(market.values())
+        return cls(
+            [good.good_id for good in goods],
+            array("d", [good.supply for good in goods]),
+            array("d", [good.demand for good in goods]),
+            array("d", [good.price for good in goods]),
+            array("d", [good.last_price for good in goods]),
+        )
+
+    def to_market(self) -> dict[str, MarketGood]:
+        return {good_id: MarketRow(self, index).to_good() for index, good_id in enumerate(self.good_ids)}
+
+    def __getitem__(self, good_id: str) -> MarketRow:
+        return MarketRow(self, self._index[good_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.good_ids)
+
+    def __len__(self) -> int:
+        return len(self.good_ids)
+
+
+@dataclass(slots=True)
 class SectorState:
     sector_id: str
     capacity: float
@@ -35,7 +159,7 @@ class SectorState:
     outputs: dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyRuntime:
     policy_id: str
     remaining_ticks: int
@@ -44,7 +168,7 @@ class PolicyRuntime:
     state: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     world: WorldState
     market: dict[str, MarketGood]
@@ -53,14 +177,14 @@ class GameState:
     active_policies: dict[str, PolicyRuntime] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SimResult:
     ok: bool
     message: str
     turn_advanced: bool
     action_label: str
-    world_before: WorldState
-    world_after: WorldState
+    world_before: WorldSnapshot
+    world_after: WorldSnapshot
     top_price_movers: list[tuple[str, float]]
     shortages: list[str]
     inflation: float
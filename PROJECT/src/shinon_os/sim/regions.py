@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import copy
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import Any, Iterable
+
+from shinon_os.sim.economy import simulate_market
+from shinon_os.sim.model import GameState, MarketGood, SectorState, WorldState
+from shinon_os.sim.worldgen import DataBundle, build_initial_state
+from shinon_os.util.rng import seeded_rng, stable_seed
+
+POOL_KINDS = ("auto", "process")
+# A region-turn costs ~0.2 ms serially. "auto" wants about this many per worker
+# process before starting processes and pickling states every turn pays off.
+PROCESS_MIN_REGION_TURNS = 1_000
+
+
+@dataclass(frozen=True)
+class TradeRoute:
+    """Directed link; ``capacity`` caps the units of each good moved per turn."""
+
+    source: str
+    dest: str
+    cost_per_unit: float
+    capacity: float
+
+
+@dataclass(slots=True)
+class Region:
+    region_id: str
+    state: GameState
+    # Same shape as SimulationEngine._collect_policy_effects; empty means no policies.
+    effects: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class TradeFlow:
+    source: str
+    dest: str
+    good_id: str
+    units: float
+    transport_cost: float
+
+
+@dataclass(slots=True)
+class RegionStep:
+    turn: int
+    flows: list[TradeFlow]
+    transport_cost: dict[str, int]
+
+
+# (goods_meta, economy_cfg, population_needs): the same for every region and turn.
+MarketContext = tuple[dict[str, dict[str, Any]], dict[str, Any], dict[str, float]]
+# (region_id, world, market, sectors, effects, seed)
+RegionJob = tuple[str, WorldState, dict[str, MarketGood], dict[str, SectorState], dict[str, Any], int]
+
+_worker_context: MarketContext | None = None
+
+
+def _init_worker(context: MarketContext) -> None:
+    """Pool initializer: each worker receives the bundle data once, not with every job."""
+    global _worker_context
+    _worker_context = context
+
+
+def step_regions(
+    jobs: list[RegionJob], turn: int, context: MarketContext | None = None
+) -> list[tuple[str, dict[str, MarketGood]]]:
+    """Market step for a chunk of regions. Module-level and side-effect free so any pool can run it.
+
+    Without ``context`` the one installed by the pool initializer is used.
+    """
+    goods_meta, economy_cfg, needs = context if context is not None else _worker_context
+    return [
+        (
+            region_id,
+            simulate_market(
+                world=world,
+                market=market,
+                sectors=sectors,
+                goods_meta=goods_meta,
+                economy_cfg=economy_cfg,
+                population_needs=needs,
+                effects=effects,
+                seed=seed,
+                turn=turn,
+            ),
+        )
+        for region_id, world, market, sectors, effects, seed in jobs
+    ]
+
+
+def reconcile_trade(markets: dict[str, dict[str, MarketGood]], routes: Iterable[TradeRoute]) -> list[TradeFlow]:
+    """Plan flows from one post-step snapshot, then move supply along every route.
+
+    A route bids for a good when the destination is short and its price beats the
+    source price plus transport cost. Bids are scaled pro rata so no source ships
+    more than its surplus and no destination takes more than its shortfall; route
+    order therefore does not change the outcome.
+    """
+    bids: list[tuple[TradeRoute, str, float]] = []
+    asked_from: dict[tuple[str, str], float] = {}
+    asked_by: dict[tuple[str, str], float] = {}
+    for route in routes:
+        source, dest = markets[route.source], markets[route.dest]
+        for good_id, offer in source.items():
+            want = dest.get(good_id)
+            if want is None or want.price - offer.price <= route.cost_per_unit:
+                continue
+            units = min(want.demand - want.supply, route.capacity)
+            if units <= 0.0 or offer.supply <= offer.demand:
+                continue
+            bids.append((route, good_id, units))
+            asked_from[(route.source, good_id)] = asked_from.get((route.source, good_id), 0.0) + units
+            asked_by[(route.dest, good_id)] = asked_by.get((route.dest, good_id), 0.0) + units
+
+    flows: list[TradeFlow] = []
+    for route, good_id, units in bids:
+        offer = markets[route.source][good_id]
+        want = markets[route.dest][good_id]
+        scale = min(
+            1.0,
+            (offer.supply - offer.demand) / asked_from[(route.source, good_id)],
+            (want.demand - want.supply) / asked_by[(route.dest, good_id)],
+        )
+        moved = units * scale
+        flows.append(TradeFlow(route.source, route.dest, good_id, moved, moved * route.cost_per_unit))
+    for flow in flows:
+        markets[flow.source][flow.good_id].supply -= flow.units
+        markets[flow.dest][flow.good_id].supply += flow.units
+    return flows
+
+
+class RegionalWorld:
+    """Several regions, each with its own ``GameState``, joined by trade routes.
+
+    This is a market-only layer: a turn runs :func:`simulate_market` for every
+    region and reconciles trade, then charges transport costs to the importing
+    treasuries. Sectors, policies, events and the rest of the single-region turn
+    loop are not stepped; ``Region.effects`` is passed to the market as given.
+    Each region draws market noise from its own seed, so results do not depend
+    on the pool or worker count.
+    """
+
+    def __init__(self, bundle: DataBundle, regions: Iterable[Region], routes: Iterable[TradeRoute], seed: int) -> None:
+        self.bundle = bundle
+        self.regions = {region.region_id: region for region in regions}
+        self.routes = list(routes)
+        self.seed = int(seed)
+        if not self.regions:
+            raise ValueError("RegionalWorld needs at least one region.")
+        for route in self.routes:
+            if route.source not in self.regions or route.dest not in self.regions:
+                raise ValueError(f"Trade route references unknown region: {route.source} -> {route.dest}")
+            if route.source == route.dest:
+                raise ValueError(f"Trade route loops back to its region: {route.source}")
+            if route.cost_per_unit < 0 or route.capacity < 0:
+                raise ValueError(f"Trade route {route.source} -> {route.dest} needs non-negative cost and capacity.")
+        self._region_seeds = {region_id: stable_seed(self.seed, "region", region_id) for region_id in self.regions}
+
+    @property
+    def turn(self) -> int:
+        return max(region.state.world.turn for region in self.regions.values())
+
+    def _context(self) -> MarketContext:
+        return (self.bundle.goods_index, self.bundle.config["economy"], self.bundle.config.get("population_needs", {}))
+
+    def _jobs(self, chunks: int) -> list[list[RegionJob]]:
+        """The regions split into ``chunks`` contiguous jobs of near-equal size."""
+        jobs: list[RegionJob] = [
+            (
+                region_id,
+                region.state.world,
+                region.state.market,
+                region.state.sectors,
+                region.effects,
+                self._region_seeds[region_id],
+            )
+            for region_id, region in self.regions.items()
+        ]
+        chunks = max(1, min(chunks, len(jobs)))
+        size, extra = divmod(len(jobs), chunks)
+        bounds = [index * size + min(index, extra) for index in range(chunks + 1)]
+        return [jobs[start:stop] for start, stop in zip(bounds, bounds[1:])]
+
+    def step(self, executor: Executor | None = None, chunks: int = 1) -> RegionStep:
+        """One turn; with ``executor`` the regions are stepped as ``chunks`` parallel jobs."""
+        return self._step(executor, chunks, self._context())
+
+    def _step(self, executor: Executor | None, chunks: int, context: MarketContext | None) -> RegionStep:
+        turn = self.turn + 1
+        jobs = self._jobs(chunks)
+        if executor is not None:
+            results = executor.map(step_regions, jobs, repeat(turn), repeat(context))
+        else:
+            results = (step_regions(chunk, turn, context) for chunk in jobs)
+        markets = {region_id: market for chunk in results for region_id, market in chunk}
+
+        flows = reconcile_trade(markets, self.routes)
+        costs: dict[str, float] = {}
+        for flow in flows:
+            costs[flow.dest] = costs.get(flow.dest, 0.0) + flow.transport_cost
+        charged = {region_id: int(round(cost)) for region_id, cost in costs.items()}
+
+        for region_id, region in self.regions.items():
+            region.state.market = markets[region_id]
+            region.state.world.turn = turn
+            region.state.world.treasury -= charged.get(region_id, 0)
+        return RegionStep(turn=turn, flows=flows, transport_cost=charged)
+
+    def _processes_pay_off(self, turns: int, workers: int) -> bool:
+        return workers > 1 and len(self.regions) * turns >= PROCESS_MIN_REGION_TURNS * workers
+
+    def run(self, turns: int, workers: int = 1, pool: str = "auto") -> list[RegionStep]:
+        """Step ``turns`` times; ``workers > 1`` may fan the region markets out over a pool.
+
+        Every worker gets one chunk of regions per turn, and process workers get the
+        bundle data once through the pool initializer. The market step is pure Python,
+        so a thread pool would never beat the serial loop and is not offered; processes
+        only do on several CPUs with enough work to amortize their start-up:
+        ``pool="auto"`` (the default) uses processes when that holds and steps serially
+        otherwise, ``pool="process"`` always does.
+        """
+        if pool not in POOL_KINDS:
+            raise ValueError(f"pool must be one of {', '.join(POOL_KINDS)}")
+        workers = min(workers, len(self.regions))
+        if pool == "auto":
+            workers = min(workers, os.cpu_count() or 1)
+            pool = "process" if self._processes_pay_off(turns, workers) else "serial"
+        if workers <= 1 or pool == "serial":
+            context = self._context()
+            return [self._step(None, 1, context) for _ in range(turns)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self._context(),)) as executor:
+            return [self._step(executor, workers, None) for _ in range(turns)]
+
+
+def build_regions(bundle: DataBundle, count: int, seed: int, spread: float = 0.4) -> list[Region]:
+    """``count`` copies of the initial state with sector capacities varied by up to ``spread``.
+
+    The variation is what makes prices differ between regions, so trade routes
+    have something to do.
+    """
+    if count < 1:
+        raise ValueError("count must be at least 1")
+    base = build_initial_state(bundle)
+    regions: list[Region] = []
+    for index in range(count):
+        region_id = f"r{index:03d}"
+        state = copy.deepcopy(base)
+        rng = seeded_rng(seed, "region-layout", region_id)
+        for sector in state.sectors.values():
+            sector.capacity *= 1.0 + rng.uniform(-spread, spread)
+        regions.append(Region(region_id=region_id, state=state))
+    return regions
+
+
+def ring_routes(region_ids: list[str], cost_per_unit: float, capacity: float) -> list[TradeRoute]:
+    """Both directions between neighbours on a ring (``r0 <-> r1 <-> ... <-> r0``)."""
+    if len(region_ids) < 2:
+        return []
+    pairs = list(zip(region_ids, region_ids[1:] + region_ids[:1]))
+    if len(region_ids) == 2:
+        pairs = pairs[:1]
+    routes: list[TradeRoute] = []
+    for left, right in pairs:
+        routes.append(TradeRoute(left, right, cost_per_unit, capacity))
+        routes.append(TradeRoute(right, left, cost_per_unit, capacity))
+    return routes
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import csv
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import product
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from shinon_os.persistence.memory import InMemoryStateRepository
+from shinon_os.sim.batch import iter_script
+from shinon_os.sim.engine import SimulationEngine
+from shinon_os.sim.worldgen import DataBundle, load_data
+from shinon_os.util.logging_setup import NullLogger
+
+SINK_FORMATS = ("jsonl", "csv", "parquet")
+INFLATION_PERCENTILES = (10, 50, 90)
+# Turns per commit inside a scenario; bounds the in-memory store's rollback journal.
+COMMIT_EVERY = 100
+
+# Validated bundles by (data_dir, overrides), per process: grid cells share a few packs.
+_BUNDLES: dict[tuple[str | None, str], DataBundle] = {}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    seed: int
+    script: str
+    overrides: tuple[tuple[str, Any], ...] = ()
+
+
+def build_grid(
+    seeds: Iterable[int],
+    scripts: Iterable[Path | str],
+    overrides: Iterable[dict[str, Any]] | None = None,
+) -> list[Scenario]:
+    """Cartesian product of seeds x scripts x config override sets, in that nesting order."""
+    variants = [tuple(sorted(row.items())) for row in (overrides or [{}])]
+    return [
+        Scenario(seed=int(seed), script=str(script), overrides=variant)
+        for script, variant, seed in product(list(scripts), variants, list(seeds))
+    ]
+
+
+def parse_seeds(raw: str) -> list[int]:
+    """``"1-4,9"`` -> ``[1, 2, 3, 4, 9]``."""
+    seeds: list[int] = []
+    for part in raw.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, sep, end = part.partition("-")
+        try:
+            if sep:
+                first, last = int(start), int(end)
+                if last < first:
+                    raise ValueError
+                seeds.extend(range(first, last + 1))
+            else:
+                seeds.append(int(part))
+        except ValueError:
+            raise ValueError(f"Invalid seed range: {part}") from None
+    if not seeds:
+        raise ValueError("No seeds given")
+    return seeds
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    pos = (len(ordered) - 1) * q / 100.0
+    low = int(pos)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
+
+
+def _bundle(data_dir: str | None, overrides: tuple[tuple[str, Any], ...]) -> DataBundle:
+    key = (data_dir, json.dumps(overrides, ensure_ascii=True))
+    bundle = _BUNDLES.get(key)
+    if bundle is None:
+        bundle = load_data(data_dir=Path(data_dir) if data_dir else None, config_overrides=dict(overrides))
+        _BUNDLES[key] = bundle
+    return bundle
+
+
+def run_scenario(scenario: Scenario, data_dir: str | None = None) -> dict[str, Any]:
+    """Play one scenario against the dict-backed store; nothing is written to disk.
+
+    A scenario that raises (a broken script, a failing turn) yields a row with
+    ``error`` set instead of stopping the rest of the grid.
+    """
+    row: dict[str, Any] = {
+        "seed": scenario.seed,
+        "script": scenario.script,
+        "overrides": dict(scenario.overrides),
+        "error": None,
+    }
+    try:
+        row.update(_play(scenario, data_dir))
+    except Exception as exc:
+        row["error"] = f"{type(exc).__name__}: {exc}"
+    return row
+
+
+def _play(scenario: Scenario, data_dir: str | None) -> dict[str, Any]:
+    repo = InMemoryStateRepository()
+    try:
+        engine = SimulationEngine(
+            bundle=_bundle(data_dir, scenario.overrides),
+            repo=repo,
+            logger=NullLogger(),
+            autoflush=False,
+            snapshot_every=0,
+        )
+        engine.new_game(seed=scenario.seed)
+        applied = 0
+        rejected = 0
+        collapse_turns = 0
+        inflation: list[float] = []
+        with repo.batch():
+            for index, action in enumerate(iter_script(Path(scenario.script)), start=1):
+                result = engine.advance_turn(action.policy_id, action.magnitude, action.target)
+                if index % COMMIT_EVERY == 0:
+                    engine.flush()
+                    repo.commit()
+                if not result.ok:
+                    rejected += 1
+                    continue
+                applied += 1
+                inflation.append(result.inflation)
+                if engine.collapse_active():
+                    collapse_turns += 1
+            snapshot = engine.snapshot()
+    finally:
+        repo.close()
+    inflation.sort()
+    row: dict[str, Any] = {
+        "applied": applied,
+        "rejected": rejected,
+        "collapse_turns": collapse_turns,
+        "collapse_rate": collapse_turns / applied if applied else 0.0,
+        "collapsed_final": bool(snapshot["collapse_active"]),
+    }
+    for q in INFLATION_PERCENTILES:
+        row[f"inflation_p{q}"] = _percentile(inflation, q)
+    row["snapshot"] = snapshot
+    return row
+
+
+def _flatten(row: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    flat: dict[str, Any] = {}
+    for key, value in row.items():
+        name = f"{prefix}{key}"
+        if key == "overrides" and not prefix:
+            flat[name] = json.dumps(value, ensure_ascii=True, sort_keys=True)
+        elif isinstance(value, dict):
+            flat.update(_flatten(value, prefix=f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+class SweepSink:
+    """Row-at-a-time writer for sweep outcomes; format follows the file suffix unless given."""
+
+    def __init__(self, path: Path, fmt: str | None = None, parquet_batch: int = 512) -> None:
+        self.path = path
+        self.format = (fmt or path.suffix.lstrip(".")).lower()
+        if self.format not in SINK_FORMATS:
+            raise ValueError(f"Unsupported sweep sink format: {self.format} (use {', '.join(SINK_FORMATS)})")
+        self._parquet_batch = max(1, parquet_batch)
+        self._pending: list[dict[str, Any]] = []
+        self._csv: csv.DictWriter | None = None
+        self._parquet: Any = None
+        if self.format == "parquet":
+            try:
+                import pyarrow  # noqa: F401
+                import pyarrow.parquet  # noqa: F401
+            except ImportError as exc:
+                raise RuntimeError("Parquet output requires pyarrow (pip install shinon-alpha-world[parquet])") from exc
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = None if self.format == "parquet" else path.open("w", encoding="utf-8", newline="")
+
+    def write(self, row: dict[str, Any]) -> None:
+        if self.format == "jsonl":
+            self._fh.write(json.dumps(row, ensure_ascii=True, sort_keys=True) + "\n")
+            return
+        flat = _flatten(row)
+        self._pending.append(flat)
+        if self.format == "csv":
+            # Error rows lack the outcome columns; hold them until a full row fixes the header.
+            if self._csv is not None or row.get("error") is None:
+                self._flush_csv()
+            return
+        if len(self._pending) >= self._parquet_batch:
+            self._flush_parquet()
+
+    def _flush_csv(self) -> None:
+        if not self._pending:
+            return
+        if self._csv is None:
+            columns = max(self._pending, key=len)
+            self._csv = csv.DictWriter(self._fh, fieldnames=list(columns))
+            self._csv.writeheader()
+        self._csv.writerows(self._pending)
+        self._pending = []
+
+    def _flush_parquet(self) -> None:
+        if not self._pending:
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._parquet is None:
+            # The first row fixes the columns; make it carry every column of the batch.
+            columns = {name: None for flat in self._pending for name in flat}
+            self._pending[0] = {name: self._pending[0].get(name) for name in columns}
+            table = pa.Table.from_pylist(self._pending)
+            if table.schema.field("error").type == pa.null():
+                table = table.set_column(
+                    table.schema.get_field_index("error"), "error", table.column("error").cast(pa.string())
+                )
+            self._parquet = pq.ParquetWriter(str(self.path), table.schema)
+        else:
+            table = pa.Table.from_pylist(self._pending, schema=self._parquet.schema)
+        self._parquet.write_table(table)
+        self._pending = []
+
+    def close(self) -> None:
+        if self.format == "parquet":
+            self._flush_parquet()
+            if self._parquet is not None:
+                self._parquet.close()
+        elif self._fh is not None:
+            if self.format == "csv":
+                self._flush_csv()
+            self._fh.close()
+
+    def __enter__(self) -> SweepSink:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def iter_sweep(
+    scenarios: list[Scenario],
+    workers: int = 1,
+    data_dir: Path | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield scenario outcomes in grid order; ``workers > 1`` fans out over processes."""
+    data_arg = str(data_dir) if data_dir else None
+    if workers <= 1 or len(scenarios) <= 1:
+        for scenario in scenarios:
+            yield run_scenario(scenario, data_arg)
+        return
+    chunksize = max(1, len(scenarios) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(run_scenario, scenarios, [data_arg] * len(scenarios), chunksize=chunksize)
+
+
+def run_sweep(
+    scenarios: list[Scenario],
+    out: Path,
+    workers: int = 1,
+    fmt: str | None = None,
+    data_dir: Path | None = None,
+    emit: Callable[[str], None] = print,
+) -> dict[str, Any]:
+    """Stream every outcome to ``out`` and return (and emit) a grid-level summary.
+
+    Rates and percentiles cover the scenarios that finished; ``errors`` counts the rest.
+    """
+    count = 0
+    errors = 0
+    collapsed = 0
+    p50s: list[float] = []
+    with SweepSink(out, fmt=fmt) as sink:
+        for row in iter_sweep(scenarios, workers=workers, data_dir=data_dir):
+            sink.write(row)
+            count += 1
+            if row["error"] is not None:
+                errors += 1
+                continue
+            collapsed += 1 if row["collapse_turns"] else 0
+            p50s.append(float(row["inflation_p50"]))
+    p50s.sort()
+    summary = {
+        "scenarios": count,
+        "errors": errors,
+        "out": str(out),
+        "scenario_collapse_rate": collapsed / (count - errors) if count > errors else 0.0,
+        "inflation_p50_median": _percentile(p50s, 50),
+    }
+    emit(json.dumps(summary, ensure_ascii=True, sort_keys=True))
+    return summary
+
+
+def parse_override(raw: str) -> dict[str, Any]:
+    try:
+        row = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Invalid override JSON: {exc.msg}") from exc
+    if not isinstance(row, dict):
+        raise ValueError("Override must be a JSON object of dotted config keys")
+    return row
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import random
+import shutil
+from pathlib import Path
+from typing import Any
+
+from shinon_os.util.paths import package_data_dir
+
+
+def _read_rows(path: Path) -> Any:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_rows(path: Path, rows: Any) -> None:
+    path.write_text(json.dumps(rows, indent=1, ensure_ascii=True), encoding="utf-8")
+
+
+def synthetic_goods(start: int, count: int, rng: random.Random) -> list[dict[str, Any]]:
+    goods: list[dict[str, Any]] = []
+    for index in range(start, start + count):
+        price = round(rng.uniform(2.0, 40.0), 2)
+        supply = round(rng.uniform(200.0, 900.0), 1)
+        goods.append(
+            {
+                "id": f"good_{index:04d}",
+                "label": f"Good {index:04d}",
+                "base_supply": supply,
+                "base_demand": round(supply * rng.uniform(0.95, 1.03), 1),
+                "base_price": price,
+                "min_price": round(price * 0.4, 2),
+                "max_price": round(price * 3.0, 2),
+            }
+        )
+    return goods
+
+
+def synthetic_sectors(start: int, count: int, good_ids: list[str], rng: random.Random) -> list[dict[str, Any]]:
+    sectors: list[dict[str, Any]] = []
+    for index in range(start, start + count):
+        picks = rng.sample(good_ids, min(len(good_ids), 5))
+        sectors.append(
+            {
+                "id": f"sector_{index:03d}",
+                "label": f"Sector {index:03d}",
+                "capacity": round(rng.uniform(80.0, 120.0), 1),
+                "efficiency": round(rng.uniform(0.7, 0.85), 2),
+                "upkeep": round(rng.uniform(40.0, 120.0), 1),
+                "inputs": {good_id: round(rng.uniform(0.2, 1.0), 2) for good_id in picks[:2]},
+                "outputs": {good_id: round(rng.uniform(0.5, 3.0), 2) for good_id in picks[2:]},
+            }
+        )
+    return sectors
+
+
+def generate_pack(
+    dest: Path,
+    goods: int,
+    sectors: int,
+    seed: int = 0,
+    base_dir: Path | None = None,
+) -> Path:
+    """Write a valid data pack with ``goods`` goods and ``sectors`` sectors to ``dest``.
+
+    The base pack (the shipped one by default) is copied unchanged and extended with
+    generated goods and sectors, so its policies, events and goals keep pointing at
+    real ids. Every generated good is produced by at least one sector and has a small
+    population need. Same arguments, same files.
+    """
+    source = base_dir or package_data_dir()
+    base_goods = _read_rows(source / "goods.json")
+    base_sectors = _read_rows(source / "sectors.json")
+    if goods < len(base_goods) or sectors < len(base_sectors):
+        raise ValueError(
+            f"Synthetic pack needs at least {len(base_goods)} goods and {len(base_sectors)} sectors (the base pack)."
+        )
+
+    rng = random.Random(seed)
+    extra_goods = synthetic_goods(len(base_goods), goods - len(base_goods), rng)
+    all_goods = base_goods + extra_goods
+    all_ids = [good["id"] for good in all_goods]
+    all_sectors = base_sectors + synthetic_sectors(len(base_sectors), sectors - len(base_sectors), all_ids, rng)
+    # Round-robin producers so no generated good is left without supply.
+    for offset, good in enumerate(extra_goods):
+        outputs = all_sectors[offset % len(all_sectors)].setdefault("outputs", {})
+        outputs.setdefault(good["id"], round(rng.uniform(0.5, 3.0), 2))
+
+    config = _read_rows(source / "config.json")
+    needs = config.setdefault("population_needs", {})
+    for good in extra_goods:
+        needs[good["id"]] = round(rng.uniform(0.00005, 0.0005), 6)
+
+    dest.mkdir(parents=True, exist_ok=True)
+    for path in source.glob("*.json"):
+        shutil.copyfile(path, dest / path.name)
+    _write_rows(dest / "goods.json", all_goods)
+    _write_rows(dest / "sectors.json", all_sectors)
+    _write_rows(dest / "config.json", config)
+    return dest
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import pickle
+import re
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
+from shinon_os import __version__
+from shinon_os.sim.effects import WORLD_EFFECT_FIELDS, EffectLayout, EffectTerm, compile_policy_effects
 from shinon_os.sim.model import GameState, MarketGood, SectorState, WorldState
 from shinon_os.util.paths import package_data_dir
+from shinon_os.util.rng import RNG_MODES
 from shinon_os.util.timeutil import utc_now_iso
 
+# Bump when DataBundle or the parsing below changes shape; stale cache files are then ignored.
+_BUNDLE_CACHE_VERSION = 2
+
 
 @dataclass(frozen=True)
 class PolicyDefinition:
@@ -24,6 +35,13 @@ class PolicyDefinition:
     magnitude: dict[str, float]
     effects: dict[str, Any]
     constraints: dict[str, Any]
+    effect_terms: tuple[EffectTerm, ...] = ()
+
+
+WORLD_CONDITION_FIELDS = WORLD_EFFECT_FIELDS
+
+# (scope, key, bound, threshold): scope is "world" or "good_price", bound is "min" or "max".
+ConditionTerm = tuple[str, str, str, float]
 
 
 @dataclass(frozen=True)
@@ -36,6 +54,7 @@ class EventDefinition:
     base_weight: float
     conditions: dict[str, Any]
     effects: dict[str, Any]
+    compiled_conditions: tuple[ConditionTerm, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -74,10 +93,14 @@ class DataBundle:
     soft_goals: list[SoftGoalDefinition]
     intel_hints: list[IntelHintDefinition]
 
-    def goods_by_id(self) -> dict[str, dict[str, Any]]:
+    # Lookup indexes are built on first use and then shared; the bundle is frozen,
+    # so callers must treat them as read-only.
+    @cached_property
+    def goods_index(self) -> dict[str, dict[str, Any]]:
         return {g["id"]: g for g in self.goods}
 
-    def sector_io_defs(self) -> dict[str, dict[str, dict[str, float]]]:
+    @cached_property
+    def sector_io_index(self) -> dict[str, dict[str, dict[str, float]]]:
         return {
             sector["id"]: {
                 "inputs": dict(sector.get("inputs", {})),
@@ -86,8 +109,45 @@ class DataBundle:
             for sector in self.sectors
         }
 
-    def sector_ids(self) -> set[str]:
-        return {s["id"] for s in self.sectors}
+    @cached_property
+    def sector_id_set(self) -> frozenset[str]:
+        return frozenset(s["id"] for s in self.sectors)
+
+    @cached_property
+    def good_id_set(self) -> frozenset[str]:
+        return frozenset(g["id"] for g in self.goods)
+
+    @cached_property
+    def effect_layout(self) -> EffectLayout:
+        return EffectLayout([g["id"] for g in self.goods], [s["id"] for s in self.sectors])
+
+    @cached_property
+    def price_bounds(self) -> dict[str, tuple[float, float]]:
+        return {g["id"]: (float(g["min_price"]), float(g["max_price"])) for g in self.goods}
+
+    def goods_by_id(self) -> dict[str, dict[str, Any]]:
+        return self.goods_index
+
+    def sector_io_defs(self) -> dict[str, dict[str, dict[str, float]]]:
+        return self.sector_io_index
+
+    def sector_ids(self) -> frozenset[str]:
+        return self.sector_id_set
+
+
+def compile_conditions(event_id: str, conditions: dict[str, Any]) -> tuple[ConditionTerm, ...]:
+    terms: list[ConditionTerm] = []
+    for section, scope, bound in (
+        ("world_min", "world", "min"),
+        ("world_max", "world", "max"),
+        ("good_price_min", "good_price", "min"),
+        ("good_price_max", "good_price", "max"),
+    ):
+        for key, value in conditions.get(section, {}).items():
+            if scope == "world" and key not in WORLD_CONDITION_FIELDS:
+                raise ValueError(f"Event {event_id} condition references unknown world field: {key}")
+            terms.append((scope, str(key), bound, float(value)))
+    return tuple(terms)
 
 
 def _read_json(path: Path) -> Any:
@@ -95,6 +155,59 @@ def _read_json(path: Path) -> Any:
         return json.load(fh)
 
 
+def apply_config_overrides(config: dict[str, Any], overrides: dict[str, Any]) -> None:
+    """Set dotted keys such as ``"economy.rng_mode"`` in place; unknown keys are rejected."""
+    for dotted, value in overrides.items():
+        *parents, leaf = str(dotted).split(".")
+        node: Any = config
+        for part in parents:
+            if not isinstance(node, dict) or part not in node:
+                raise ValueError(f"Unknown config key: {dotted}")
+            node = node[part]
+        if not isinstance(node, dict) or leaf not in node:
+            raise ValueError(f"Unknown config key: {dotted}")
+        node[leaf] = value
+
+
+# Lowercase word tokens: the parser matches targets against lowercased input, and
+# metric names use "." to separate a good id from its column ("grain.price").
+_ID_PATTERN = re.compile(r"[a-z0-9_]+(?:-[a-z0-9_]+)*")
+
+
+def _unique_ids(kind: str, rows: list[dict[str, Any]]) -> frozenset[str]:
+    seen: set[str] = set()
+    for row in rows:
+        row_id = row["id"]
+        if not isinstance(row_id, str) or not _ID_PATTERN.fullmatch(row_id):
+            raise ValueError(f"{kind} id must be a lowercase token: {row_id!r}")
+        if row_id in seen:
+            raise ValueError(f"Duplicate {kind.lower()} id: {row_id}")
+        seen.add(row_id)
+    return frozenset(seen)
+
+
+def _check_refs(owner: str, mapping: dict[str, Any], known: frozenset[str], allow_target: bool = False) -> None:
+    for key in mapping:
+        if key not in known and not (allow_target and key == "target"):
+            raise ValueError(f"{owner} references unknown id: {key}")
+
+
+def _check_effect_refs(
+    owner: str,
+    effects: dict[str, Any],
+    good_ids: frozenset[str],
+    sector_ids: frozenset[str],
+) -> None:
+    """Keyed effect maps (``good_*`` / ``sector_*``) may only name pack ids or ``"target"``."""
+    for section, value in effects.items():
+        if not isinstance(value, dict):
+            continue
+        if section.startswith("good_"):
+            _check_refs(f"{owner} {section}", value, good_ids, allow_target=True)
+        elif section.startswith("sector_"):
+            _check_refs(f"{owner} {section}", value, sector_ids, allow_target=True)
+
+
 def _validate_data(
     config: dict[str, Any],
     goods: list[dict[str, Any]],
@@ -109,16 +222,31 @@ def _validate_data(
     if not required_world.issubset(set(config.get("world", {}).keys())):
         raise ValueError("config.world is missing required keys.")
 
-    if len(goods) != 8:
-        raise ValueError("MVP requires exactly 8 goods.")
+    market_engine = config.get("economy", {}).get("market_engine", "reference")
+    if market_engine not in {"reference", "vector"}:
+        raise ValueError("config.economy.market_engine must be 'reference' or 'vector'.")
+    if config.get("economy", {}).get("rng_mode", "compat") not in RNG_MODES:
+        raise ValueError(f"config.economy.rng_mode must be one of {', '.join(RNG_MODES)}.")
+
+    if not goods:
+        raise ValueError("Data pack requires at least one good.")
     for good in goods:
         for field in ("id", "base_supply", "base_demand", "base_price", "min_price", "max_price"):
             if field not in good:
                 raise ValueError(f"Good entry missing field: {field}")
-
-    sector_ids = {sector.get("id") for sector in sectors}
-    if sector_ids != {"agriculture", "industry", "services"}:
-        raise ValueError("MVP requires sectors: agriculture, industry, services.")
+    good_ids = _unique_ids("Good", goods)
+
+    if not sectors:
+        raise ValueError("Data pack requires at least one sector.")
+    for sector in sectors:
+        for field in ("id", "capacity", "efficiency", "upkeep"):
+            if field not in sector:
+                raise ValueError(f"Sector entry missing field: {field}")
+    sector_ids = _unique_ids("Sector", sectors)
+    for sector in sectors:
+        for section in ("inputs", "outputs"):
+            _check_refs(f"Sector {sector['id']} {section}", sector.get(section, {}), good_ids)
+    _check_refs("config.population_needs", config.get("population_needs", {}), good_ids)
 
     if len(policies) < 8:
         raise ValueError("MVP requires at least 8 policies.")
@@ -126,6 +254,7 @@ def _validate_data(
         for field in ("id", "label", "description", "cost", "duration_ticks", "cooldown_ticks", "magnitude", "effects", "constraints"):
             if field not in policy:
                 raise ValueError(f"Policy missing field: {field}")
+        _check_effect_refs(f"Policy {policy['id']}", policy["effects"], good_ids, sector_ids)
 
     if len(events) < 10:
         raise ValueError("MVP requires at least 10 event templates.")
@@ -133,6 +262,10 @@ def _validate_data(
         for field in ("id", "label", "description", "base_weight", "effects"):
             if field not in event:
                 raise ValueError(f"Event missing field: {field}")
+        _check_effect_refs(f"Event {event['id']}", event["effects"], good_ids, sector_ids)
+        conditions = event.get("conditions", {})
+        for section in ("good_price_min", "good_price_max"):
+            _check_refs(f"Event {event['id']} {section}", conditions.get(section, {}), good_ids)
 
     for rule in unlocks:
         for field in ("policy_id", "min_turn", "min_actions"):
@@ -150,9 +283,72 @@ def _validate_data(
                 raise ValueError(f"Intel hint missing field: {field}")
 
 
-def load_data(data_dir: Path | None = None) -> DataBundle:
+def bundle_cache_key(root: Path, config_overrides: dict[str, Any] | None = None) -> str:
+    """Content hash of ``root/*.json`` plus anything else that changes the parsed bundle."""
+    digest = hashlib.sha256(f"{_BUNDLE_CACHE_VERSION}:{__version__}".encode("ascii"))
+    for path in sorted(root.glob("*.json")):
+        digest.update(path.name.encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    digest.update(json.dumps(config_overrides or {}, sort_keys=True, ensure_ascii=True).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _read_cached_bundle(path: Path) -> DataBundle | None:
+    try:
+        with path.open("rb") as fh:
+            bundle = pickle.load(fh)
+    except Exception:
+        return None
+    return bundle if isinstance(bundle, DataBundle) else None
+
+
+def _write_cached_bundle(path: Path, bundle: DataBundle) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as fh:
+            pickle.dump(bundle, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        return
+    # Every pack edit or upgrade mints a new key; drop the bundles it superseded.
+    for stale in path.parent.glob("bundle-*.pickle"):
+        if stale != path:
+            try:
+                stale.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
+def load_data(
+    data_dir: Path | None = None,
+    config_overrides: dict[str, Any] | None = None,
+    cache_dir: Path | None = None,
+) -> DataBundle:
+    """Parse and validate the data pack; with ``cache_dir`` the validated bundle is reused.
+
+    Cache files are named by :func:`bundle_cache_key`, so editing any ``*.json`` in the
+    pack (or passing different overrides) misses the cache; writing the new file removes
+    the other cached bundles. Unreadable or foreign cache files are ignored and the pack
+    is parsed again.
+    """
     root = data_dir or package_data_dir()
+    if cache_dir is None:
+        return _parse_bundle(root, config_overrides)
+    cache_path = cache_dir / f"bundle-{bundle_cache_key(root, config_overrides)}.pickle"
+    bundle = _read_cached_bundle(cache_path)
+    if bundle is None:
+        bundle = _parse_bundle(root, config_overrides)
+        _write_cached_bundle(cache_path, bundle)
+    return bundle
+
+
+def _parse_bundle(root: Path, config_overrides: dict[str, Any] | None) -> DataBundle:
     config = _read_json(root / "config.json")
+    if config_overrides:
+        apply_config_overrides(config, config_overrides)
     goods = _read_json(root / "goods.json")
     sectors = _read_json(root / "sectors.json")
     policies_raw = _read_json(root / "policies.json")
@@ -163,6 +359,7 @@ def load_data(data_dir: Path | None = None) -> DataBundle:
 
     _validate_data(config, goods, sectors, policies_raw, events_raw, unlocks_raw, soft_goals_raw, intel_hints_raw)
 
+    effect_layout = EffectLayout([g["id"] for g in goods], [s["id"] for s in sectors])
     policies: dict[str, PolicyDefinition] = {}
     for row in policies_raw:
         policies[row["id"]] = PolicyDefinition(
@@ -183,6 +380,7 @@ def load_data(data_dir: Path | None = None) -> DataBundle:
             },
             effects=dict(row["effects"]),
             constraints=dict(row.get("constraints", {})),
+            effect_terms=compile_policy_effects(row["id"], row["effects"], effect_layout),
         )
 
     events: list[EventDefinition] = []
@@ -197,6 +395,7 @@ def load_data(data_dir: Path | None = None) -> DataBundle:
                 base_weight=float(row["base_weight"]),
                 conditions=dict(row.get("conditions", {})),
                 effects=dict(row.get("effects", {})),
+                compiled_conditions=compile_conditions(row["id"], dict(row.get("conditions", {}))),
             )
         )
 
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import importlib.util
+
 from shinon_os.app_service import AppService
 from shinon_os.i18n import t
 from shinon_os.view_models import OSResponse, StatusModel
 
 
 def textual_available() -> bool:
+    # Probe without importing: loading Textual costs more than the rest of startup.
     try:
-        import textual  # noqa: F401
-    except Exception:
+        return importlib.util.find_spec("textual") is not None
+    except (ImportError, ValueError):
         return False
-    return True
 
 
 def _render_bar(value: float, label: str) -> str:
@@ -51,12 +53,26 @@ class TextualSession:
             def compose(self) -> ComposeResult:
                 yield Container(
                     Static(t("ui.boot.title"), id="boot_title"),
+                    Static("", id="boot_log"),
                     id="boot_center",
                 )
 
             def on_mount(self) -> None:
-                delay = 0.2 if not service.capabilities.animations_enabled else 3.0
-                self.set_timer(delay, lambda: self.app.push_screen(MainScreen()))
+                self._boot_lines: list[str] = []
+                # Boot on a worker thread so each stage line paints as it finishes; the DB
+                # stages hop back onto the event loop, which keeps using the connection.
+                self.run_worker(self._boot, thread=True)
+
+            def _boot(self) -> None:
+                service.bootstrap(
+                    emit=lambda msg: self.app.call_from_thread(self._show_stage, msg),
+                    run_on_main=self.app.call_from_thread,
+                )
+                self.app.call_from_thread(self.app.push_screen, MainScreen())
+
+            def _show_stage(self, msg: str) -> None:
+                self._boot_lines.append(msg)
+                self.query_one("#boot_log", Static).update("\n".join(self._boot_lines))
 
         class MainScreen(Screen):
             response: reactive[OSResponse | None] = reactive(None)
@@ -91,7 +107,6 @@ class TextualSession:
 
             def on_mount(self) -> None:
                 self._chat_lines: list[str] = []
-                service.bootstrap()
                 self._refresh_labels()
                 self._update_view("dashboard")
                 if service.capabilities.animations_enabled and not service.capabilities.safe_mode:
@@ -185,6 +200,7 @@ class TextualSession:
             Screen { background: #000000; color: #d0f4ff; }
             #boot_center { align: center middle; height: 100%; background: #000000; }
             #boot_title { content-align: center middle; color: #6cf0ff; text-style: bold; }
+            #boot_log { content-align: center middle; color: #4a8fa0; }
             #frame { height: 1fr; padding: 1; }
             #upper { height: 2fr; }
             #world_panel { border: solid #0ff; padding: 1; width: 3fr; }
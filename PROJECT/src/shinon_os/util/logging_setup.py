@@ -2,26 +2,64 @@ from __future__ import annotations
 
 import json
 import os
+import queue
 import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, TextIO, Union
 
 from shinon_os.util.timeutil import utc_now_iso
 
+LOG_LEVELS = {"debug": 10, "info": 20, "error": 40}
+# Level each channel is emitted at; "info" (the default) keeps sim + error and drops debug.
+CHANNEL_LEVELS = {"debug": 10, "sim": 20, "error": 40}
+CHANNEL_FILES = {"debug": "shinon_debug.jsonl", "sim": "sim.jsonl", "error": "errors.jsonl"}
+
+Payload = Union[dict[str, Any], Callable[[], dict[str, Any]]]
+
 
 class JsonlRotatingLogger:
-    def __init__(self, log_dir: Path, max_bytes: int = 2_000_000, backups: int = 3) -> None:
+    """JSONL logs with size-based rotation.
+
+    By default lines are handed to a background writer thread through a bounded
+    queue and written in batches to persistent file handles; sizes are tracked in
+    memory instead of ``stat``-ing the file per line. Call :meth:`flush` to wait
+    for pending lines and :meth:`close` on shutdown; rows logged after ``close``
+    are still appended, but without keeping a handle open.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        max_bytes: int = 2_000_000,
+        backups: int = 3,
+        async_writes: bool = True,
+        queue_size: int = 10_000,
+        flush_interval: float = 0.5,
+        level: str = "info",
+        sample_rates: dict[str, float] | None = None,
+    ) -> None:
         self.log_dir = log_dir
         self.max_bytes = max_bytes
         self.backups = backups
+        self.flush_interval = flush_interval
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
+        self._threshold = LOG_LEVELS["info"]
+        self.set_level(level)
+        self._sample_rates: dict[str, float] = {}
+        self._sample_credit: dict[str, float] = {}
+        for channel, rate in (sample_rates or {}).items():
+            self.set_sample_rate(channel, rate)
+        self._handles: dict[str, tuple[TextIO, int]] = {}
+        self._closed = False
+        self._queue: queue.Queue[tuple[str, str] | None] | None = None
+        self._thread: threading.Thread | None = None
+        if async_writes:
+            self._queue = queue.Queue(maxsize=max(1, queue_size))
+            self._thread = threading.Thread(target=self._run, name="shinon-log-writer", daemon=True)
+            self._thread.start()
 
-    def _rotate_if_needed(self, path: Path) -> None:
-        if not path.exists():
-            return
-        if path.stat().st_size < self.max_bytes:
-            return
+    def _rotate(self, path: Path) -> None:
         for idx in range(self.backups, 0, -1):
             src = path.with_suffix(path.suffix + f".{idx}")
             dst = path.with_suffix(path.suffix + f".{idx + 1}")
@@ -32,19 +70,156 @@ class JsonlRotatingLogger:
                     src.replace(dst)
         path.replace(path.with_suffix(path.suffix + ".1"))
 
+    def _handle(self, filename: str) -> tuple[TextIO, int]:
+        entry = self._handles.get(filename)
+        if entry is None:
+            fh = (self.log_dir / filename).open("a", encoding="utf-8", newline="")
+            entry = (fh, fh.tell())
+            self._handles[filename] = entry
+        return entry
+
+    def _append(self, filename: str, line: str) -> None:
+        """Write one line; the caller holds ``_lock`` (or is the writer thread)."""
+        fh, size = self._handle(filename)
+        if size >= self.max_bytes:
+            fh.close()
+            del self._handles[filename]
+            self._rotate(self.log_dir / filename)
+            fh, size = self._handle(filename)
+        fh.write(line)
+        self._handles[filename] = (fh, size + len(line.encode("utf-8")))
+
+    def _flush_handles(self) -> None:
+        for fh, _ in self._handles.values():
+            fh.flush()
+
+    def _run(self) -> None:
+        assert self._queue is not None
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = [item]
+            while len(batch) < 512:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            try:
+                with self._lock:
+                    for entry in batch:
+                        if entry is None:
+                            stop = True
+                        else:
+                            self._append(*entry)
+                    self._flush_handles()
+            except OSError:
+                # Logging is best effort; never let a full disk take the writer down.
+                pass
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
     def _write(self, filename: str, payload: dict[str, Any]) -> None:
-        target = self.log_dir / filename
+        # Serialize on the caller's thread: payloads may reference live engine objects.
+        line = json.dumps({"ts": utc_now_iso(), **payload}, ensure_ascii=True) + os.linesep
+        if self._queue is not None and self._thread is not None and self._thread.is_alive():
+            self._queue.put((filename, line))
+            return
+        with self._lock:
+            self._append(filename, line)
+            if self._closed:
+                # Late rows (e.g. errors during shutdown) must not resurrect handles.
+                self._close_handles()
+            else:
+                self._flush_handles()
+
+    def _close_handles(self) -> None:
+        for fh, _ in self._handles.values():
+            fh.close()
+        self._handles.clear()
+
+    def flush(self) -> None:
+        """Block until every queued line has been written and flushed to the OS."""
+        if self._queue is not None and self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+        with self._lock:
+            self._flush_handles()
+
+    def close(self) -> None:
+        self._closed = True
+        if self._queue is not None and self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
         with self._lock:
-            self._rotate_if_needed(target)
-            row = {"ts": utc_now_iso(), **payload}
-            with target.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(row, ensure_ascii=True) + os.linesep)
+            self._close_handles()
+
+    def set_level(self, level: str) -> None:
+        if level not in LOG_LEVELS:
+            raise ValueError(f"Unknown log level: {level} (use {', '.join(LOG_LEVELS)})")
+        self.level = level
+        self._threshold = LOG_LEVELS[level]
+
+    def set_sample_rate(self, channel: str, rate: float) -> None:
+        """Keep roughly ``rate`` of a channel's rows (1.0 = all); deterministic, no RNG involved."""
+        if channel not in CHANNEL_LEVELS:
+            raise ValueError(f"Unknown log channel: {channel}")
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"Sample rate for {channel} must be within [0, 1]")
+        self._sample_rates[channel] = float(rate)
+        self._sample_credit[channel] = 0.0
+
+    def enabled(self, channel: str) -> bool:
+        return CHANNEL_LEVELS[channel] >= self._threshold and self._sample_rates.get(channel, 1.0) > 0.0
+
+    def _sampled(self, channel: str) -> bool:
+        rate = self._sample_rates.get(channel, 1.0)
+        if rate >= 1.0:
+            return True
+        credit = self._sample_credit[channel] + rate
+        if credit >= 1.0:
+            self._sample_credit[channel] = credit - 1.0
+            return True
+        self._sample_credit[channel] = credit
+        return False
+
+    def _log(self, channel: str, payload: Payload) -> None:
+        if CHANNEL_LEVELS[channel] < self._threshold or not self._sampled(channel):
+            return
+        self._write(CHANNEL_FILES[channel], payload() if callable(payload) else payload)
+
+    def sim(self, payload: Payload) -> None:
+        self._log("sim", payload)
+
+    def debug(self, payload: Payload) -> None:
+        """``payload`` may be a zero-argument callable; it is only invoked when the row is kept."""
+        self._log("debug", payload)
+
+    def error(self, payload: Payload) -> None:
+        self._log("error", payload)
+
+
+class NullLogger:
+    """Drop-in for JsonlRotatingLogger when nothing should touch the disk (e.g. sweeps)."""
+
+    def enabled(self, channel: str) -> bool:
+        return False
+
+    def sim(self, payload: Payload) -> None:
+        pass
+
+    def debug(self, payload: Payload) -> None:
+        pass
 
-    def sim(self, payload: dict[str, Any]) -> None:
-        self._write("sim.jsonl", payload)
+    def error(self, payload: Payload) -> None:
+        pass
 
-    def debug(self, payload: dict[str, Any]) -> None:
-        self._write("shinon_debug.jsonl", payload)
+    def flush(self) -> None:
+        pass
 
-    def error(self, payload: dict[str, Any]) -> None:
-        self._write("errors.jsonl", payload)
+    def close(self) -> None:
+        pass
@@ -26,6 +26,13 @@ def default_log_dir() -> Path:
     return path
 
 
+def default_cache_dir() -> Path:
+    override = os.environ.get("SHINON_CACHE_DIR")
+    path = Path(override) if override else user_data_dir() / "cache"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def default_docs_dir() -> Path:
     path = user_data_dir() / "docs"
     path.mkdir(parents=True, exist_ok=True)
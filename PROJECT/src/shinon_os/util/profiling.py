@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from shinon_os.util import rng
+
+# Phases of SimulationEngine._advance_turn, in pipeline order.
+TURN_PHASES = (
+    "validate",
+    "policy_effects",
+    "market",
+    "metrics",
+    "events",
+    "collapse_unlock",
+    "persist",
+    "log",
+    "commit",
+)
+COUNTERS = ("sql_statements", "rows_written", "rng_draws")
+PROFILE_FORMATS = ("jsonl", "chrome")
+
+
+@dataclass(slots=True)
+class TurnProfile:
+    turn: int
+    ok: bool
+    start_ns: int
+    end_ns: int
+    phases: list[tuple[str, int, int]] = field(default_factory=list)
+    counters: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def as_dict(self) -> dict[str, Any]:
+        phase_ms: dict[str, float] = {}
+        for name, start, end in self.phases:
+            phase_ms[name] = phase_ms.get(name, 0.0) + (end - start) / 1e6
+        return {
+            "turn": self.turn,
+            "ok": self.ok,
+            "total_ms": round(self.total_ms, 6),
+            "phases": {name: round(ms, 6) for name, ms in phase_ms.items()},
+            "counters": dict(self.counters),
+        }
+
+
+class TurnProfiler:
+    """Lap timer and counters for the turn pipeline.
+
+    The engine calls :meth:`begin_turn`, then :meth:`split` at the end of each
+    phase, then :meth:`end_turn`; time between two splits is charged to the
+    phase named by the later one. SQL statements are counted through the
+    repository's trace hook, rows written through its ``total_changes`` and RNG
+    draws through :func:`shinon_os.util.rng.draw_total`.
+    """
+
+    enabled = True
+
+    def __init__(self, limit: int = 10_000, clock: Callable[[], int] = time.perf_counter_ns) -> None:
+        self.turns: deque[TurnProfile] = deque(maxlen=limit)
+        self._clock = clock
+        self._repo: Any = None
+        self._statements = 0
+        self._current: TurnProfile | None = None
+        self._last_ns = 0
+        self._base: dict[str, int] = {}
+
+    def attach(self, repo: Any) -> None:
+        self.detach()
+        self._repo = repo
+        repo.set_trace(self._on_statement)
+
+    def detach(self) -> None:
+        if self._repo is not None:
+            self._repo.set_trace(None)
+            self._repo = None
+
+    def _on_statement(self, _sql: str) -> None:
+        self._statements += 1
+
+    def _counter_values(self) -> dict[str, int]:
+        return {
+            "sql_statements": self._statements,
+            "rows_written": int(self._repo.total_changes) if self._repo is not None else 0,
+            "rng_draws": rng.draw_total(),
+        }
+
+    def reset(self) -> None:
+        self.turns.clear()
+        self._current = None
+
+    def begin_turn(self) -> None:
+        now = self._clock()
+        self._current = TurnProfile(turn=-1, ok=False, start_ns=now, end_ns=now)
+        self._last_ns = now
+        self._base = self._counter_values()
+
+    def split(self, phase: str) -> None:
+        current = self._current
+        if current is None:
+            return
+        now = self._clock()
+        current.phases.append((phase, self._last_ns, now))
+        self._last_ns = now
+
+    def end_turn(self, turn: int, ok: bool) -> None:
+        current = self._current
+        if current is None:
+            return
+        current.turn = turn
+        current.ok = ok
+        current.end_ns = self._clock()
+        values = self._counter_values()
+        current.counters = {name: values[name] - self._base.get(name, 0) for name in COUNTERS}
+        self.turns.append(current)
+        self._current = None
+
+    def summary(self) -> dict[str, Any]:
+        phases: dict[str, dict[str, float]] = {}
+        counters = dict.fromkeys(COUNTERS, 0)
+        total_ms = 0.0
+        for profile in self.turns:
+            total_ms += profile.total_ms
+            for name, ms in profile.as_dict()["phases"].items():
+                row = phases.setdefault(name, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+                row["calls"] += 1
+                row["total_ms"] += ms
+                row["max_ms"] = max(row["max_ms"], ms)
+            for name, value in profile.counters.items():
+                counters[name] = counters.get(name, 0) + value
+        ordered = {name: phases[name] for name in TURN_PHASES if name in phases}
+        ordered.update({name: row for name, row in phases.items() if name not in ordered})
+        for row in ordered.values():
+            row["mean_ms"] = row["total_ms"] / row["calls"]
+        return {"turns": len(self.turns), "total_ms": total_ms, "phases": ordered, "counters": counters}
+
+    def write_jsonl(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as fh:
+            for profile in self.turns:
+                fh.write(json.dumps(profile.as_dict(), ensure_ascii=True, sort_keys=True) + "\n")
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Trace Event Format: one complete event per turn and per phase, plus counter tracks."""
+        events: list[dict[str, Any]] = []
+        origin = self.turns[0].start_ns if self.turns else 0
+        for profile in self.turns:
+            args = {"turn": profile.turn, "ok": profile.ok}
+            events.append(_complete("turn", "turn", profile.start_ns - origin, profile.end_ns - profile.start_ns, args))
+            for name, start, end in profile.phases:
+                events.append(_complete(name, "phase", start - origin, end - start, {"turn": profile.turn}))
+            events.append(
+                {
+                    "name": "counters",
+                    "ph": "C",
+                    "ts": (profile.end_ns - origin) / 1000.0,
+                    "pid": 1,
+                    "tid": 1,
+                    "args": dict(profile.counters),
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace(), ensure_ascii=True), encoding="utf-8")
+
+    def export(self, path: Path, fmt: str | None = None) -> str:
+        """Write to ``path``; ``.json`` means a Chrome trace, anything else JSONL unless ``fmt`` says so."""
+        fmt = fmt or ("chrome" if path.suffix.lower() == ".json" else "jsonl")
+        if fmt not in PROFILE_FORMATS:
+            raise ValueError(f"Unsupported profile format: {fmt} (use {', '.join(PROFILE_FORMATS)})")
+        if fmt == "chrome":
+            self.write_chrome_trace(path)
+        else:
+            self.write_jsonl(path)
+        return fmt
+
+
+class NullProfiler:
+    """Stands in when profiling is off so the turn pipeline needs no branches."""
+
+    enabled = False
+
+    def begin_turn(self) -> None:
+        pass
+
+    def split(self, phase: str) -> None:
+        pass
+
+    def end_turn(self, turn: int, ok: bool) -> None:
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def _complete(name: str, cat: str, start_ns: int, dur_ns: int, args: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "name": name,
+        "cat": cat,
+        "ph": "X",
+        "ts": start_ns / 1000.0,
+        "dur": dur_ns / 1000.0,
+        "pid": 1,
+        "tid": 1,
+        "args": args,
+    }
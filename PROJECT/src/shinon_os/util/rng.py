@@ -2,6 +2,33 @@ from __future__ import annotations
 
 import hashlib
 import random
+import threading
+from functools import lru_cache
+from typing import Iterable, Sequence, TypeVar
+
+RNG_MODES = ("compat", "counter")
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN64 = 0x9E3779B97F4A7C15
+_FNV_OFFSET = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+_TO_UNIT = 1.0 / (1 << 53)
+
+T = TypeVar("T")
+
+# Values drawn by simulation streams on each thread; the turn profiler reads
+# deltas on the thread running the turn, so concurrent turns do not mix counts.
+_draws = threading.local()
+
+
+def draw_total() -> int:
+    """Values drawn on the calling thread since it started."""
+    return getattr(_draws, "total", 0)
+
+
+def note_draws(count: int) -> None:
+    """Record ``count`` values drawn from a stream the caller owns (see :func:`stream_rng`)."""
+    _draws.total = getattr(_draws, "total", 0) + count
 
 
 def stable_seed(base_seed: int, *parts: object) -> int:
@@ -16,3 +43,83 @@ def seeded_rng(base_seed: int, *parts: object) -> random.Random:
 
 def bounded_noise(base_seed: int, turn: int, key: str, amplitude: float = 0.01) -> float:
     return seeded_rng(base_seed, "noise", turn, key).uniform(-amplitude, amplitude)
+
+
+def _splitmix64(value: int) -> int:
+    z = (value + _GOLDEN64) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+@lru_cache(maxsize=8192)
+def _part_hash(part: object) -> int:
+    if isinstance(part, int) and not isinstance(part, bool):
+        return part & _MASK64
+    h = _FNV_OFFSET
+    for byte in str(part).encode("utf-8"):
+        h = ((h ^ byte) * _FNV_PRIME) & _MASK64
+    return h
+
+
+def counter_key(base_seed: int, *parts: object) -> int:
+    """Fold ``(seed, stream, turn, key, ...)`` into one 64-bit stream key."""
+    key = _splitmix64(base_seed & _MASK64)
+    for part in parts:
+        key = _splitmix64(key ^ _part_hash(part))
+    return key
+
+
+class CounterRng:
+    """Counter-based SplitMix64 stream: draw ``n`` is a pure function of the key and ``n``.
+
+    Unlike :func:`seeded_rng` there is no hashing or Mersenne Twister setup per
+    stream, so creating one per good per turn is cheap.
+    """
+
+    __slots__ = ("key", "counter")
+
+    def __init__(self, base_seed: int, *parts: object) -> None:
+        self.key = counter_key(base_seed, *parts)
+        self.counter = 0
+
+    def random(self) -> float:
+        value = _splitmix64((self.key + self.counter * _GOLDEN64) & _MASK64)
+        self.counter += 1
+        return (value >> 11) * _TO_UNIT
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def choice(self, seq: Sequence[T]) -> T:
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[min(len(seq) - 1, int(self.random() * len(seq)))]
+
+
+def stream_rng(mode: str, base_seed: int, *parts: object) -> random.Random | CounterRng:
+    """Return a generator for ``parts``; ``compat`` reproduces :func:`seeded_rng` exactly."""
+    if mode == "counter":
+        return CounterRng(base_seed, *parts)
+    return seeded_rng(base_seed, *parts)
+
+
+def noise_vector(base_seed: int, turn: int, keys: Iterable[str], amplitude: float = 0.01, mode: str = "compat") -> list[float]:
+    """Noise for every key of one turn in a single call.
+
+    ``compat`` returns the same values as calling :func:`bounded_noise` per key;
+    ``counter`` matches ``CounterRng(seed, "noise", turn, key).uniform(-a, a)``
+    but folds the seed and turn only once per call.
+    """
+    if mode != "counter":
+        values = [bounded_noise(base_seed, turn, key, amplitude=amplitude) for key in keys]
+        note_draws(len(values))
+        return values
+    turn_key = counter_key(base_seed, "noise", turn)
+    span = 2.0 * amplitude
+    out: list[float] = []
+    for key in keys:
+        value = _splitmix64(_splitmix64(turn_key ^ _part_hash(key)))
+        out.append(-amplitude + span * ((value >> 11) * _TO_UNIT))
+    note_draws(len(out))
+    return out
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep ``ShinonApp(bundle_cache=True)`` from writing into the real user cache."""
+    monkeypatch.setenv("SHINON_CACHE_DIR", str(tmp_path / "shinon-cache"))
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from shinon_os.app import ShinonApp
+from shinon_os.util.logging_setup import JsonlRotatingLogger
+
+
+def _lines(path: Path) -> list[dict[str, object]]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_async_writes_are_ordered_and_flushed(tmp_path: Path) -> None:
+    logger = JsonlRotatingLogger(tmp_path)
+    try:
+        for index in range(200):
+            logger.sim({"i": index})
+        logger.error({"where": "test"})
+        logger.flush()
+        assert [row["i"] for row in _lines(tmp_path / "sim.jsonl")] == list(range(200))
+        assert _lines(tmp_path / "errors.jsonl")[0]["where"] == "test"
+    finally:
+        logger.close()
+    logger.close()
+
+
+def test_rows_after_close_do_not_reopen_handles(tmp_path: Path) -> None:
+    logger = JsonlRotatingLogger(tmp_path)
+    logger.sim({"i": 0})
+    logger.close()
+    logger.error({"where": "late"})
+    logger.sim({"i": 1})
+    assert logger._handles == {}
+    assert [row["i"] for row in _lines(tmp_path / "sim.jsonl")] == [0, 1]
+    assert _lines(tmp_path / "errors.jsonl")[0]["where"] == "late"
+    logger.close()
+
+
+def test_rotation_uses_tracked_size(tmp_path: Path) -> None:
+    logger = JsonlRotatingLogger(tmp_path, max_bytes=400, backups=2, level="debug")
+    try:
+        for index in range(60):
+            logger.debug({"i": index, "pad": "x" * 20})
+        logger.flush()
+    finally:
+        logger.close()
+    current = tmp_path / "shinon_debug.jsonl"
+    assert current.stat().st_size < 400 + 100
+    assert (tmp_path / "shinon_debug.jsonl.1").exists()
+    assert (tmp_path / "shinon_debug.jsonl.2").exists()
+    assert not (tmp_path / "shinon_debug.jsonl.3").exists()
+    assert _lines(current)[-1]["i"] == 59
+
+
+def test_shutdown_flushes_turn_logs(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=":memory:", log_dir=tmp_path / "logs")
+    app.start_new_game(seed=42)
+    app.engine.advance_turn("TAX_ADJUST", 0.05, None)
+    app.shutdown()
+    rows = _lines(tmp_path / "logs" / "sim.jsonl")
+    assert rows[-1]["turn"] == 1
+    assert app.logger._thread is not None and not app.logger._thread.is_alive()
+
+
+def test_disabled_channels_never_build_payloads(tmp_path: Path) -> None:
+    logger = JsonlRotatingLogger(tmp_path, async_writes=False)
+    built: list[int] = []
+
+    def payload() -> dict[str, object]:
+        built.append(1)
+        return {"x": 1}
+
+    try:
+        assert not logger.enabled("debug")
+        logger.debug(payload)
+        assert built == []
+        assert not (tmp_path / "shinon_debug.jsonl").exists()
+        logger.set_level("debug")
+        logger.debug(payload)
+        assert built == [1]
+    finally:
+        logger.close()
+
+
+def test_sampling_keeps_a_fixed_fraction(tmp_path: Path) -> None:
+    logger = JsonlRotatingLogger(tmp_path, async_writes=False, sample_rates={"sim": 0.25})
+    try:
+        for index in range(100):
+            logger.sim(lambda index=index: {"i": index})
+        logger.flush()
+    finally:
+        logger.close()
+    assert len(_lines(tmp_path / "sim.jsonl")) == 25
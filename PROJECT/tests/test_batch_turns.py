@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from shinon_os.__main__ import main
+from shinon_os.app import ShinonApp
+from shinon_os.sim.batch import ScriptedAction, load_script
+
+ACTIONS = [
+    ScriptedAction("SUBSIDY_SECTOR", 1.0, "agriculture"),
+    ScriptedAction("IMPORT_PROGRAM", 10.0, "grain"),
+    ScriptedAction("FUND_RESEARCH", 1.0),
+    ScriptedAction("TAX_ADJUST", 0.05),
+    ScriptedAction("SECURITY_BUDGET", 1.0),
+]
+
+
+def test_batch_matches_turn_by_turn(tmp_path: Path) -> None:
+    single = ShinonApp(db_path=tmp_path / "single.sqlite3", log_dir=tmp_path / "logs")
+    batch = ShinonApp(db_path=tmp_path / "batch.sqlite3", log_dir=tmp_path / "logs")
+    try:
+        single.start_new_game(seed=5)
+        batch.start_new_game(seed=5)
+        for action in ACTIONS:
+            assert single.engine.advance_turn(action.policy_id, action.magnitude, action.target).ok
+        results = batch.engine.advance_turns(ACTIONS, commit_every=2)
+        assert all(result.ok for result in results)
+        assert batch.snapshot() == single.snapshot()
+        assert [row["turn"] for row in batch.repo.history()] == [5, 4, 3, 2, 1]
+        assert not batch.engine.dirty
+    finally:
+        single.shutdown()
+        batch.shutdown()
+
+
+def test_simulate_cli_replays_script(tmp_path: Path, capsys) -> None:
+    script = tmp_path / "actions.jsonl"
+    lines = ["# warmup", ""]
+    lines += [json.dumps({"policy_id": a.policy_id, "magnitude": a.magnitude, "target": a.target}) for a in ACTIONS]
+    lines.append(json.dumps({"policy_id": "NOT_A_POLICY"}))
+    script.write_text("\n".join(lines), encoding="utf-8")
+    assert len(load_script(script)) == 6
+
+    db_path = tmp_path / "cli.sqlite3"
+    main(["simulate", "--script", str(script), "--db", str(db_path), "--log-dir", str(tmp_path / "logs"), "--seed", "5", "--commit-every", "2"])
+    report = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert report["applied"] == 5
+    assert report["rejected"] == 1
+    assert report["snapshot"]["turn"] == 5
+
+    reopened = ShinonApp(db_path=db_path, log_dir=tmp_path / "logs")
+    try:
+        assert reopened.current_turn() == 5
+    finally:
+        reopened.shutdown()
+
+
+def _fail_on_turn(monkeypatch, app: ShinonApp, failing_turn: int) -> None:
+    """Make the policy-effects phase raise once the world reaches ``failing_turn``."""
+    original = app.engine._collect_policy_effects
+
+    def collect(state):
+        if state.world.turn == failing_turn:
+            raise RuntimeError("injected failure")
+        return original(state)
+
+    monkeypatch.setattr(app.engine, "_collect_policy_effects", collect)
+
+
+def test_failure_mid_batch_rolls_back_to_last_commit(monkeypatch, tmp_path: Path) -> None:
+    app = ShinonApp(db_path=tmp_path / "fail.sqlite3", log_dir=tmp_path / "logs")
+    try:
+        app.start_new_game(seed=5)
+        _fail_on_turn(monkeypatch, app, 4)
+        with pytest.raises(RuntimeError, match="injected failure"):
+            app.engine.advance_turns(ACTIONS, commit_every=2)
+        assert app.current_turn() == 2
+        assert [row["turn"] for row in app.repo.history()] == [2, 1]
+    finally:
+        app.shutdown()
+
+
+def test_write_behind_failure_is_not_swallowed(monkeypatch, tmp_path: Path) -> None:
+    app = ShinonApp(db_path=tmp_path / "behind.sqlite3", log_dir=tmp_path / "logs")
+    try:
+        app.start_new_game(seed=5)
+        app.engine.autoflush = False
+        for action in ACTIONS[:3]:
+            assert app.engine.advance_turn(action.policy_id, action.magnitude, action.target).ok
+        _fail_on_turn(monkeypatch, app, 4)
+        with pytest.raises(RuntimeError, match="injected failure"):
+            app.engine.advance_turn(ACTIONS[3].policy_id, ACTIONS[3].magnitude, ACTIONS[3].target)
+    finally:
+        app.shutdown()
+
+
+def test_autoflush_failure_keeps_the_pre_turn_state(monkeypatch, tmp_path: Path) -> None:
+    app = ShinonApp(db_path=tmp_path / "flushed.sqlite3", log_dir=tmp_path / "logs")
+    try:
+        app.start_new_game(seed=5)
+        for action in ACTIONS[:3]:
+            assert app.engine.advance_turn(action.policy_id, action.magnitude, action.target).ok
+        _fail_on_turn(monkeypatch, app, 4)
+        result = app.engine.advance_turn(ACTIONS[3].policy_id, ACTIONS[3].magnitude, ACTIONS[3].target)
+        assert not result.ok
+        assert "internal error" in result.message
+        assert app.current_turn() == 3
+        assert [row["turn"] for row in app.repo.history()] == [3, 2, 1]
+    finally:
+        app.shutdown()
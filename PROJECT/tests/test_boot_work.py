@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from shinon_os import i18n
+from shinon_os.app import ShinonApp
+
+
+def test_boot_is_bounded_by_work_not_budget(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=tmp_path / "boot.sqlite3", log_dir=tmp_path / "logs")
+    try:
+        app.start_new_game(seed=7)
+        app.engine.invalidate()
+        i18n._cache.clear()
+        lines: list[str] = []
+        start = time.perf_counter()
+        app.run_boot_sequence(emit=lines.append)
+        assert time.perf_counter() - start < sum(app.boot_sequence_model().durations_ms) / 1000.0
+        model = app.boot_sequence_model()
+        assert model.status == "DONE"
+        assert len(model.elapsed_ms) == len(model.stages)
+        assert lines[1].startswith("[BOOT] DB mount / migration check ... ")
+        assert set(i18n._cache) == {"de", "en"}
+        assert app.engine._state is not None
+    finally:
+        app.shutdown()
+
+
+def test_sleep_fn_pads_stages_up_to_budget(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=":memory:", log_dir=tmp_path / "logs")
+    try:
+        pauses: list[float] = []
+        app.run_boot_sequence(emit=lambda _: None, sleep_fn=pauses.append)
+        model = app.boot_sequence_model()
+        for pause, budget, elapsed in zip(pauses, model.durations_ms, model.elapsed_ms):
+            assert pause == pytest.approx((budget - elapsed) / 1000.0)
+        assert len(pauses) == len(model.stages)
+    finally:
+        app.shutdown()
+
+
+def test_db_stages_stay_on_main_thread_and_failures_surface(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=":memory:", log_dir=tmp_path / "logs")
+    threads: dict[str, str] = {}
+
+    def record(name: str):
+        def work() -> None:
+            threads[name] = threading.current_thread().name
+
+        return work
+
+    def boom() -> None:
+        raise RuntimeError("subsystem down")
+
+    try:
+        app._boot_tasks = lambda: [
+            (record("pool"), False, False),
+            (record("main"), True, False),
+            (boom, False, False),
+            (record("end"), True, True),
+        ]
+        with pytest.raises(RuntimeError, match="subsystem down"):
+            app.run_boot_sequence(emit=lambda _: None)
+        assert threads["main"] == threading.main_thread().name
+        assert threads["pool"].startswith("shinon-boot")
+        assert "end" not in threads
+        assert app.boot_sequence_model().status == "FAILED"
+    finally:
+        app.shutdown()
+
+
+def test_pack_load_and_db_mount_overlap(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=":memory:", log_dir=tmp_path / "logs")
+    # Only passes if both stages are waiting at the same time.
+    barrier = threading.Barrier(2, timeout=5)
+    try:
+        app._boot_tasks = lambda: [
+            (barrier.wait, False, False),
+            (barrier.wait, True, False),
+            (lambda: None, True, True),
+        ]
+        lines: list[str] = []
+        app.run_boot_sequence(emit=lines.append)
+        assert [line.split(" ... ")[0] for line in lines[:-1]] == [f"[BOOT] {stage}" for stage in app._boot_model.stages]
+        assert app.boot_sequence_model().status == "DONE"
+    finally:
+        app.shutdown()
+
+
+def test_deferred_boot_loads_pack_and_db_in_stages(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=tmp_path / "deferred.sqlite3", log_dir=tmp_path / "logs", defer_boot=True)
+    assert not hasattr(app, "bundle") and not hasattr(app, "repo")
+    # Stand-in for a UI event loop: the thread that owns the connection after boot.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ui-loop") as loop:
+        routed: list[str] = []
+
+        def run_on_main(fn, *args):
+            routed.append(fn.__name__)
+            return loop.submit(fn, *args).result()
+
+        lines: list[str] = []
+        worker = threading.Thread(
+            target=app.run_boot_sequence,
+            kwargs={"emit": lines.append, "run_on_main": run_on_main},
+            name="boot-worker",
+        )
+        worker.start()
+        worker.join()
+        try:
+            assert app.boot_sequence_model().status == "DONE"
+            assert len(routed) == 3 and len(lines) == len(app.boot_sequence_model().stages) + 1
+            assert loop.submit(app.has_existing_game).result() is False
+            loop.submit(app.start_new_game, 3).result()
+            assert loop.submit(app.current_turn).result() == 0
+        finally:
+            loop.submit(app.shutdown).result()
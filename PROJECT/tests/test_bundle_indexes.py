@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from shinon_os.sim.worldgen import load_data
+
+
+def test_bundle_indexes_are_built_once() -> None:
+    bundle = load_data()
+    assert bundle.goods_by_id() is bundle.goods_by_id() is bundle.goods_index
+    assert bundle.sector_io_defs() is bundle.sector_io_index
+    assert bundle.sector_ids() == {sector["id"] for sector in bundle.sectors}
+    assert set(bundle.goods_index) == {good["id"] for good in bundle.goods}
+    grain = bundle.goods_index["grain"]
+    assert bundle.price_bounds["grain"] == (float(grain["min_price"]), float(grain["max_price"]))
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from shinon_os.persistence.repo import CASHFLOW_WINDOW, StateRepository
+
+
+def _json_trailing(repo: StateRepository, window: int, include_current: float) -> float:
+    total = float(include_current)
+    for row in repo.history(limit=window - 1):
+        total += float(row["summary"].get("net_cashflow", 0.0))
+    return total
+
+
+def test_trailing_cashflow_matches_history_json(tmp_path: Path) -> None:
+    db_path = tmp_path / "cash.sqlite3"
+    repo = StateRepository(db_path)
+    try:
+        for turn in range(1, CASHFLOW_WINDOW + 6):
+            repo.append_history(turn, "TAX_ADJUST", 0, {"net_cashflow": round(turn * 1.37 - 9.1, 3)})
+            assert repo.trailing_cashflow(3, 0.25) == _json_trailing(repo, 3, 0.25)
+        for window in (1, 3, CASHFLOW_WINDOW + 1, CASHFLOW_WINDOW + 3):
+            assert repo.trailing_cashflow(window, 5.0) == _json_trailing(repo, window, 5.0)
+
+        reopened = StateRepository(db_path)
+        try:
+            assert reopened.trailing_cashflow(3, 0.0) == repo.trailing_cashflow(3, 0.0)
+        finally:
+            reopened.close()
+    finally:
+        repo.close()
+
+
+def test_cashflow_between_is_turn_ordered(tmp_path: Path) -> None:
+    repo = StateRepository(tmp_path / "range.sqlite3")
+    try:
+        for turn, value in [(1, 10.0), (2, -4.0), (3, 2.5), (4, 1.0)]:
+            repo.append_history(turn, "TAX_ADJUST", 0, {"net_cashflow": value})
+        assert repo.cashflow_between(2, 3) == [(2, -4.0), (3, 2.5)]
+        assert repo.trailing_cashflow(3) == 2.5 + 1.0
+    finally:
+        repo.close()
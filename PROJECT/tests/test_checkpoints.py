@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from shinon_os.persistence.base import open_repository
+from shinon_os.persistence.checkpoints import SIM_META_KEYS, decode_checkpoint, encode_checkpoint
+from shinon_os.persistence.repo import state_rows
+from shinon_os.sim.batch import ScriptedAction
+from shinon_os.sim.engine import EMERGENCY_POLICY_IDS, SimulationEngine
+from shinon_os.sim.worldgen import load_data
+from shinon_os.util.logging_setup import NullLogger
+
+TARGETS = {"sector": "agriculture", "good": "grain"}
+# Format version 1 payloads as stored in state_checkpoints; decoding them must keep working.
+FIXTURE_DELTA = {
+    "world": (3, 1250.75, 0.30000000000000004, 1e-05, -2.5, 0, 4, "2026-01-01T00:00:00"),
+    "market": {"grain": ("grain", 10.0, 12.5, 1.1, 1.0)},
+    "policies_removed": ["TAX_ADJUST"],
+    "meta": {"collapse_active": "0", "last_intel_hint_id": None},
+}
+FIXTURE_RAW = bytes.fromhex(
+    "016acb0000007b22776f726c64223a5b332c313235302e37352c302e33303030303030303030303030303030342c3165"
+    "2d30352c2d322e352c302c342c22323032362d30312d30315430303a30303a3030225d2c22706f6c69636965735f7265"
+    "6d6f766564223a5b225441585f41444a555354225d2c226d657461223a7b22636f6c6c617073655f616374697665223a"
+    "2230222c226c6173745f696e74656c5f68696e745f6964223a6e756c6c7d2c227061636b6564223a7b226d61726b6574"
+    "223a5b5b22677261696e225d2c345d7d7d000000000000244000000000000029409a9999999999f13f000000000000f0"
+    "3f"
+)
+FIXTURE_ZLIB = bytes.fromhex(
+    "017a4889558c410ac23010457b96c18d9096696c15b2a9822bb756104442a88386a68db45117a507d12b7919bd81a9ae"
+    "7c7cf87c6678cf20083ab8d9c61c40ec262ce62946b3946134c17f12165388290b79e4cf2c61c0914f438c7d7244f10d"
+    "ec199cadd185a6563654d92b0d5ec8175bb958ae36eb7cf8a8c829101d14d618756e49aac2e92b8100040646b54eeada"
+    "9191275f527b437d31a6f76a559483b0834a352539afdec1b151baf6da64dff7c197d1fcd7e3f9e33ef0ce7efb957d00"
+    "1c4c4375"
+)
+
+
+def _engine(db_path: Path | str, snapshot_every: int = 7) -> SimulationEngine:
+    # A deep treasury keeps some policy affordable every turn, so the game never stalls.
+    bundle = load_data(config_overrides={"world.treasury": 10_000_000})
+    engine = SimulationEngine(bundle, open_repository(db_path), NullLogger(), snapshot_every=snapshot_every)
+    engine.new_game(seed=13)
+    return engine
+
+
+def _fingerprint(engine: SimulationEngine, with_ts: bool = True) -> dict[str, object]:
+    rows = state_rows(engine.load_state())
+    if not with_ts:
+        rows["world"] = rows["world"][:-1]
+    rows["unlocked"] = engine.repo.unlocked_policy_rows()
+    rows["meta"] = {key: engine.repo.get_str_meta(key) for key in SIM_META_KEYS}
+    return rows
+
+
+def _play(engine: SimulationEngine, turns: int) -> tuple[list[ScriptedAction], list[dict[str, object]]]:
+    """Each turn applies the first policy that is available, rotating the starting point.
+
+    Returns the applied actions and a fingerprint per turn (index 0 is the new game).
+    """
+    policy_ids = sorted(pid for pid in engine.bundle.policies if pid not in EMERGENCY_POLICY_IDS)
+    applied: list[ScriptedAction] = []
+    prints = [_fingerprint(engine)]
+    for turn in range(turns):
+        for offset in range(len(policy_ids)):
+            policy_id = policy_ids[(turn + offset) % len(policy_ids)]
+            action = ScriptedAction(policy_id, None, TARGETS.get(engine.bundle.policies[policy_id].target_type))
+            if engine.advance_turn(action.policy_id, action.magnitude, action.target).ok:
+                break
+        else:
+            raise AssertionError(f"no policy applicable at turn {turn}")
+        applied.append(action)
+        prints.append(_fingerprint(engine))
+    return applied, prints
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "memory"])
+def test_restore_rebuilds_turn_and_replays_identically(tmp_path: Path, backend: str) -> None:
+    engine = _engine(tmp_path / "game.sqlite3" if backend == "sqlite" else ":memory:")
+    applied, prints = _play(engine, 40)
+
+    chain = engine.repo.checkpoint_chain(23)
+    assert [turn for turn, _, _ in chain] == [21, 22, 23]
+    assert chain[0][1] and not chain[1][1]
+    # A delta only carries the tables that changed.
+    delta = decode_checkpoint(chain[1][2])
+    assert "world" in delta and "sectors" not in delta and "unlocked" not in delta
+
+    state = engine.restore_to(23)
+    assert state is engine.load_state()
+    assert _fingerprint(engine) == prints[23]
+    assert engine.repo.history(limit=1)[0]["turn"] == 23
+    assert engine.repo.metrics_between(0, 100, ["treasury"])["turn"][-1] == 23
+    assert engine.repo.checkpoint_chain(40)[-1][0] == 23
+
+    for turn, action in enumerate(applied[23:], start=24):
+        assert engine.advance_turn(action.policy_id, action.magnitude, action.target).ok
+        expected = dict(prints[turn], world=prints[turn]["world"][:-1])
+        assert _fingerprint(engine, with_ts=False) == expected
+    engine.repo.close()
+
+
+def test_branch_leaves_the_original_untouched(tmp_path: Path) -> None:
+    engine = _engine(tmp_path / "main.sqlite3")
+    applied, prints = _play(engine, 20)
+    on_disk = engine.branch_from(9, tmp_path / "branch.sqlite3")
+    in_memory = engine.branch_from(12)
+    try:
+        assert _fingerprint(on_disk) == prints[9]
+        assert _fingerprint(in_memory) == prints[12]
+        action = applied[9]
+        assert on_disk.advance_turn(action.policy_id, action.magnitude, action.target).ok
+        assert _fingerprint(on_disk, with_ts=False)["world"] == prints[10]["world"][:-1]
+        assert _fingerprint(engine) == prints[20]
+        assert engine.repo.history(limit=1)[0]["turn"] == 20
+
+        reopened = SimulationEngine(engine.bundle, open_repository(tmp_path / "branch.sqlite3"), NullLogger())
+        assert reopened.load_state().world.turn == 10
+        reopened.repo.close()
+    finally:
+        on_disk.repo.close()
+        in_memory.repo.close()
+        engine.repo.close()
+
+
+def test_restore_rejects_unknown_turns(tmp_path: Path) -> None:
+    engine = _engine(":memory:")
+    _play(engine, 3)
+    with pytest.raises(ValueError, match="between 0 and 3"):
+        engine.restore_to(4)
+    with pytest.raises(ValueError, match="forked in memory"):
+        engine.branch_from(1, tmp_path / "nope.sqlite3")
+
+    untracked = _engine(":memory:", snapshot_every=0)
+    _play(untracked, 3)
+    with pytest.raises(RuntimeError, match="No snapshot"):
+        untracked.restore_to(1)
+
+
+def test_stored_payloads_still_decode() -> None:
+    assert encode_checkpoint(FIXTURE_DELTA) == FIXTURE_RAW
+    assert decode_checkpoint(FIXTURE_RAW) == FIXTURE_DELTA
+    assert decode_checkpoint(FIXTURE_ZLIB) == FIXTURE_DELTA
+    mixed = {"market": {"grain": ("grain", 10, 12.5, 1.1, 1.0)}}
+    assert type(decode_checkpoint(encode_checkpoint(mixed))["market"]["grain"][1]) is int
+    for bad in (b"m" + FIXTURE_RAW[1:], FIXTURE_RAW[:40], FIXTURE_RAW[:-3], FIXTURE_ZLIB[:30], b"\x01j[1, 2]"):
+        with pytest.raises(RuntimeError):
+            decode_checkpoint(bad)
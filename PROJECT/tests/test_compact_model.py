@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import copy
+
+from shinon_os.sim.economy import simulate_market
+from shinon_os.sim.metrics import compute_derived_metrics
+from shinon_os.sim.model import MarketTable
+from shinon_os.sim.worldgen import build_initial_state, load_data
+
+
+def test_model_dataclasses_are_slotted() -> None:
+    state = build_initial_state(load_data())
+    objects = [state, state.world, next(iter(state.market.values())), next(iter(state.sectors.values()))]
+    for obj in objects:
+        assert not hasattr(obj, "__dict__")
+    clone = copy.deepcopy(state)
+    assert clone == state and clone.world is not state.world
+
+
+def test_market_table_matches_dict_market() -> None:
+    bundle = load_data()
+    state = build_initial_state(bundle)
+    table = MarketTable.from_market(state.market)
+    assert list(table) == list(state.market)
+    assert table.to_market() == state.market
+
+    row = table["grain"]
+    row.price += 1.0
+    assert table.price[table.good_ids.index("grain")] == state.market["grain"].price + 1.0
+    row.price -= 1.0
+
+    kwargs = dict(
+        world=state.world,
+        sectors=state.sectors,
+        goods_meta=bundle.goods_by_id(),
+        economy_cfg=bundle.config["economy"],
+        population_needs=bundle.config["population_needs"],
+        effects={},
+        seed=5,
+        turn=1,
+    )
+    from_dict = simulate_market(market=state.market, **kwargs)
+    from_table = simulate_market(market=table, **kwargs)
+    assert from_table == from_dict
+    assert compute_derived_metrics(table, from_table, 0.12) == compute_derived_metrics(state.market, from_dict, 0.12)
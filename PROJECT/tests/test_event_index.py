@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import random
+
+from shinon_os.sim.events import EventIndex, choose_event
+from shinon_os.sim.model import MarketGood, WorldState
+from shinon_os.sim.worldgen import EventDefinition, compile_conditions, load_data
+
+
+def _event(idx: int, rng: random.Random) -> EventDefinition:
+    conditions: dict[str, dict[str, float]] = {}
+    if rng.random() < 0.6:
+        conditions["world_min"] = {rng.choice(["unrest", "prosperity", "tech_level"]): rng.uniform(0, 60)}
+    if rng.random() < 0.4:
+        conditions["world_max"] = {rng.choice(["stability", "treasury"]): rng.choice([rng.uniform(20, 80), 40000.0])}
+    if rng.random() < 0.4:
+        conditions["good_price_min"] = {rng.choice(["grain", "fuel", "salt"]): rng.uniform(2, 12)}
+    if rng.random() < 0.3:
+        conditions["good_price_max"] = {rng.choice(["grain", "fuel"]): rng.uniform(4, 16)}
+    event_id = f"EV{idx}"
+    return EventDefinition(
+        event_id=event_id,
+        label_key=None,
+        description_key=None,
+        label=event_id,
+        description=event_id,
+        base_weight=rng.choice([0.0, 0.5, 1.0, 2.5]),
+        conditions=conditions,
+        effects={},
+        compiled_conditions=compile_conditions(event_id, conditions),
+    )
+
+
+def test_index_selects_same_event_as_linear_scan() -> None:
+    rng = random.Random(11)
+    events = [_event(idx, rng) for idx in range(400)]
+    index = EventIndex(events)
+    world = WorldState(0, 50000, 120000, 50.0, 50.0, 20.0, 30.0, "")
+    market = {
+        "grain": MarketGood("grain", 1.0, 1.0, 4.0, 4.0),
+        "fuel": MarketGood("fuel", 1.0, 1.0, 9.0, 9.0),
+    }
+    for turn in range(1, 300):
+        world.turn = turn
+        world.unrest = rng.uniform(0, 70)
+        world.prosperity = rng.choice([world.prosperity, rng.uniform(0, 100)])
+        world.treasury = rng.choice([30000, 50000])
+        market["grain"].price = rng.uniform(2, 16)
+        if turn % 50 == 0:
+            market.pop("fuel", None)
+        elif "fuel" not in market:
+            market["fuel"] = MarketGood("fuel", 1.0, 1.0, 9.0, 9.0)
+        expected = choose_event(events, world, market, seed=3, turn=turn, event_chance=1.0)
+        actual = choose_event(events, world, market, seed=3, turn=turn, event_chance=1.0, index=index)
+        assert actual is expected
+
+
+def test_bundle_events_are_compiled_at_load() -> None:
+    bundle = load_data()
+    strike = next(event for event in bundle.events if event.event_id == "STRIKE")
+    assert strike.compiled_conditions == (("world", "unrest", "min", 25.0),)
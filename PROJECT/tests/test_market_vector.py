@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from shinon_os.sim.economy import simulate_market
+from shinon_os.sim.market_vector import VectorMarketEngine, numpy_available
+from shinon_os.sim.worldgen import build_initial_state, load_data
+
+BACKENDS = [False] + ([True] if numpy_available() else [])
+
+EFFECTS = [
+    {},
+    {
+        "global_output_mult": 0.09,
+        "sector_output_mult": {"agriculture": 0.12},
+        "sector_efficiency_add": {"industry": 0.14},
+        "good_supply_add": {"grain": 10.0},
+        "good_demand_mult": {"medicine": 0.25},
+        "good_price_mult": {"fuel": -0.08, "bread": -0.06},
+    },
+    {"global_output_mult": -0.1, "good_supply_add": {"tools": 11.0}},
+]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_vector_engine_is_bit_identical(use_numpy: bool) -> None:
+    bundle = load_data()
+    engine = VectorMarketEngine(bundle, use_numpy=use_numpy)
+    reference_state = build_initial_state(bundle)
+    vector_state = build_initial_state(bundle)
+    # Reverse the market order to prove results do not depend on it.
+    vector_state.market = dict(reversed(list(vector_state.market.items())))
+
+    for turn in range(1, 61):
+        effects = EFFECTS[turn % len(EFFECTS)]
+        reference_state.market = simulate_market(
+            world=reference_state.world,
+            market=reference_state.market,
+            sectors=reference_state.sectors,
+            goods_meta=bundle.goods_by_id(),
+            economy_cfg=bundle.config["economy"],
+            population_needs=bundle.config["population_needs"],
+            effects=effects,
+            seed=31,
+            turn=turn,
+        )
+        vector_state.market = engine.simulate(
+            world=vector_state.world,
+            market=vector_state.market,
+            sectors=vector_state.sectors,
+            effects=effects,
+            seed=31,
+            turn=turn,
+        )
+        for good_id, expected in reference_state.market.items():
+            assert dataclasses.astuple(vector_state.market[good_id]) == dataclasses.astuple(expected)
+
+
+def test_engine_uses_vector_market_when_configured(tmp_path) -> None:
+    from shinon_os.app import ShinonApp
+    from shinon_os.sim.engine import SimulationEngine
+
+    snapshots = []
+    for mode in ("reference", "vector"):
+        app = ShinonApp(db_path=tmp_path / f"{mode}.sqlite3", log_dir=tmp_path / "logs")
+        try:
+            config = {**app.bundle.config, "economy": {**app.bundle.config["economy"], "market_engine": mode}}
+            bundle = dataclasses.replace(app.bundle, config=config)
+            app.engine = SimulationEngine(bundle=bundle, repo=app.repo, logger=app.logger)
+            app.engine.new_game(seed=8)
+            assert (app.engine._vector_market is not None) is (mode == "vector")
+            for policy_id, magnitude, target in [
+                ("SUBSIDY_SECTOR", 1.0, "agriculture"),
+                ("IMPORT_PROGRAM", 10.0, "grain"),
+                ("FUND_RESEARCH", 1.0, None),
+                ("TAX_ADJUST", 0.05, None),
+            ]:
+                assert app.engine.advance_turn(policy_id, magnitude, target).ok
+            snapshots.append(app.engine.snapshot())
+        finally:
+            app.shutdown()
+    assert snapshots[0] == snapshots[1]
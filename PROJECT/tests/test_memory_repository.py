@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from shinon_os.app import ShinonApp
+from shinon_os.persistence.memory import InMemoryStateRepository
+from shinon_os.sim.worldgen import build_initial_state, load_data
+
+COMMANDS = [
+    "enact SUBSIDY_SECTOR 1.0 agriculture",
+    "enact IMPORT_PROGRAM 10 grain",
+    "market",
+    "enact FUND_RESEARCH 1.0",
+    "enact TAX_ADJUST 0.05",
+    "enact SECURITY_BUDGET 1.0",
+]
+
+
+def _play(app: ShinonApp) -> dict[str, object]:
+    app.start_new_game(seed=11)
+    for cmd in COMMANDS:
+        app.process_command(cmd)
+    turn = app.current_turn()
+    return {
+        "snapshot": app.snapshot(),
+        "history": [(row["turn"], row["action"], row["summary"]) for row in app.repo.history(limit=50)],
+        "events": app.repo.events_since(0),
+        "unlocked": app.repo.unlocked_policy_rows(),
+        "metrics": app.repo.metrics_between(0, turn, ["inflation", "treasury", "grain.price"]),
+        "cashflow": app.repo.cashflow_between(0, turn),
+        "trailing": app.repo.trailing_cashflow(3, 1.0),
+    }
+
+
+def test_memory_backend_matches_sqlite(tmp_path: Path) -> None:
+    sqlite_app = ShinonApp(db_path=tmp_path / "disk.sqlite3", log_dir=tmp_path / "logs")
+    memory_app = ShinonApp(db_path=":memory:", log_dir=tmp_path / "logs")
+    try:
+        assert isinstance(memory_app.repo, InMemoryStateRepository)
+        assert _play(memory_app) == _play(sqlite_app)
+    finally:
+        sqlite_app.shutdown()
+        memory_app.shutdown()
+
+
+def test_explicit_backend_argument(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=tmp_path / "unused.sqlite3", log_dir=tmp_path / "logs", backend="memory")
+    try:
+        assert isinstance(app.repo, InMemoryStateRepository)
+        assert not (tmp_path / "unused.sqlite3").exists()
+    finally:
+        app.shutdown()
+    with pytest.raises(ValueError):
+        ShinonApp(db_path=":memory:", log_dir=tmp_path / "logs", backend="redis")
+
+
+def test_batch_rollback_restores_memory_tables() -> None:
+    bundle = load_data()
+    repo = InMemoryStateRepository()
+    repo.init_new_game(5, build_initial_state(bundle))
+    before = repo.load_state(bundle.sector_io_defs())
+    with pytest.raises(RuntimeError):
+        with repo.batch():
+            state = repo.load_state(bundle.sector_io_defs())
+            state.world.turn = 9
+            state.market["grain"].price *= 2
+            repo.save_state(state)
+            repo.append_history(9, "TAX_ADJUST", 0, {"net_cashflow": 5.0})
+            repo.set_bool_meta("collapse_active", True)
+            repo.replace_unlocked_policies({"TAX_ADJUST"}, 9)
+            raise RuntimeError("abort")
+    assert repo.load_state(bundle.sector_io_defs()) == before
+    assert repo.history() == []
+    assert repo.trailing_cashflow(3) == 0.0
+    assert repo.get_bool_meta("collapse_active") is False
+    assert len(repo.list_unlocked_policies()) == 3
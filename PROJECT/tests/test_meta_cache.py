@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from shinon_os.app import ShinonApp
+from shinon_os.persistence.repo import StateRepository
+
+
+def test_turns_do_not_query_meta_table(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=tmp_path / "meta.sqlite3", log_dir=tmp_path / "logs")
+    try:
+        app.start_new_game(seed=42)
+        statements: list[str] = []
+        app.repo.conn.set_trace_callback(statements.append)
+        for _ in range(3):
+            app.engine.advance_turn("TAX_ADJUST", 0.05, None)
+        app.repo.conn.set_trace_callback(None)
+        assert app.current_turn() >= 1
+        assert not [sql for sql in statements if "sqlite_master" in sql]
+        assert not [sql for sql in statements if "FROM meta" in sql]
+    finally:
+        app.shutdown()
+
+
+def test_meta_writes_skip_unchanged_and_survive_reopen(tmp_path: Path) -> None:
+    db_path = tmp_path / "meta.sqlite3"
+    repo = StateRepository(db_path)
+    try:
+        repo.set_int_meta("next_unlock_turn", 7)
+        before = repo.conn.total_changes
+        repo.set_int_meta("next_unlock_turn", 7)
+        assert repo.conn.total_changes == before
+    finally:
+        repo.close()
+    reopened = StateRepository(db_path)
+    try:
+        assert reopened.get_int_meta("next_unlock_turn", 0) == 7
+    finally:
+        reopened.close()
+
+
+def test_meta_cache_follows_batch_rollback(tmp_path: Path) -> None:
+    repo = StateRepository(tmp_path / "meta.sqlite3")
+    try:
+        repo.set_bool_meta("collapse_active", False)
+        with pytest.raises(RuntimeError):
+            with repo.batch():
+                repo.set_bool_meta("collapse_active", True)
+                assert repo.get_bool_meta("collapse_active")
+                raise RuntimeError("abort")
+        assert repo.get_bool_meta("collapse_active") is False
+    finally:
+        repo.close()
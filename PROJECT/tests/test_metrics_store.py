@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from shinon_os.app import ShinonApp
+
+
+def test_turn_metrics_match_history(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=tmp_path / "metrics.sqlite3", log_dir=tmp_path / "logs")
+    try:
+        app.start_new_game(seed=42)
+        app.process_command("enact TAX_ADJUST 0.05")
+        app.process_command("enact IMPORT_PROGRAM 10 grain")
+        turn = app.current_turn()
+        assert turn >= 1
+
+        repo = app.repo
+        columns = repo.metrics_between(0, turn, ["inflation", "treasury", "grain.price", "grain.supply"])
+        history = {row["turn"]: row["summary"] for row in repo.history(limit=turn)}
+        assert columns["turn"] == sorted(history)
+        for index, row_turn in enumerate(columns["turn"]):
+            assert round(columns["inflation"][index], 3) == history[row_turn]["inflation"]
+            assert columns["treasury"][index] == history[row_turn]["treasury"]
+        state = app.engine.load_state()
+        assert columns["grain.price"][-1] == state.market["grain"].price
+        assert columns["grain.supply"][-1] == state.market["grain"].supply
+
+        assert repo.metrics_between(turn + 1, turn + 5, ["inflation"]) == {"turn": [], "inflation": []}
+    finally:
+        app.shutdown()
+
+
+def test_metrics_between_rejects_unknown_fields(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=tmp_path / "metrics.sqlite3", log_dir=tmp_path / "logs")
+    try:
+        app.start_new_game(seed=42)
+        with pytest.raises(ValueError):
+            app.repo.metrics_between(0, 10, ["summary_json"])
+        with pytest.raises(ValueError):
+            app.repo.metrics_between(0, 10, ["grain.last_price"])
+    finally:
+        app.shutdown()
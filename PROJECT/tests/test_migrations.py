@@ -71,7 +71,7 @@ def test_migration_from_v1_to_v3(tmp_path: Path) -> None:
     try:
         migrated = repo.conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
         assert migrated is not None
-        assert migrated[0] == "3"
+        assert migrated[0] == "6"
 
         cols = [row[1] for row in repo.conn.execute("PRAGMA table_info(active_policies)").fetchall()]
         assert "state_json" in cols
@@ -84,3 +84,34 @@ def test_migration_from_v1_to_v3(tmp_path: Path) -> None:
         assert repo.get_language() == "de"
     finally:
         repo.close()
+
+
+def test_migration_v3_backfills_net_cashflow(tmp_path: Path) -> None:
+    db_path = tmp_path / "v3.sqlite3"
+    repo = StateRepository(db_path)
+    repo.close()
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """
+        DROP TABLE history;
+        CREATE TABLE history(
+            turn INTEGER PRIMARY KEY,
+            ts TEXT NOT NULL,
+            action TEXT NOT NULL,
+            cost INTEGER NOT NULL,
+            summary_json TEXT NOT NULL
+        );
+        INSERT INTO history VALUES (1, 'ts', 'TAX_ADJUST', 0, '{"net_cashflow": -12.5}');
+        INSERT INTO history VALUES (2, 'ts', 'TAX_ADJUST', 0, '{}');
+        UPDATE meta SET value = '3' WHERE key = 'schema_version';
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    repo = StateRepository(db_path)
+    try:
+        assert repo.get_int_meta("schema_version") == 6
+        assert repo.cashflow_between(0, 10) == [(1, -12.5), (2, 0.0)]
+    finally:
+        repo.close()
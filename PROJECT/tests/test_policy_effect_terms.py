@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shinon_os.sim.effects import TARGET_SLOT, EffectLayout, PolicyEffectAccumulator, compile_policy_effects
+from shinon_os.sim.model import PolicyRuntime
+from shinon_os.sim.synthetic import generate_pack
+from shinon_os.sim.worldgen import DataBundle, load_data
+
+
+def _dict_walk(runtimes: list[PolicyRuntime], bundle: DataBundle) -> dict[str, Any]:
+    """The per-turn aggregation the engine used before effects were compiled."""
+    effects: dict[str, Any] = {
+        "world_add": {},
+        "treasury_income": 0.0,
+        "treasury_upkeep": 0.0,
+        "global_output_mult": 0.0,
+        "sector_output_mult": {},
+        "sector_efficiency_add": {},
+        "good_supply_add": {},
+        "good_demand_mult": {},
+        "good_price_mult": {},
+        "import_cost": 0.0,
+        "shortage_unrest_factor_add": 0.0,
+    }
+
+    def add_map(target: dict[str, float], key: str, value: float) -> None:
+        target[key] = float(target.get(key, 0.0) + value)
+
+    for runtime in runtimes:
+        if runtime.remaining_ticks <= 0:
+            continue
+        raw = bundle.policies[runtime.policy_id].effects
+        magnitude = runtime.magnitude
+        target = runtime.state.get("target")
+        for key, value in raw.get("world_add", {}).items():
+            add_map(effects["world_add"], key, float(value) * magnitude)
+        effects["treasury_income"] += float(raw.get("treasury_income_per_turn", 0.0)) * magnitude
+        effects["treasury_upkeep"] += abs(magnitude) * float(raw.get("treasury_upkeep_per_turn", 0.0))
+        effects["global_output_mult"] += float(raw.get("global_output_mult", 0.0)) * magnitude
+        effects["shortage_unrest_factor_add"] += float(raw.get("shortage_unrest_factor_add", 0.0)) * magnitude
+        for section in ("sector_output_mult", "sector_efficiency_add", "good_supply_add", "good_demand_mult"):
+            for key, value in raw.get(section, {}).items():
+                resolved = target if key == "target" else key
+                if not resolved:
+                    continue
+                amount = float(value) * magnitude
+                add_map(effects[section], resolved, amount)
+                unit_cost = float(raw.get("import_cost_per_unit", 0.0))
+                if section == "good_supply_add" and unit_cost > 0:
+                    effects["import_cost"] += max(0.0, amount) * unit_cost
+    return effects
+
+
+def _random_runtimes(bundle: DataBundle, rng: random.Random) -> list[PolicyRuntime]:
+    goods = [good["id"] for good in bundle.goods]
+    sectors = [sector["id"] for sector in bundle.sectors]
+    runtimes = []
+    for policy_id, policy in bundle.policies.items():
+        target = {"good": rng.choice(goods), "sector": rng.choice(sectors)}.get(policy.target_type)
+        magnitude = rng.choice([-1.0, -0.35, 0.0, 0.1, 0.7, 1.0, 2.5])
+        runtimes.append(PolicyRuntime(policy_id, rng.choice([0, 1, 3]), 0, magnitude, {"target": target}))
+    rng.shuffle(runtimes)
+    return runtimes
+
+
+def _assert_bit_identical(got: dict[str, Any], expected: dict[str, Any]) -> None:
+    assert got.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, dict):
+            assert {k: v.hex() for k, v in got[key].items()} == {k: v.hex() for k, v in value.items()}, key
+        else:
+            assert got[key].hex() == value.hex(), key
+
+
+@pytest.mark.parametrize("pack", ["shipped", "synthetic"])
+def test_compiled_terms_match_the_dict_walk(tmp_path: Path, pack: str) -> None:
+    data_dir = generate_pack(tmp_path / "pack", goods=200, sectors=20) if pack == "synthetic" else None
+    bundle = load_data(data_dir=data_dir)
+    accumulator = PolicyEffectAccumulator(bundle.effect_layout)
+    rng = random.Random(3)
+    for _ in range(200):
+        runtimes = _random_runtimes(bundle, rng)
+        _assert_bit_identical(accumulator.collect(runtimes, bundle.policies), _dict_walk(runtimes, bundle))
+
+
+def test_buffer_is_cleared_between_turns() -> None:
+    bundle = load_data()
+    accumulator = PolicyEffectAccumulator(bundle.effect_layout)
+    busy = [PolicyRuntime("IMPORT_PROGRAM", 2, 0, 1.0, {"target": "fuel"})]
+    assert accumulator.collect(busy, bundle.policies)["good_supply_add"] == {"fuel": 1.0}
+    idle = accumulator.collect([], bundle.policies)
+    assert idle["good_supply_add"] == {}
+    assert idle["import_cost"] == 0.0
+
+
+def test_terms_are_compiled_at_load() -> None:
+    bundle = load_data()
+    terms = bundle.policies["SUBSIDY_SECTOR"].effect_terms
+    assert ("sector_output_mult", TARGET_SLOT, 0.12) in terms
+    layout = bundle.effect_layout
+    tax = dict(((channel, slot), value) for channel, slot, value in bundle.policies["TAX_ADJUST"].effect_terms)
+    assert tax[("world_add", layout.slot("world_add", "unrest"))] == 5.0
+
+
+def test_unknown_world_field_is_rejected() -> None:
+    layout = EffectLayout(["grain"], ["agriculture"])
+    with pytest.raises(ValueError, match="unknown id: morale"):
+        compile_policy_effects("BAD", {"world_add": {"morale": 1.0}}, layout)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from shinon_os.sim import regions
+from shinon_os.sim.model import MarketGood
+from shinon_os.sim.regions import RegionalWorld, TradeRoute, build_regions, reconcile_trade, ring_routes
+from shinon_os.sim.worldgen import load_data
+
+
+def _world(count: int = 6, cost: float = 0.2, capacity: float = 40.0) -> RegionalWorld:
+    bundle = load_data()
+    regions = build_regions(bundle, count, seed=7)
+    return RegionalWorld(bundle, regions, ring_routes([r.region_id for r in regions], cost, capacity), seed=7)
+
+
+def _prices(world: RegionalWorld) -> dict[tuple[str, str], float]:
+    return {
+        (region_id, good_id): good.price
+        for region_id, region in world.regions.items()
+        for good_id, good in region.state.market.items()
+    }
+
+
+def test_pool_choice_does_not_change_results() -> None:
+    serial = _world()
+    serial.run(8)
+    processes = _world()
+    processes.run(8, workers=2, pool="process")
+    auto = _world()
+    auto.run(8, workers=4)
+    assert _prices(serial) == _prices(processes) == _prices(auto)
+    assert serial.turn == 8
+
+
+def test_auto_pool_steps_serially_unless_processes_pay_off(monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_pool(*args, **kwargs):
+        raise AssertionError("auto started a process pool")
+
+    monkeypatch.setattr(regions, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(regions.os, "cpu_count", lambda: 8)
+    world = _world()
+    assert world.run(3, workers=4)[-1].turn == 3
+    assert not world._processes_pay_off(3, 4)
+    assert world._processes_pay_off(regions.PROCESS_MIN_REGION_TURNS, 4)
+    monkeypatch.setattr(regions, "PROCESS_MIN_REGION_TURNS", 1)
+    monkeypatch.setattr(regions.os, "cpu_count", lambda: 1)
+    assert world.run(2, workers=4)[-1].turn == 5
+
+
+def test_regions_diverge_and_trade() -> None:
+    world = _world()
+    steps = world.run(5)
+    assert len({round(region.state.market["grain"].price, 6) for region in world.regions.values()}) > 1
+    assert any(step.flows for step in steps)
+    for step in steps:
+        for flow in step.flows:
+            assert flow.units > 0
+            assert flow.transport_cost == pytest.approx(flow.units * 0.2)
+
+
+def test_expensive_routes_carry_nothing() -> None:
+    world = _world(cost=1e9)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        step = world.step(pool, chunks=4)
+    assert step.flows == []
+    assert step.transport_cost == {}
+
+
+def _markets() -> dict[str, dict[str, MarketGood]]:
+    return {
+        "a": {"grain": MarketGood("grain", supply=130.0, demand=100.0, price=2.0, last_price=2.0)},
+        "b": {"grain": MarketGood("grain", supply=50.0, demand=100.0, price=6.0, last_price=6.0)},
+        "c": {"grain": MarketGood("grain", supply=80.0, demand=100.0, price=6.0, last_price=6.0)},
+    }
+
+
+def test_reconcile_respects_surplus_and_shortfall() -> None:
+    markets = _markets()
+    routes = [TradeRoute("a", "b", 1.0, 1000.0), TradeRoute("a", "c", 1.0, 1000.0)]
+    flows = reconcile_trade(markets, routes)
+    shipped = {flow.dest: flow.units for flow in flows}
+    # 70 units asked, 30 available: shared pro rata.
+    assert sum(shipped.values()) == pytest.approx(30.0)
+    assert shipped["b"] / shipped["c"] == pytest.approx(50.0 / 20.0)
+    assert markets["a"]["grain"].supply == pytest.approx(100.0)
+
+    reversed_flows = reconcile_trade(_markets(), list(reversed(routes)))
+    assert sorted(reversed_flows, key=lambda flow: flow.dest) == flows
+
+
+def test_routes_are_validated() -> None:
+    bundle = load_data()
+    regions = build_regions(bundle, 2, seed=1)
+    with pytest.raises(ValueError, match="unknown region"):
+        RegionalWorld(bundle, regions, [TradeRoute("r000", "nowhere", 1.0, 1.0)], seed=1)
+    with pytest.raises(ValueError, match="non-negative"):
+        RegionalWorld(bundle, regions, [TradeRoute("r000", "r001", -1.0, 1.0)], seed=1)
+    with pytest.raises(ValueError, match="pool"):
+        RegionalWorld(bundle, regions, [], seed=1).run(1, workers=2, pool="thread")
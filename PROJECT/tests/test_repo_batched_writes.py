@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from shinon_os.persistence.repo import StateRepository
+from shinon_os.sim.worldgen import build_initial_state, load_data
+
+
+def _rows_written(repo: StateRepository, fn) -> int:
+    before = repo.conn.total_changes
+    fn()
+    return repo.conn.total_changes - before
+
+
+def test_save_state_writes_only_changed_rows(tmp_path: Path) -> None:
+    bundle = load_data()
+    repo = StateRepository(tmp_path / "batched.sqlite3")
+    try:
+        repo.init_new_game(42, build_initial_state(bundle))
+        state = repo.load_state(bundle.sector_io_defs())
+        assert _rows_written(repo, lambda: repo.save_state(state)) == 0
+
+        good_id = next(iter(state.market))
+        state.market[good_id].price += 1.5
+        assert _rows_written(repo, lambda: repo.save_state(state)) == 1
+        assert _rows_written(repo, lambda: repo.save_state(state)) == 0
+    finally:
+        repo.close()
+
+
+def test_diffed_saves_round_trip_policies(tmp_path: Path) -> None:
+    bundle = load_data()
+    db_path = tmp_path / "roundtrip.sqlite3"
+    repo = StateRepository(db_path)
+    try:
+        repo.init_new_game(42, build_initial_state(bundle))
+        state = repo.load_state(bundle.sector_io_defs())
+        state.world.turn = 3
+        state.active_policies = {}
+        repo.save_state(state)
+
+        fresh = StateRepository(db_path)
+        try:
+            loaded = fresh.load_state(bundle.sector_io_defs())
+        finally:
+            fresh.close()
+        assert loaded.world.turn == 3
+        assert loaded.market == state.market
+        assert loaded.sectors == state.sectors
+        assert loaded.active_policies == {}
+    finally:
+        repo.close()
+
+
+def test_rollback_forces_full_rewrite(tmp_path: Path) -> None:
+    bundle = load_data()
+    repo = StateRepository(tmp_path / "rollback.sqlite3")
+    try:
+        repo.init_new_game(42, build_initial_state(bundle))
+        state = repo.load_state(bundle.sector_io_defs())
+        good_id = next(iter(state.market))
+        try:
+            with repo.batch():
+                state.market[good_id].price += 2.0
+                repo.save_state(state)
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+        repo.save_state(state)
+        reloaded = repo.load_state(bundle.sector_io_defs())
+        assert reloaded.market[good_id].price == state.market[good_id].price
+    finally:
+        repo.close()
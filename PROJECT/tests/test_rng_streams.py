@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+
+from shinon_os.core.phrasebank import PHRASE_KEYS, pick_phrase
+from shinon_os.i18n import t
+from shinon_os.util.rng import CounterRng, bounded_noise, draw_total, noise_vector, seeded_rng, stream_rng
+
+GOODS = ["grain", "bread", "wood", "tools", "ore", "metal", "medicine", "fuel"]
+
+
+def test_compat_mode_reproduces_legacy_values() -> None:
+    for turn in range(1, 20):
+        expected = [bounded_noise(77, turn, good_id, amplitude=0.02) for good_id in GOODS]
+        assert noise_vector(77, turn, GOODS, amplitude=0.02, mode="compat") == expected
+
+    legacy = seeded_rng(77, "event", 3)
+    compat = stream_rng("compat", 77, "event", 3)
+    assert [compat.random(), compat.uniform(0.0, 5.0)] == [legacy.random(), legacy.uniform(0.0, 5.0)]
+
+
+def test_counter_mode_is_deterministic_and_bounded() -> None:
+    first = noise_vector(77, 12, GOODS, amplitude=0.01, mode="counter")
+    second = noise_vector(77, 12, GOODS, amplitude=0.01, mode="counter")
+    assert first == second
+    assert all(-0.01 <= value <= 0.01 for value in first)
+    assert len(set(first)) == len(GOODS)
+    assert noise_vector(77, 13, GOODS, amplitude=0.01, mode="counter") != first
+    assert first == [CounterRng(77, "noise", 12, good_id).uniform(-0.01, 0.01) for good_id in GOODS]
+
+
+def test_counter_rng_draws_are_independent_of_call_history() -> None:
+    rng = CounterRng(5, "event", 9)
+    draws = [rng.random() for _ in range(4)]
+    again = CounterRng(5, "event", 9)
+    assert [again.random() for _ in range(4)] == draws
+    assert all(0.0 <= value < 1.0 for value in draws)
+    assert CounterRng(5, "event", 10).random() != draws[0]
+    assert CounterRng(1, "phrase", 2).choice(["a", "b", "c"]) in {"a", "b", "c"}
+
+
+def test_phrases_follow_the_rng_mode() -> None:
+    for turn in range(1, 10):
+        legacy = t(seeded_rng(3, "phrase", turn, "GROWTH").choice(PHRASE_KEYS["GROWTH"]))
+        assert pick_phrase(3, turn, "GROWTH") == legacy
+        counter = t(CounterRng(3, "phrase", turn, "GROWTH").choice(PHRASE_KEYS["GROWTH"]))
+        assert pick_phrase(3, turn, "GROWTH", "counter") == counter
+
+
+def test_draw_counts_are_kept_per_thread() -> None:
+    before = draw_total()
+    counts: list[int] = []
+
+    def turn() -> None:
+        start = draw_total()
+        for index in range(200):
+            noise_vector(77, index, GOODS, mode="counter")
+        counts.append(draw_total() - start)
+
+    workers = [threading.Thread(target=turn) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert counts == [200 * len(GOODS)] * 4
+    assert draw_total() == before
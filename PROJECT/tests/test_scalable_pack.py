@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from shinon_os.core.blocks.interpret import parse_input
+from shinon_os.persistence.memory import InMemoryStateRepository
+from shinon_os.sim.engine import SimulationEngine
+from shinon_os.sim.synthetic import generate_pack
+from shinon_os.sim.worldgen import load_data
+from shinon_os.util.logging_setup import NullLogger
+from shinon_os.util.paths import package_data_dir
+
+
+def test_synthetic_pack_loads_and_plays(tmp_path: Path) -> None:
+    pack = generate_pack(tmp_path / "pack", goods=300, sectors=24, seed=5)
+    bundle = load_data(data_dir=pack)
+    assert len(bundle.goods) == 300
+    assert len(bundle.sectors) == 24
+    produced = {good_id for sector in bundle.sectors for good_id in sector["outputs"]}
+    assert produced == bundle.good_id_set
+
+    engine = SimulationEngine(repo=InMemoryStateRepository(), bundle=bundle, logger=NullLogger())
+    engine.new_game(seed=5)
+    engine.repo.unlock_policy("IMPORT_PROGRAM", 0, "test")
+    engine.invalidate()
+    result = engine.advance_turn("IMPORT_PROGRAM", None, "good_0250")
+    assert result.ok, result.message
+    state = engine.load_state()
+    assert len(state.market) == 300
+    assert state.active_policies["IMPORT_PROGRAM"].state["target"] == "good_0250"
+
+
+def test_synthetic_pack_is_deterministic(tmp_path: Path) -> None:
+    first = generate_pack(tmp_path / "a", goods=40, sectors=6, seed=9)
+    second = generate_pack(tmp_path / "b", goods=40, sectors=6, seed=9)
+    for name in ("goods.json", "sectors.json", "config.json"):
+        assert (first / name).read_bytes() == (second / name).read_bytes()
+
+
+def test_parser_targets_come_from_the_bundle(tmp_path: Path) -> None:
+    bundle = load_data(data_dir=generate_pack(tmp_path / "pack", goods=120, sectors=10))
+    target_types = {policy_id: policy.target_type for policy_id, policy in bundle.policies.items()}
+
+    intent = parse_input(
+        "import good_0099 please",
+        "dashboard",
+        policy_target_types=target_types,
+        sector_ids=bundle.sector_id_set,
+        good_ids=bundle.good_id_set,
+    )
+    assert intent.args["target"] == "good_0099"
+    assert intent.auto_execute
+
+    intent = parse_input(
+        "subsidy for sector_007",
+        "dashboard",
+        target_types,
+        sector_ids=bundle.sector_id_set,
+        good_ids=bundle.good_id_set,
+    )
+    assert intent.args["target"] == "sector_007"
+
+    missing = parse_input(
+        "import good_9999",
+        "dashboard",
+        target_types,
+        sector_ids=bundle.sector_id_set,
+        good_ids=bundle.good_id_set,
+    )
+    assert missing.missing_params == ["target"]
+    assert not missing.auto_execute
+
+    # Without the bundle's ids the parser cannot match targets, so they are required.
+    with pytest.raises(TypeError):
+        parse_input("import good_0099", "dashboard", target_types)  # type: ignore[call-arg]
+
+
+def _pack_copy(tmp_path: Path) -> Path:
+    root = tmp_path / "pack"
+    shutil.copytree(package_data_dir(), root)
+    return root
+
+
+def _rewrite(path: Path, edit) -> None:
+    rows = json.loads(path.read_text(encoding="utf-8"))
+    edit(rows)
+    path.write_text(json.dumps(rows), encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    ("name", "edit", "message"),
+    [
+        ("sectors.json", lambda rows: rows[0]["inputs"].update({"unobtainium": 1.0}), "unknown id: unobtainium"),
+        ("goods.json", lambda rows: rows.append(dict(rows[0])), "Duplicate good id: grain"),
+        ("goods.json", lambda rows: rows[0].update({"id": "Grain Wheat"}), "lowercase token"),
+        ("events.json", lambda rows: rows[0]["effects"].update({"good_supply_mult": {"spice": 0.1}}), "unknown id: spice"),
+        ("config.json", lambda cfg: cfg["population_needs"].update({"spice": 0.1}), "unknown id: spice"),
+    ],
+)
+def test_dangling_references_are_rejected(tmp_path: Path, name: str, edit, message: str) -> None:
+    root = _pack_copy(tmp_path)
+    _rewrite(root / name, edit)
+    with pytest.raises(ValueError, match=message):
+        load_data(data_dir=root)
+
+
+def test_small_pack_without_shipped_sectors_is_accepted(tmp_path: Path) -> None:
+    root = _pack_copy(tmp_path)
+    _rewrite(root / "sectors.json", lambda rows: rows.pop())  # drop "services"
+    _rewrite(root / "events.json", lambda rows: [row["effects"].get("sector_efficiency_mult", {}).pop("services", None) for row in rows])
+    bundle = load_data(data_dir=root)
+    assert bundle.sector_id_set == {"agriculture", "industry"}
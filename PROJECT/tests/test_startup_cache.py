@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from shinon_os.sim.worldgen import bundle_cache_key, load_data
+from shinon_os.util.paths import package_data_dir
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _copy_pack(tmp_path: Path) -> Path:
+    root = tmp_path / "data"
+    shutil.copytree(package_data_dir(), root)
+    return root
+
+
+def test_cached_bundle_matches_parsed_bundle(tmp_path: Path) -> None:
+    cache = tmp_path / "cache"
+    parsed = load_data()
+    first = load_data(cache_dir=cache)
+    assert len(list(cache.glob("bundle-*.pickle"))) == 1
+    cached = load_data(cache_dir=cache)
+    assert cached == parsed == first
+    assert cached.goods_index == parsed.goods_index
+
+
+def test_cache_key_follows_pack_content_and_overrides(tmp_path: Path) -> None:
+    root = _copy_pack(tmp_path)
+    cache = tmp_path / "cache"
+    key = bundle_cache_key(root)
+    assert bundle_cache_key(root, {"economy.rng_mode": "fast"}) != key
+    load_data(data_dir=root, cache_dir=cache)
+
+    config = json.loads((root / "config.json").read_text(encoding="utf-8"))
+    config["world"]["treasury"] = int(config["world"]["treasury"]) + 1
+    (root / "config.json").write_text(json.dumps(config), encoding="utf-8")
+    assert bundle_cache_key(root) != key
+    bundle = load_data(data_dir=root, cache_dir=cache)
+    assert bundle.config["world"]["treasury"] == config["world"]["treasury"]
+    assert [path.name for path in cache.glob("bundle-*.pickle")] == [f"bundle-{bundle_cache_key(root)}.pickle"]
+
+
+def test_corrupt_cache_file_falls_back_to_parsing(tmp_path: Path) -> None:
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    (cache / f"bundle-{bundle_cache_key(package_data_dir())}.pickle").write_bytes(b"not a pickle")
+    assert load_data(cache_dir=cache) == load_data()
+
+
+def test_app_service_import_skips_optional_heavy_modules() -> None:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH", "")]))
+    probe = "import sys, shinon_os.app_service; print(sorted(m for m in ('numpy', 'textual') if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from shinon_os.app import ShinonApp
+from shinon_os.persistence.repo import StateRepository
+from shinon_os.sim.worldgen import load_data
+
+
+def test_commands_reuse_cached_state(monkeypatch, tmp_path: Path) -> None:
+    app = ShinonApp(db_path=tmp_path / "cache.sqlite3", log_dir=tmp_path / "logs")
+    try:
+        app.start_new_game(seed=42)
+        loads: list[int] = []
+        original = app.repo.load_state
+
+        def counting_load(sector_io_defs):
+            loads.append(1)
+            return original(sector_io_defs)
+
+        monkeypatch.setattr(app.repo, "load_state", counting_load)
+        for cmd in ["dashboard", "market", "enact TAX_ADJUST 0.05", "policies", "history"]:
+            app.process_command(cmd)
+        assert app.current_turn() == 1
+        assert len(loads) == 1
+        assert app.engine.load_state() is app.engine.load_state()
+    finally:
+        app.shutdown()
+
+
+def test_write_behind_flushes_on_demand(tmp_path: Path) -> None:
+    db_path = tmp_path / "behind.sqlite3"
+    app = ShinonApp(db_path=db_path, log_dir=tmp_path / "logs")
+    try:
+        app.start_new_game(seed=42)
+        app.engine.autoflush = False
+        result = app.engine.advance_turn("TAX_ADJUST", 0.05, None)
+        assert result.ok
+        assert app.engine.dirty
+
+        bundle = load_data()
+        other = StateRepository(db_path)
+        try:
+            assert other.load_state(bundle.sector_io_defs()).world.turn == 0
+            app.engine.flush()
+            assert not app.engine.dirty
+            assert other.load_state(bundle.sector_io_defs()).world.turn == 1
+        finally:
+            other.close()
+    finally:
+        app.shutdown()
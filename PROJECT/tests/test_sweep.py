@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from shinon_os.app import run_simulate
+from shinon_os.sim.sweep import _bundle, build_grid, parse_seeds, run_sweep
+from shinon_os.sim.worldgen import load_data
+
+ACTIONS = [
+    {"policy_id": "SUBSIDY_SECTOR", "magnitude": 1.0, "target": "agriculture"},
+    {"policy_id": "IMPORT_PROGRAM", "magnitude": 10.0, "target": "grain"},
+    {"policy_id": "TAX_ADJUST", "magnitude": 0.05},
+    {"policy_id": "NOT_A_POLICY"},
+]
+
+
+def _script(tmp_path: Path) -> Path:
+    path = tmp_path / "actions.jsonl"
+    path.write_text("\n".join(json.dumps(row) for row in ACTIONS) + "\n", encoding="utf-8")
+    return path
+
+
+def test_parse_seeds_and_grid() -> None:
+    assert parse_seeds("1-3,7") == [1, 2, 3, 7]
+    with pytest.raises(ValueError):
+        parse_seeds("5-2")
+    grid = build_grid([1, 2], ["a.jsonl"], [{}, {"economy.rng_mode": "counter"}])
+    assert [(s.seed, s.overrides) for s in grid] == [
+        (1, ()),
+        (2, ()),
+        (1, (("economy.rng_mode", "counter"),)),
+        (2, (("economy.rng_mode", "counter"),)),
+    ]
+
+
+def test_sweep_matches_single_replay_and_parallel_run(tmp_path: Path) -> None:
+    script = _script(tmp_path)
+    scenarios = build_grid([3, 4], [script], [{}, {"economy.rng_mode": "counter"}])
+    serial = run_sweep(scenarios, out=tmp_path / "serial.jsonl", workers=1, emit=lambda _: None)
+    parallel = run_sweep(scenarios, out=tmp_path / "parallel.jsonl", workers=2, emit=lambda _: None)
+    assert serial["scenarios"] == parallel["scenarios"] == 4
+    assert serial["scenario_collapse_rate"] == parallel["scenario_collapse_rate"]
+    assert "collapse_rate" not in serial
+
+    rows = [json.loads(line) for line in (tmp_path / "serial.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert rows == [json.loads(line) for line in (tmp_path / "parallel.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert rows[0]["applied"] == 3 and rows[0]["rejected"] == 1
+    assert rows[0]["inflation_p10"] <= rows[0]["inflation_p50"] <= rows[0]["inflation_p90"]
+
+    replay = run_simulate(
+        script=script,
+        db_path=tmp_path / "replay.sqlite3",
+        log_dir=tmp_path / "logs",
+        seed=3,
+        emit=lambda _: None,
+    )
+    assert rows[0]["snapshot"] == replay["snapshot"]
+
+
+def test_csv_sink_flattens_snapshot(tmp_path: Path) -> None:
+    script = _script(tmp_path)
+    run_sweep(build_grid([1], [script]), out=tmp_path / "out.csv", emit=lambda _: None)
+    with (tmp_path / "out.csv").open(encoding="utf-8", newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    assert len(rows) == 1
+    assert "snapshot.world.treasury" in rows[0]
+    assert "snapshot.prices.grain" in rows[0]
+
+
+def test_failing_scenario_becomes_an_error_row(tmp_path: Path) -> None:
+    broken = tmp_path / "broken.jsonl"
+    broken.write_text(json.dumps(ACTIONS[0]) + "\n{not json\n", encoding="utf-8")
+    scenarios = build_grid([1, 2], [broken, _script(tmp_path)])
+    summary = run_sweep(scenarios, out=tmp_path / "out.csv", workers=2, emit=lambda _: None)
+    assert summary["scenarios"] == 4 and summary["errors"] == 2
+
+    with (tmp_path / "out.csv").open(encoding="utf-8", newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    assert ["invalid JSON" in row["error"] for row in rows] == [True, True, False, False]
+    assert rows[0]["applied"] == "" and rows[2]["applied"] == "3"
+    assert "snapshot.world.treasury" in rows[0]
+
+
+def test_bundle_is_parsed_once_per_override_set() -> None:
+    overrides = (("economy.rng_mode", "counter"),)
+    assert _bundle(None, overrides) is _bundle(None, overrides)
+    assert _bundle(None, ()) is not _bundle(None, overrides)
+
+
+def test_unknown_override_key_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        load_data(config_overrides={"economy.not_a_key": 1})
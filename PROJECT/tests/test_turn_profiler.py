@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from shinon_os.__main__ import main
+from shinon_os.app import ShinonApp
+from shinon_os.sim.batch import ScriptedAction
+from shinon_os.util.profiling import TURN_PHASES, NullProfiler, TurnProfiler
+
+
+def _play(app: ShinonApp, turns: int) -> None:
+    app.engine.advance_turns([ScriptedAction("TAX_ADJUST", 0.0, None)] * turns)
+
+
+def test_phases_and_counters_per_turn(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=tmp_path / "p.sqlite3", log_dir=tmp_path / "logs", bundle_cache=False)
+    try:
+        app.start_new_game(seed=3)
+        profiler = app.engine.enable_profiling()
+        assert app.engine.enable_profiling() is profiler
+        app.engine.advance_turn("TAX_ADJUST", 0.0, None)
+        _play(app, 4)
+        assert len(profiler.turns) == 5
+        first = profiler.turns[0].as_dict()
+        assert first["ok"] and first["turn"] == 1
+        assert {"validate", "market", "events", "persist", "commit"} <= set(first["phases"])
+        assert first["counters"]["sql_statements"] > 0
+        assert first["counters"]["rows_written"] > 0
+        assert first["counters"]["rng_draws"] >= len(app.bundle.goods) + 1
+        summary = profiler.summary()
+        assert summary["turns"] == 5
+        assert list(summary["phases"]) == [name for name in TURN_PHASES if name in summary["phases"]]
+        # Rejected turns (policy cooldown) stop after validation.
+        assert summary["phases"]["metrics"]["calls"] == sum(turn.ok for turn in profiler.turns)
+    finally:
+        app.shutdown()
+    assert isinstance(app.engine.profiler, NullProfiler)
+
+
+def test_memory_backend_counts_rows_but_no_sql(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=":memory:", log_dir=tmp_path / "logs", bundle_cache=False)
+    try:
+        app.start_new_game(seed=3)
+        profiler = app.engine.enable_profiling()
+        _play(app, 2)
+        counters = profiler.turns[0].counters
+        assert counters["sql_statements"] == 0
+        assert counters["rows_written"] > 0
+    finally:
+        app.shutdown()
+
+
+def test_exports_jsonl_and_chrome_trace(tmp_path: Path) -> None:
+    profiler = TurnProfiler()
+    ticks = iter(range(0, 10_000_000, 1000))
+    profiler._clock = lambda: next(ticks)
+    for turn in (1, 2):
+        profiler.begin_turn()
+        profiler.split("market")
+        profiler.split("persist")
+        profiler.end_turn(turn, True)
+
+    assert profiler.export(tmp_path / "turns.jsonl") == "jsonl"
+    rows = [json.loads(line) for line in (tmp_path / "turns.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [row["turn"] for row in rows] == [1, 2]
+    assert rows[0]["phases"] == {"market": 0.001, "persist": 0.001}
+
+    assert profiler.export(tmp_path / "trace.json") == "chrome"
+    trace = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [event["name"] for event in spans[:3]] == ["turn", "market", "persist"]
+    assert spans[1]["ts"] == 0.0 and spans[1]["dur"] == 1.0
+    assert any(event["ph"] == "C" for event in trace["traceEvents"])
+
+
+def test_profile_console_command(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=":memory:", log_dir=tmp_path / "logs", bundle_cache=False)
+    try:
+        app.start_new_game(seed=5)
+        assert "profile on" in app.process_command("profile").output
+        app.process_command("profile on")
+        _play(app, 2)
+        shown = app.process_command("profile").output
+        assert "market" in shown and "rng_draws=" in shown
+        out = tmp_path / "console.json"
+        response = app.process_command(f"profile export {out}")
+        assert response.turn_advanced is False
+        assert "traceEvents" in json.loads(out.read_text(encoding="utf-8"))
+        app.process_command("profile off")
+        assert isinstance(app.engine.profiler, NullProfiler)
+    finally:
+        app.shutdown()
+
+
+def test_cli_profile_flag_writes_file(tmp_path: Path, capsys) -> None:
+    script = tmp_path / "actions.jsonl"
+    script.write_text('{"policy_id": "TAX_ADJUST", "magnitude": 0.0}\n' * 3, encoding="utf-8")
+    out = tmp_path / "profile.jsonl"
+    main(["--profile", str(out), "simulate", "--script", str(script), "--db", str(tmp_path / "s.sqlite3"),
+          "--log-dir", str(tmp_path / "logs"), "--seed", "1"])
+    report = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert report["profile"]["turns"] == 3
+    assert len(out.read_text(encoding="utf-8").splitlines()) == 3
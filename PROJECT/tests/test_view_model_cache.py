@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from shinon_os.app import ShinonApp
+from shinon_os.app_service import AppOptions, AppService
+from shinon_os.i18n import set_lang
+
+
+def _service(tmp_path: Path) -> AppService:
+    app = ShinonApp(db_path=tmp_path / "vm.sqlite3", log_dir=tmp_path / "logs")
+    app.start_new_game(seed=42)
+    return AppService(AppOptions(no_anim=True), app=app)
+
+
+def test_views_reuse_models_until_turn_advances(tmp_path: Path) -> None:
+    service = _service(tmp_path)
+    try:
+        market = service.get_view("market").view_model
+        assert service.get_view("market").view_model is market
+        assert service.handle_input("market").view_model is market
+
+        response = service.handle_input("enact TAX_ADJUST 0.05")
+        assert response.turn_advanced
+        fresh = service.get_view("market").view_model
+        assert fresh is not market
+        state = service.app.engine.load_state()
+        assert [row.price for row in fresh.rows] == [item.price for _, item in sorted(state.market.items())]
+        assert service.get_view("history").view_model.rows[0].turn == 1
+    finally:
+        service.shutdown()
+
+
+def test_language_switch_rebuilds_models(tmp_path: Path) -> None:
+    service = _service(tmp_path)
+    try:
+        set_lang("de")
+        policies = service.get_view("policies").view_model
+        set_lang("en")
+        assert service.get_view("policies").view_model is not policies
+    finally:
+        set_lang("de")
+        service.shutdown()
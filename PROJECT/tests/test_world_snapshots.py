@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import astuple
+from pathlib import Path
+
+import pytest
+
+from shinon_os.app import ShinonApp
+from shinon_os.sim.economy import simulate_market
+from shinon_os.sim.market_vector import VectorMarketEngine
+from shinon_os.sim.worldgen import build_initial_state, load_data
+
+
+def test_world_snapshot_is_detached_and_immutable() -> None:
+    world = build_initial_state(load_data()).world
+    snap = world.snapshot()
+    assert tuple(snap) == astuple(world)
+    world.treasury += 100
+    assert snap.treasury == world.treasury - 100
+    with pytest.raises(AttributeError):
+        snap.treasury = 0  # type: ignore[misc]
+
+
+def test_market_engines_leave_input_untouched() -> None:
+    bundle = load_data()
+    state = build_initial_state(bundle)
+    before = {good_id: astuple(item) for good_id, item in state.market.items()}
+    effects = {"good_supply_add": {"grain": 50.0}, "good_demand_mult": {"grain": 0.2}}
+    kwargs = dict(world=state.world, market=state.market, sectors=state.sectors, effects=effects, seed=3, turn=1)
+    updated = simulate_market(
+        goods_meta=bundle.goods_by_id(),
+        economy_cfg=bundle.config["economy"],
+        population_needs=bundle.config["population_needs"],
+        **kwargs,
+    )
+    vectored = VectorMarketEngine(bundle).simulate(**kwargs)
+    assert {good_id: astuple(item) for good_id, item in state.market.items()} == before
+    assert all(updated[good_id] is not state.market[good_id] for good_id in state.market)
+    assert all(vectored[good_id] is not state.market[good_id] for good_id in state.market)
+
+
+def test_sim_result_carries_snapshots(tmp_path: Path) -> None:
+    app = ShinonApp(db_path=tmp_path / "snap.sqlite3", log_dir=tmp_path / "logs")
+    try:
+        app.start_new_game(seed=42)
+        result = app.engine.advance_turn("TAX_ADJUST", 0.05, None)
+        assert result.ok
+        assert result.world_after.turn == result.world_before.turn + 1
+        assert result.world_after == app.engine.load_state().world.snapshot()
+    finally:
+        app.shutdown()